@@ -0,0 +1,58 @@
+"""
+Matryoshka recall benchmark on markdown files (default: exports/*.md)
+
+Chunks the files with the configured chunker, embeds the chunks with the
+configured dense model and uses each chunk's first sentence as a query,
+then reports recall@10 of truncated and two-stage search per dimension.
+
+Usage:
+    python -m benchmarks.matryoshka_recall [file.md ...]
+"""
+
+import logging
+import sys
+import uuid
+from pathlib import Path
+
+from internal.config import load_config
+from internal.chunkers import ChunkerFactory
+from internal.embedding.dense_embedder import DenseEmbedder
+from internal.embedding.matryoshka import recall_benchmark
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv):
+    config = load_config()
+    paths = [Path(p) for p in argv] or sorted(Path("exports").glob("*.md"))
+    chunker = ChunkerFactory.create(format='markdown', config=config)
+    texts = [
+        chunk.content
+        for path in paths
+        for chunk in chunker.chunk_document(path.read_text(encoding="utf-8"), str(uuid.uuid4()))
+    ]
+    queries = [text.split(". ")[0][:300] for text in texts]
+    
+    embedder = DenseEmbedder(config.embedding.dense)
+    corpus_vectors = embedder.encode(texts)
+    query_vectors = embedder.encode(queries)
+    full_dim = corpus_vectors.shape[1]
+    dims = [d for d in (64, 128, 256, 384, 512) if d < full_dim]
+    
+    logger.info(
+        f"{len(texts)} chunks from {len(paths)} files, "
+        f"model {config.embedding.dense.model_name} ({full_dim} dims)"
+    )
+    logger.info(f"{'dim':>5} {'recall@10 truncated':>20} {'recall@10 two-stage':>20} {'index bytes':>12} {'ms/query':>9}")
+    for row in recall_benchmark(corpus_vectors, query_vectors, dims):
+        logger.info(
+            f"{row['dim']:>5} {row['recall_truncated']:>20.3f} {row['recall_two_stage']:>20.3f} "
+            f"{row['index_bytes_per_vector']:>12} {row['ms_per_query']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    from internal.logger import setup_logging
+    
+    setup_logging("INFO")
+    main(sys.argv[1:])
@@ -6,14 +6,22 @@ Provides endpoints for PDF extraction and markdown file processing,
 including conversion to embeddings and storage in Qdrant.
 """
 
+import asyncio
+import json
 import logging
 import tempfile
 import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request
+from typing import TYPE_CHECKING, List, Optional
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
-from internal.processing.document_extractor import convert_pdf_to_markdown
+from internal.processing.document_extractor import (
+    convert_pdf_to_markdown,
+    convert_urls_to_markdown_async,
+)
+from internal.processing.pdf_jobs import JobStatus, PdfJobManager
 
 if TYPE_CHECKING:
     from internal.server.server import ServerState
@@ -37,6 +45,26 @@ async def extract_pdf(request: Request, file: UploadFile = File(...)):
     if not file.filename or not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
     
+    manager = _pdf_job_manager(request, required=False)
+    if manager is not None:
+        # Convert on the worker pool instead of blocking the event loop
+        try:
+            job = await manager.submit(file.filename, await file.read())
+        except RuntimeError as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        job = await manager.wait(job.id)
+        if job.status != JobStatus.SUCCEEDED:
+            logger.error(f"Failed to extract PDF: {job.error or job.status.value}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to extract PDF: {job.error or job.status.value}"
+            )
+        return {
+            "filename": file.filename,
+            "markdown": job.markdown,
+            "char_count": len(job.markdown)
+        }
+    
     temp_dir = tempfile.mkdtemp()
     temp_path = Path(temp_dir) / file.filename
     
@@ -44,7 +72,7 @@ async def extract_pdf(request: Request, file: UploadFile = File(...)):
         with open(temp_path, 'wb') as f:
             shutil.copyfileobj(file.file, f)
         
-        markdown_content = convert_pdf_to_markdown(temp_path)
+        markdown_content = await asyncio.to_thread(convert_pdf_to_markdown, temp_path)
         
         return {
             "filename": file.filename,
@@ -58,24 +86,287 @@ async def extract_pdf(request: Request, file: UploadFile = File(...)):
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+class UrlExtractRequest(BaseModel):
+    """Request model for URL extraction"""
+    urls: List[str] = Field(..., min_length=1)
+    timeout: int = Field(30, gt=0)
+    fast_path: bool = True
+
+
+@router.post("/documents/extract-urls")
+async def extract_urls(request: Request, extract_request: UrlExtractRequest):
+    """
+    Fetch URLs and convert them to markdown, streaming results as NDJSON
+    
+    Uses the server's shared fetcher, so connections and the warm
+    Playwright browser pool are reused across requests.
+    
+    Returns:
+        application/x-ndjson stream, one object per URL in the order
+        conversions finish; failed URLs carry an error and empty markdown
+    """
+    state = getattr(request.app.state, 'server_state', None)
+    fetcher = state.url_fetcher if state is not None else None
+    if fetcher is None:
+        raise HTTPException(status_code=503, detail="URL fetcher not initialized")
+    
+    async def lines():
+        async for result in convert_urls_to_markdown_async(
+            extract_request.urls,
+            timeout=extract_request.timeout,
+            fast_path=extract_request.fast_path,
+            fetcher=fetcher,
+        ):
+            yield json.dumps({
+                "url": result.url,
+                "index": result.index,
+                "markdown": result.markdown,
+                "converter": result.converter,
+                "error": result.error,
+                "seconds": round(result.seconds, 3),
+            }) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _pdf_job_manager(request: Request, required: bool = True) -> Optional[PdfJobManager]:
+    """The server's PdfJobManager; raises 503 if required and unavailable"""
+    state = getattr(request.app.state, 'server_state', None)
+    manager = state.pdf_jobs if state is not None else None
+    if manager is None and required:
+        raise HTTPException(
+            status_code=503,
+            detail="PDF job manager not initialized"
+        )
+    return manager
+
+
+@router.post("/documents/extract-pdf/jobs", status_code=202)
+async def submit_pdf_jobs(request: Request, files: List[UploadFile] = File(...)):
+    """
+    Queue one or more PDFs for conversion to markdown
+    
+    Returns immediately; conversions run on the worker pool and continue
+    if the client disconnects.
+    
+    Args:
+        files: PDF files to convert
+        
+    Returns:
+        One job (job_id, status) per file, in upload order
+    """
+    manager = _pdf_job_manager(request)
+    for file in files:
+        if not file.filename or not file.filename.lower().endswith('.pdf'):
+            raise HTTPException(status_code=400, detail=f"File must be a PDF: {file.filename}")
+    
+    jobs = []
+    for file in files:
+        try:
+            job = await manager.submit(file.filename, await file.read())
+        except RuntimeError as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        jobs.append(job.to_dict())
+    return {"jobs": jobs}
+
+
+@router.get("/documents/extract-pdf/jobs")
+async def list_pdf_jobs(request: Request):
+    """List known PDF jobs (finished ones are kept for result_ttl_seconds)"""
+    manager = _pdf_job_manager(request)
+    return {"jobs": [job.to_dict() for job in manager.list_jobs()]}
+
+
+@router.get("/documents/extract-pdf/jobs/stream")
+async def stream_pdf_jobs(request: Request, job_ids: List[str] = Query(...)):
+    """
+    Stream results as NDJSON, one line per job in the order jobs finish
+    
+    Args:
+        job_ids: Jobs to wait for (repeat the parameter for several)
+        
+    Returns:
+        application/x-ndjson stream of job objects including markdown
+    """
+    manager = _pdf_job_manager(request)
+    unknown = [job_id for job_id in job_ids if manager.get(job_id) is None]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Unknown job IDs: {unknown}")
+    
+    async def lines():
+        async for job in manager.stream(job_ids):
+            yield json.dumps(job.to_dict(include_markdown=True)) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/documents/extract-pdf/jobs/{job_id}")
+async def get_pdf_job(request: Request, job_id: str):
+    """Status of one PDF job"""
+    job = _pdf_job_manager(request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job.to_dict()
+
+
+@router.get("/documents/extract-pdf/jobs/{job_id}/result")
+async def get_pdf_job_result(request: Request, job_id: str):
+    """
+    Markdown of a finished PDF job
+    
+    Returns 409 while the job is queued or running and 422 if it failed,
+    timed out or was cancelled.
+    """
+    job = _pdf_job_manager(request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    if not job.finished:
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' is {job.status.value}")
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Job '{job_id}' {job.status.value}: {job.error or ''}".rstrip(": ")
+        )
+    return {
+        "filename": job.filename,
+        "markdown": job.markdown,
+        "char_count": len(job.markdown)
+    }
+
+
+@router.get("/documents/extract-pdf/jobs/{job_id}/pages")
+async def stream_pdf_job_pages(request: Request, job_id: str):
+    """
+    Stream a job's markdown as NDJSON, one line per page window in page order
+    
+    Each window is sent as soon as it and all windows before it are
+    converted; concatenating the markdown fields gives the full document.
+    The last line is the job object with its final status.
+    
+    Returns:
+        application/x-ndjson stream of window objects, then the job
+    """
+    manager = _pdf_job_manager(request)
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    
+    async def lines():
+        async for window in manager.windows(job_id):
+            yield json.dumps(window.to_dict(include_markdown=True)) + "\n"
+        await job.done.wait()
+        yield json.dumps(job.to_dict()) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/documents/extract-pdf/jobs/{job_id}/ingest")
+async def ingest_pdf_job(
+    request: Request,
+    job_id: str,
+    collection_name: str = "documents",
+    document_id: Optional[str] = None,
+    append: Optional[bool] = None
+):
+    """
+    Chunk, embed and store a PDF job's markdown while it converts
+    
+    Page windows enter the streaming ingestion pipeline in page order as
+    they finish, each under the headings of the sections it continues.
+    If the job fails part-way, ingestion stops with 422; points already
+    stored for its earlier windows are kept and stale points of an
+    earlier ingest are not deleted.
+    
+    Args:
+        job_id: Queued, running or succeeded PDF job
+        collection_name: Target Qdrant collection name
+        document_id: Stable document ID (defaults to the job ID)
+        append: Add to an existing collection (defaults to config)
+        
+    Returns:
+        Same response as /documents/upload
+    """
+    manager = _pdf_job_manager(request)
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    if job.finished and job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(status_code=422, detail=f"Job '{job_id}' is {job.status.value}")
+    
+    from internal.server.server import ServerState
+    state: ServerState = request.app.state.server_state
+    if not state.document_processor:
+        raise HTTPException(
+            status_code=503,
+            detail="Document processor not initialized"
+        )
+    
+    async def parts():
+        async for window in manager.windows(job_id):
+            if window.standalone:
+                yield window.standalone
+        await job.done.wait()
+        if job.status != JobStatus.SUCCEEDED:
+            # Abort the pipeline before it deletes points of an earlier ingest
+            raise RuntimeError(f"Job '{job_id}' {job.status.value}: {job.error or ''}".rstrip(": "))
+    
+    try:
+        result = await state.document_processor.process_markdown_file(
+            markdown_content=parts(),
+            collection_name=collection_name,
+            document_id=document_id or job_id,
+            append=append
+        )
+    except ValueError as e:
+        status_code = 409 if "already exists" in str(e) else 400
+        raise HTTPException(status_code=status_code, detail=str(e))
+    except Exception as e:
+        if job.finished and job.status != JobStatus.SUCCEEDED:
+            raise HTTPException(status_code=422, detail=str(e))
+        logger.error(f"Failed to ingest PDF job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to ingest PDF job: {str(e)}")
+    return result
+
+
+@router.delete("/documents/extract-pdf/jobs/{job_id}")
+async def cancel_pdf_job(request: Request, job_id: str):
+    """Cancel a queued or running PDF job; a running conversion is killed"""
+    manager = _pdf_job_manager(request)
+    job = manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    if job.task is not None and not job.finished:
+        await asyncio.wait({job.task})
+    return job.to_dict()
+
+
 @router.post("/documents/upload")
 async def upload_document(
     request: Request,
     file: UploadFile = File(...),
-    collection_name: str = "documents"
+    collection_name: str = "documents",
+    streaming: Optional[bool] = None,
+    document_id: Optional[str] = None,
+    append: Optional[bool] = None
 ):
     """
     Upload markdown file, chunk, embed, and store in Qdrant
     
     Creates a new collection for each document. Returns error if collection
-    already exists.
+    already exists, unless document_id is given: then the document's points
+    in the existing collection are upserted and stale ones deleted, so
+    re-uploading the same document is idempotent. In append mode the
+    document is added to the (possibly existing) shared collection.
     
     Args:
         file: Uploaded .md file
         collection_name: Target Qdrant collection name
+        streaming: Use the streaming ingestion pipeline (defaults to config)
+        document_id: Stable document ID for idempotent re-ingest
+        append: Add to an existing collection (defaults to config)
         
     Returns:
-        Simple success/failure response with document_id
+        Simple success/failure response with document_id and point counts
     """
     if not file.filename or not file.filename.lower().endswith('.md'):
         raise HTTPException(
@@ -109,7 +400,10 @@ async def upload_document(
     try:
         result = await state.document_processor.process_markdown_file(
             markdown_content=markdown_text,
-            collection_name=collection_name
+            collection_name=collection_name,
+            streaming=streaming,
+            document_id=document_id,
+            append=append
         )
         return result
     except ValueError as e:
@@ -129,3 +423,60 @@ async def upload_document(
             status_code=500,
             detail=f"Failed to process markdown file: {str(e)}"
         )
+
+
+@router.post("/documents/collections/{collection_name}/profile")
+async def migrate_collection_profile(
+    request: Request,
+    collection_name: str,
+    profile: Optional[str] = None
+):
+    """
+    Apply a collection profile (quantization, on-disk storage, HNSW) to an
+    existing collection
+    
+    Qdrant rebuilds the affected structures in the background; the
+    collection stays searchable while it does.
+    
+    Args:
+        collection_name: Collection to migrate
+        profile: full_precision, memory, balanced or latency (defaults to config)
+        
+    Returns:
+        Collection name and the applied profile
+    """
+    if not hasattr(request.app.state, 'server_state'):
+        raise HTTPException(
+            status_code=503,
+            detail="Server not properly initialized"
+        )
+    
+    from internal.server.server import ServerState
+    state: ServerState = request.app.state.server_state
+    if not state.qdrant_client:
+        raise HTTPException(
+            status_code=503,
+            detail="Qdrant client not initialized"
+        )
+    
+    if not await state.qdrant_client.client.collection_exists(collection_name):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Collection '{collection_name}' not found"
+        )
+    
+    try:
+        await state.qdrant_client.migrate_collection(collection_name, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to migrate collection: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to migrate collection: {str(e)}"
+        )
+    
+    return {
+        "collection_name": collection_name,
+        "profile": profile or state.qdrant_client.config.collection_profile
+    }
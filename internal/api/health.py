@@ -8,6 +8,9 @@ and service discovery.
 from typing import TYPE_CHECKING
 from fastapi import APIRouter, Request
 
+from internal.token_counter import TokenCounter
+from internal.processing.converter_pool import ConverterPool
+
 if TYPE_CHECKING:
     from internal.server.server import ServerState
 
@@ -41,6 +44,33 @@ async def health(request: Request):
                 "retriever": "loaded" if state.retriever else "failed",
                 "document_processor": "loaded" if state.document_processor else "failed",
                 "searxng_client": "loaded" if state.searxng_client else "failed"
+            },
+            "caches": {
+                "token_counts": TokenCounter.cache_stats(),
+                "query_embeddings": (
+                    state.query_encoder.cache.stats()
+                    if state.query_encoder and state.query_encoder.cache else None
+                ),
+                "rerank_scores": (
+                    state.retriever.rerank_pipeline.cache.stats()
+                    if state.retriever and state.retriever.rerank_pipeline
+                    and state.retriever.rerank_pipeline.cache else None
+                ),
+                "chunk_embeddings": (
+                    state.document_processor.embedding_store.stats()
+                    if state.document_processor and state.document_processor.embedding_store else None
+                )
+            },
+            "batching": {
+                "query": state.query_encoder.stats() if state.query_encoder else None,
+                "rerank": state.rerank_batcher.stats() if state.rerank_batcher else None
+            },
+            "pdf_jobs": state.pdf_jobs.stats() if state.pdf_jobs else None,
+            "docling": ConverterPool.stats(),
+            "storage": {
+                "uploads": (
+                    state.qdrant_client.upload_stats.to_dict() if state.qdrant_client else None
+                )
             }
         }
     else:
@@ -6,9 +6,11 @@ with reranking support.
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Literal, Optional
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from internal.storage.qdrant_client import build_payload_filter
 
 if TYPE_CHECKING:
     from internal.server.server import ServerState
@@ -24,6 +26,13 @@ class SearchRequest(BaseModel):
     query: str
     collection_name: str = "documents"
     limit: int = 10
+    document_ids: Optional[List[str]] = None
+    chunk_types: Optional[List[str]] = None
+    section_paths: Optional[List[str]] = None
+    prefetch_limit: Optional[int] = Field(None, gt=0)
+    fusion: Optional[Literal["rrf", "dbsf", "weighted"]] = None
+    hnsw_ef: Optional[int] = Field(None, gt=0)
+    dense_weight: Optional[float] = Field(None, ge=0.0, le=1.0)
 
 
 @router.post("/vector-search")
@@ -32,7 +41,10 @@ async def search_documents(request: Request, search_request: SearchRequest):
     Search for relevant documents using retriever
     
     Performs semantic search using dense and sparse embeddings,
-    with optional reranking.
+    with optional reranking. document_ids, chunk_types and section_paths
+    restrict the search within a shared collection. prefetch_limit, fusion,
+    hnsw_ef and dense_weight override the hybrid query plan, trading recall
+    against latency per request.
     
     Args:
         request: FastAPI Request object
@@ -53,24 +65,31 @@ async def search_documents(request: Request, search_request: SearchRequest):
     if not state.retriever:
         raise HTTPException(status_code=503, detail="Retriever not initialized")
     
-    if not state.dense_embedder or not state.sparse_embedder:
+    if not state.query_encoder:
         raise HTTPException(status_code=503, detail="Embedding models not initialized")
     
     try:
         logger.info(f"Processing search query: {search_request.query[:100]}...")
         
-        dense_embeddings = state.dense_embedder.encode([search_request.query])
-        dense_embedding = dense_embeddings[0]
-        
-        sparse_embeddings = state.sparse_embedder.encode([search_request.query])
-        sparse_embedding = sparse_embeddings[0]
+        dense_embedding, sparse_embedding = await state.query_encoder.encode(
+            search_request.query
+        )
         
         context = await state.retriever.search(
             query_text=search_request.query,
             collection_name=search_request.collection_name,
             query_dense_embedding=dense_embedding,
             query_sparse_embedding=sparse_embedding,
-            limit=search_request.limit
+            limit=search_request.limit,
+            query_filter=build_payload_filter(
+                document_ids=search_request.document_ids,
+                chunk_types=search_request.chunk_types,
+                section_paths=search_request.section_paths
+            ),
+            prefetch_limit=search_request.prefetch_limit,
+            fusion=search_request.fusion,
+            hnsw_ef=search_request.hnsw_ef,
+            dense_weight=search_request.dense_weight
         )
         
         return {
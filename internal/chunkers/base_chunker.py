@@ -1,6 +1,6 @@
 """Base abstract class for document chunkers"""
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Iterator
 import logging
 
 from .schema import SemanticChunk
@@ -66,6 +66,28 @@ class BaseDocumentChunker(ABC):
         """
         pass
     
+    def iter_chunks(
+        self,
+        content: str,
+        document_id: str
+    ) -> Iterator[List[SemanticChunk]]:
+        """
+        Yield chunks incrementally, in document order.
+        
+        The default implementation yields the whole document as a single
+        batch. Subclasses that can finalize chunks section by section
+        should override this so streaming ingestion can start embedding
+        before the whole document is chunked.
+        
+        Args:
+            content: Raw document content
+            document_id: Unique document identifier for tracking
+            
+        Yields:
+            Lists of SemanticChunk objects
+        """
+        yield self.chunk_document(content, document_id)
+    
     @property
     def max_chunk_size(self) -> int:
         """
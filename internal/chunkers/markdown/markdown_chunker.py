@@ -1,5 +1,5 @@
 """Markdown-specific document chunker with integrated section analysis"""
-from typing import List, Dict
+from typing import List, Dict, Iterator
 import uuid
 import logging
 import re
@@ -80,16 +80,40 @@ class MarkdownDocumentChunker(BaseDocumentChunker):
         logger.info(f"Stage 3: Created {len(all_chunks)} semantic chunks")
         
         # Stage 4: Apply overlap
-        overlapped_chunks = self._apply_overlap_by_section(
-            all_chunks,
-            self.config.chunking.overlap_tokens,
-            self.token_counter,
-            self.config.embedding.embedding_token_limit,
-        )
+        overlapped_chunks = self._apply_overlap_by_section(all_chunks)
         logger.info(f"Stage 4: Applied overlap, {len(overlapped_chunks)} final chunks")
         
         return overlapped_chunks
     
+    def iter_chunks(
+        self,
+        content: str,
+        document_id: str,
+    ) -> Iterator[List[SemanticChunk]]:
+        """
+        Yield overlapped chunks one top-level section at a time
+        
+        Overlap never crosses a section_path boundary, so each top-level
+        section can be finalized independently of the rest of the document.
+        
+        Args:
+            content: Markdown content
+            document_id: Unique document identifier
+            
+        Yields:
+            Lists of semantic chunks for each top-level section
+        """
+        logger.info(f"Streaming document: {document_id}")
+        
+        elements = self.parser.parse(content)
+        sections = self.section_analyzer.analyze(elements)
+        logger.info(f"Streaming {len(sections)} top-level sections")
+        
+        for section in sections:
+            section_chunks = self._chunk_section(section, ancestry=[])
+            if section_chunks:
+                yield self._apply_overlap_by_section(section_chunks)
+    
     def _chunk_section(
         self, 
         section: Section,
@@ -157,7 +181,10 @@ class MarkdownDocumentChunker(BaseDocumentChunker):
         return SemanticChunk(
             id=str(uuid.uuid4()),
             content=combined_content,
-            token_count=TokenCounter.count_tokens(combined_content, self.token_counter.model_name, self.token_counter.tokenizer),
+            token_count=TokenCounter.count_concatenated(
+                [e.content for e in elements], "\n\n",
+                self.token_counter.model_name, self.token_counter.tokenizer
+            ),
             chunk_type="text",
             parent_section=parent_section,
             section_path=header_path
@@ -72,10 +72,13 @@ class OverlapHandler:
             
             if overlap_text:
                 overlapped_content = f"{overlap_text}\n\n{chunk.content}"
-                chunk_token_count = TokenCounter.count_tokens(chunk.content, token_counter.model_name, token_counter.tokenizer)
-                overlap_token_count = TokenCounter.count_tokens(overlap_text, token_counter.model_name, token_counter.tokenizer)
-                final_token_count = TokenCounter.count_tokens(overlapped_content, token_counter.model_name, token_counter.tokenizer)
+                final_token_count = TokenCounter.count_concatenated(
+                    [overlap_text, chunk.content], "\n\n",
+                    token_counter.model_name, token_counter.tokenizer
+                )
                 if final_token_count > max_tokens:
+                    chunk_token_count = TokenCounter.count_tokens(chunk.content, token_counter.model_name, token_counter.tokenizer)
+                    overlap_token_count = TokenCounter.count_tokens(overlap_text, token_counter.model_name, token_counter.tokenizer)
                     logger.warning(
                         f"Overlap caused chunk to exceed limit: {final_token_count} > {max_tokens}. \n"
                         f"Chunk token size: {chunk_token_count} \n"
@@ -89,7 +92,7 @@ class OverlapHandler:
                 overlapped_chunk = SemanticChunk(
                     id=str(uuid.uuid4()),
                     content=overlapped_content,
-                    token_count=TokenCounter.count_tokens(overlapped_content, token_counter.model_name, token_counter.tokenizer),
+                    token_count=final_token_count,
                     chunk_type=chunk.chunk_type,
                     prev_chunk_id=chunk.prev_chunk_id,
                     next_chunk_id=chunk.next_chunk_id,
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional, Dict, Any, List
 import yaml
 import logging
@@ -25,6 +25,34 @@ class ChunkingConfig:
             raise ValueError("max_chunk_size must be positive")
         
 
+INFERENCE_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def _validate_backend(backend: str):
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(f"backend must be one of {list(INFERENCE_BACKENDS)}, got '{backend}'")
+
+
+@dataclass
+class OnnxConfig:
+    """Configuration for ONNX Runtime backends (export cache, quantization, parity check)"""
+    cache_dir: str = "models/onnx"  # Exported and quantized models, created on first load
+    quantization_arch: str = "avx2"  # int8 kernels: avx2 | avx512 | avx512_vnni | arm64
+    threads: Optional[int] = None  # intra-op threads per session; None = ONNX Runtime default
+    parity_check: bool = True  # Compare against PyTorch outputs on load, fall back to torch on mismatch
+    parity_tolerance: float = 1e-3  # Max abs output difference for fp32
+    int8_parity_tolerance: float = 5e-2  # Max abs output difference for int8
+    
+    def __post_init__(self):
+        valid_archs = ["avx2", "avx512", "avx512_vnni", "arm64"]
+        if self.quantization_arch not in valid_archs:
+            raise ValueError(f"quantization_arch must be one of {valid_archs}")
+        if self.threads is not None and self.threads <= 0:
+            raise ValueError("threads must be positive")
+        if self.parity_tolerance <= 0 or self.int8_parity_tolerance <= 0:
+            raise ValueError("parity tolerances must be positive")
+
+
 @dataclass
 class DenseEmbeddingConfig:
     """Configuration for dense embedding model (SentenceTransformer)"""
@@ -34,6 +62,14 @@ class DenseEmbeddingConfig:
     use_fp16: bool = False
     show_progress_bar: bool = True
     model_dim: int = 768
+    backend: str = "torch"  # torch | onnx | onnx-int8 (ONNX backends run on CPU)
+    onnx: OnnxConfig = field(default_factory=OnnxConfig)
+    max_batch_tokens: Optional[int] = 16384  # Padded tokens per length-bucketed batch; None = fixed batch_size
+    
+    def __post_init__(self):
+        _validate_backend(self.backend)
+        if self.max_batch_tokens is not None and self.max_batch_tokens <= 0:
+            raise ValueError("max_batch_tokens must be positive")
 
 
 @dataclass
@@ -44,12 +80,29 @@ class SparseEmbeddingConfig:
     threads: int = 4
 
 
+@dataclass
+class EmbeddingExecutorConfig:
+    """Configuration for running embedders off the event loop"""
+    pool_type: str = "thread"  # "thread" or "process"
+    dense_workers: int = 1
+    sparse_workers: int = 1
+    
+    def __post_init__(self):
+        if self.pool_type not in ("thread", "process"):
+            raise ValueError(
+                f"pool_type must be 'thread' or 'process', got '{self.pool_type}'"
+            )
+        if self.dense_workers <= 0 or self.sparse_workers <= 0:
+            raise ValueError("executor worker counts must be positive")
+
+
 @dataclass
 class EmbeddingConfig:
     """Configuration for embedding components"""
     dense: DenseEmbeddingConfig
     sparse: SparseEmbeddingConfig
     embedding_token_limit: int = 512  # Max tokens the embedding model can handle
+    executor: EmbeddingExecutorConfig = field(default_factory=EmbeddingExecutorConfig)
     
     def __post_init__(self):
         """Validate embedding configuration"""
@@ -57,6 +110,125 @@ class EmbeddingConfig:
             raise ValueError("embedding_token_limit must be positive")
 
 
+@dataclass
+class QueryBatchingConfig:
+    """Configuration for micro-batching concurrent query-time model calls"""
+    enabled: bool = True
+    max_batch_size: int = 32  # Queries per dense/sparse forward pass
+    max_wait_ms: float = 5.0  # Longest a query waits for others to join
+    rerank_max_batch_size: int = 64  # Query-document pairs per reranker pass
+    
+    def __post_init__(self):
+        if self.max_batch_size <= 0 or self.rerank_max_batch_size <= 0:
+            raise ValueError("batch sizes must be positive")
+        if self.max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+
+
+@dataclass
+class QueryCacheConfig:
+    """Configuration for the query embedding cache"""
+    enabled: bool = True
+    max_entries: int = 10000  # In-process LRU size
+    ttl_seconds: Optional[float] = 86400  # None disables expiry
+    disk_path: Optional[str] = None  # SQLite file for the optional disk tier
+    disk_max_entries: int = 100000
+    disk_prune_interval: int = 1000  # Trim the disk tier to disk_max_entries every N inserts
+    lowercase: bool = True  # Case-fold queries (safe for uncased models)
+    
+    def __post_init__(self):
+        if self.max_entries <= 0 or self.disk_max_entries <= 0:
+            raise ValueError("cache sizes must be positive")
+        if self.disk_prune_interval <= 0:
+            raise ValueError("disk_prune_interval must be positive")
+        if self.ttl_seconds is not None and self.ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+
+@dataclass
+class HybridSearchConfig:
+    """Defaults for hybrid (dense + sparse) query planning"""
+    fusion: str = "rrf"  # rrf | dbsf | weighted (client-side weighted score fusion)
+    prefetch_multiplier: float = 3.0  # Prefetch depth per branch relative to the fused limit
+    min_prefetch: int = 20
+    max_prefetch: int = 500
+    hnsw_ef: Optional[int] = None  # Dense HNSW ef; None uses the collection default
+    dense_weight: float = 0.5  # Weighted fusion only; sparse gets 1 - dense_weight
+    rerank_candidates: Optional[int] = None  # Fused candidates fetched for reranking; None = limit
+    matryoshka_oversampling: float = 4.0  # First-pass candidates on the truncated vector per rescored result
+    
+    def __post_init__(self):
+        valid_fusions = ["rrf", "dbsf", "weighted"]
+        if self.fusion not in valid_fusions:
+            raise ValueError(f"fusion must be one of {valid_fusions}, got '{self.fusion}'")
+        if self.prefetch_multiplier < 1:
+            raise ValueError("prefetch_multiplier must be at least 1")
+        if not 0 < self.min_prefetch <= self.max_prefetch:
+            raise ValueError("min_prefetch must be positive and not exceed max_prefetch")
+        if self.hnsw_ef is not None and self.hnsw_ef <= 0:
+            raise ValueError("hnsw_ef must be positive")
+        if not 0.0 <= self.dense_weight <= 1.0:
+            raise ValueError("dense_weight must be between 0 and 1")
+        if self.rerank_candidates is not None and self.rerank_candidates <= 0:
+            raise ValueError("rerank_candidates must be positive")
+        if self.matryoshka_oversampling < 1:
+            raise ValueError("matryoshka_oversampling must be at least 1")
+
+
+@dataclass
+class IngestionConfig:
+    """Configuration for the document ingestion pipeline"""
+    streaming: bool = False  # Stream chunks through bounded embed/store stages
+    append: bool = False  # Ingest into an existing collection instead of one collection per upload
+    batch_size: int = 64  # Chunks per pipeline batch
+    queue_depth: int = 4  # Max batches buffered between stages
+    embedding_store_path: Optional[str] = None  # Persistent chunk embedding store; None disables it
+    embedding_store_max_rows: Optional[int] = 500000  # Compact the store beyond this many vectors; None = unbounded
+    
+    def __post_init__(self):
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if self.embedding_store_max_rows is not None and self.embedding_store_max_rows <= 0:
+            raise ValueError("embedding_store_max_rows must be positive")
+        if self.queue_depth <= 0:
+            raise ValueError("queue_depth must be positive")
+
+
+@dataclass
+class DoclingConfig:
+    """Configuration for the shared Docling converter pool"""
+    converters_per_options: int = 1  # Warm converters per format/pipeline options, for concurrent callers
+    warm_up: bool = True  # Load converter models at startup (server and PDF workers) instead of on first use
+    
+    def __post_init__(self):
+        if self.converters_per_options <= 0:
+            raise ValueError("converters_per_options must be positive")
+
+
+@dataclass
+class PdfJobsConfig:
+    """Configuration for background PDF extraction jobs"""
+    enabled: bool = True
+    workers: int = 2  # Worker processes, each converting one page window at a time
+    job_timeout_seconds: Optional[float] = 900.0  # Running time of one page window before its worker is killed; None = no limit
+    max_pending_jobs: int = 100  # Queued + running jobs accepted before submissions are rejected
+    upload_dir: str = "uploads/pdf_jobs"  # Where submitted PDFs wait for a worker
+    result_ttl_seconds: float = 3600.0  # How long finished jobs and their markdown are kept
+    pages_per_window: Optional[int] = 20  # Longer PDFs are split into page windows converted in parallel; None = whole file
+    
+    def __post_init__(self):
+        if self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if self.job_timeout_seconds is not None and self.job_timeout_seconds <= 0:
+            raise ValueError("job_timeout_seconds must be positive")
+        if self.max_pending_jobs <= 0:
+            raise ValueError("max_pending_jobs must be positive")
+        if self.result_ttl_seconds <= 0:
+            raise ValueError("result_ttl_seconds must be positive")
+        if self.pages_per_window is not None and self.pages_per_window <= 0:
+            raise ValueError("pages_per_window must be positive")
+
+
 @dataclass
 class RerankerConfig:
     """Configuration for reranker model (CrossEncoder)"""
@@ -64,6 +236,24 @@ class RerankerConfig:
     device: str = "cpu"
     batch_size: int = 32
     enabled: bool = False
+    max_candidates: Optional[int] = None  # Pairs the reranker scores per query; the rest keep fusion order
+    score_cache_size: int = 10000  # (query, point) scores kept in memory; 0 disables
+    cascade_model_name: Optional[str] = None  # Small cross-encoder that pre-scores all candidates
+    cascade_top_k: int = 10  # Candidates the small model passes on to model_name
+    backend: str = "torch"  # torch | onnx | onnx-int8, for both reranker models
+    onnx: OnnxConfig = field(default_factory=OnnxConfig)
+    max_batch_tokens: Optional[int] = 16384  # Padded tokens per length-bucketed batch; None = fixed batch_size
+    
+    def __post_init__(self):
+        _validate_backend(self.backend)
+        if self.max_batch_tokens is not None and self.max_batch_tokens <= 0:
+            raise ValueError("max_batch_tokens must be positive")
+        if self.max_candidates is not None and self.max_candidates <= 0:
+            raise ValueError("max_candidates must be positive")
+        if self.score_cache_size < 0:
+            raise ValueError("score_cache_size cannot be negative")
+        if self.cascade_top_k <= 0:
+            raise ValueError("cascade_top_k must be positive")
 
 
 @dataclass
@@ -73,9 +263,13 @@ class CompressionConfig:
     compression_ratio: Optional[float] = None  # e.g., 0.5 for 50% compression
     token_limit: Optional[int] = None  # Alternative: absolute token target
     device: str = "cpu"
+    backend: str = "torch"  # torch | onnx | onnx-int8
+    onnx: OnnxConfig = field(default_factory=OnnxConfig)
     
     def __post_init__(self):
         """Validate compression parameters"""
+        _validate_backend(self.backend)
+        
         if self.compression_ratio is not None:
             if not 0 < self.compression_ratio < 1:
                 raise ValueError("compression_ratio must be between 0 and 1")
@@ -90,6 +284,59 @@ class LLMConfig:
     model: str = "llama3.2"
 
 
+@dataclass
+class CollectionProfileConfig:
+    """Storage layout of a Qdrant collection (quantization, on-disk data, HNSW)"""
+    quantization: Optional[str] = None  # None | scalar (int8) | binary
+    quantization_always_ram: bool = True  # Keep quantized vectors in RAM
+    rescore: bool = True  # Re-score quantized candidates with original vectors
+    oversampling: float = 2.0  # Fetch limit x oversampling quantized candidates before rescoring
+    vectors_on_disk: bool = False  # Original dense vectors memory-mapped from disk
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    hnsw_on_disk: bool = False
+    sparse_on_disk: bool = False  # Sparse inverted index on disk
+    
+    def __post_init__(self):
+        if self.quantization not in (None, "scalar", "binary"):
+            raise ValueError(
+                f"quantization must be None, 'scalar' or 'binary', got '{self.quantization}'"
+            )
+        if self.oversampling < 1.0:
+            raise ValueError("oversampling must be at least 1.0")
+        if self.hnsw_m < 0 or self.hnsw_ef_construct <= 0:
+            raise ValueError("hnsw_m cannot be negative and hnsw_ef_construct must be positive")
+
+
+# Built-in collection profiles; QdrantConfig.profile_overrides adjusts single fields
+COLLECTION_PROFILES: Dict[str, CollectionProfileConfig] = {
+    # Everything float32 in RAM (the original layout)
+    "full_precision": CollectionProfileConfig(),
+    # 1-bit vectors in RAM, originals, graph and sparse index on disk: ~1/32 dense RAM
+    "memory": CollectionProfileConfig(
+        quantization="binary",
+        oversampling=3.0,
+        vectors_on_disk=True,
+        hnsw_on_disk=True,
+        sparse_on_disk=True
+    ),
+    # int8 vectors in RAM, originals on disk: ~1/4 dense RAM, rescoring reads few originals
+    "balanced": CollectionProfileConfig(
+        quantization="scalar",
+        oversampling=2.0,
+        vectors_on_disk=True,
+        hnsw_ef_construct=128
+    ),
+    # int8 search with originals in RAM and a denser graph
+    "latency": CollectionProfileConfig(
+        quantization="scalar",
+        oversampling=1.5,
+        hnsw_m=32,
+        hnsw_ef_construct=200
+    ),
+}
+
+
 @dataclass
 class QdrantConfig:
     """Configuration for Qdrant vector store"""
@@ -97,6 +344,13 @@ class QdrantConfig:
     distance_metric: str = "Cosine"
     grpc_port: int = 6334
     storage_batch_size: int = 100
+    upload_parallelism: int = 4  # Max upsert requests in flight
+    upload_max_retries: int = 3  # Retries per batch on transient errors
+    upload_retry_backoff: float = 0.5  # Seconds before the first retry, doubled each time
+    upload_wait: bool = True  # False: wait=False upserts with a final wait=True barrier
+    collection_profile: str = "full_precision"  # Key of COLLECTION_PROFILES
+    matryoshka_dim: Optional[int] = None  # Index a truncated dense vector of this size; full vector kept for rescoring
+    profile_overrides: Optional[Dict[str, Any]] = None  # CollectionProfileConfig fields to override
     
     def __post_init__(self):
         """Validate Qdrant configuration"""
@@ -109,6 +363,38 @@ class QdrantConfig:
         
         if self.storage_batch_size <= 0:
             raise ValueError("storage_batch_size must be positive")
+        
+        if self.upload_parallelism <= 0:
+            raise ValueError("upload_parallelism must be positive")
+        
+        if self.upload_max_retries < 0:
+            raise ValueError("upload_max_retries cannot be negative")
+        
+        if self.matryoshka_dim is not None and self.matryoshka_dim <= 0:
+            raise ValueError("matryoshka_dim must be positive")
+        
+        self.profile()
+    
+    def profile(self, name: Optional[str] = None) -> CollectionProfileConfig:
+        """
+        Resolve a collection profile
+        
+        Args:
+            name: Profile name; defaults to collection_profile. Overrides
+                apply to the configured profile only.
+        
+        Returns:
+            CollectionProfileConfig
+        """
+        name = name or self.collection_profile
+        if name not in COLLECTION_PROFILES:
+            raise ValueError(
+                f"collection_profile must be one of {list(COLLECTION_PROFILES)}, got '{name}'"
+            )
+        profile = COLLECTION_PROFILES[name]
+        if name == self.collection_profile and self.profile_overrides:
+            profile = replace(profile, **self.profile_overrides)
+        return profile
 
 
 @dataclass
@@ -165,6 +451,12 @@ class Config:
     storage: Optional[QdrantConfig] = None
     compression: Optional[CompressionConfig] = None
     searxng: Optional[SearXNGConfig] = None
+    ingestion: Optional[IngestionConfig] = None
+    query_batching: Optional[QueryBatchingConfig] = None
+    query_cache: Optional[QueryCacheConfig] = None
+    hybrid_search: Optional[HybridSearchConfig] = None
+    pdf_jobs: Optional[PdfJobsConfig] = None
+    docling: Optional[DoclingConfig] = None
     
     def __post_init__(self):
         """Validate cross-config constraints"""
@@ -175,6 +467,16 @@ class Config:
                 f"embedding_token_limit ({self.embedding.embedding_token_limit})"
             )
         
+        if (
+            self.storage
+            and self.storage.matryoshka_dim is not None
+            and self.storage.matryoshka_dim >= self.embedding.dense.model_dim
+        ):
+            raise ValueError(
+                f"matryoshka_dim ({self.storage.matryoshka_dim}) must be smaller than "
+                f"the dense model dimension ({self.embedding.dense.model_dim})"
+            )
+        
         # Warn if overlap is significant relative to chunk size
         overlap_ratio = self.chunking.overlap_tokens / self.chunking.max_chunk_size
         if overlap_ratio > 0.5:
@@ -199,9 +501,17 @@ def load_config(config_path: str = "config.yaml") -> Config:
     e_raw = data.get('embedding', {})
     d_raw = e_raw.get('dense', {})
     s_raw = e_raw.get('sparse', {})
+    x_raw = e_raw.get('executor', {})
     q_raw = data.get('qdrant', {})
     r_raw = data.get('reranker', {})
     l_raw = data.get('llm', {})
+    i_raw = data.get('ingestion', {})
+    b_raw = data.get('query_batching', {})
+    qc_raw = data.get('query_cache', {})
+    h_raw = data.get('hybrid_search', {})
+    o_raw = data.get('onnx', {})
+    p_raw = data.get('pdf_jobs', {})
+    dl_raw = data.get('docling', {})
 
     chunking_cfg = ChunkingConfig(
         max_chunk_size=c_raw.get('chunk_size', 256),
@@ -209,13 +519,25 @@ def load_config(config_path: str = "config.yaml") -> Config:
         include_section_path=c_raw.get('include_header_path', True)
     )
     
+    onnx_cfg = OnnxConfig(
+        cache_dir=o_raw.get('cache_dir', 'models/onnx'),
+        quantization_arch=o_raw.get('quantization_arch', 'avx2'),
+        threads=o_raw.get('threads'),
+        parity_check=o_raw.get('parity_check', True),
+        parity_tolerance=o_raw.get('parity_tolerance', 1e-3),
+        int8_parity_tolerance=o_raw.get('int8_parity_tolerance', 5e-2)
+    )
+    
     dense_cfg = DenseEmbeddingConfig(
         model_name=d_raw.get('model_name', "BAAI/bge-base-en-v1.5"),
         device=e_raw.get('device', "cuda"),
         batch_size=d_raw.get('batch_size', 30),
         use_fp16=d_raw.get('use_fp16', True),
         show_progress_bar=d_raw.get('show_progress_bar', False),
-        model_dim=e_raw.get('model_dim', 768)
+        model_dim=e_raw.get('model_dim', 768),
+        backend=d_raw.get('backend', 'torch'),
+        onnx=onnx_cfg,
+        max_batch_tokens=d_raw.get('max_batch_tokens', 16384)
     )
     
     sparse_cfg = SparseEmbeddingConfig(
@@ -224,17 +546,68 @@ def load_config(config_path: str = "config.yaml") -> Config:
         threads=s_raw.get('threads', 2)
     )
     
+    executor_cfg = EmbeddingExecutorConfig(
+        pool_type=x_raw.get('pool_type', "thread"),
+        dense_workers=x_raw.get('dense_workers', 1),
+        sparse_workers=x_raw.get('sparse_workers', 1)
+    )
+    
     embedding_cfg = EmbeddingConfig(
         dense=dense_cfg,
         sparse=sparse_cfg,
-        embedding_token_limit=e_raw.get('token_limit', 512)
+        embedding_token_limit=e_raw.get('token_limit', 512),
+        executor=executor_cfg
     )
     
     qdrant_cfg = QdrantConfig(
         url=q_raw.get('url', "http://localhost:6333"),
         distance_metric=q_raw.get('distance_metric', "Cosine"),
         grpc_port=q_raw.get('grpc_port', 6334),
-        storage_batch_size=q_raw.get('storage_batch_size', 500)
+        storage_batch_size=q_raw.get('storage_batch_size', 500),
+        upload_parallelism=q_raw.get('upload_parallelism', 4),
+        upload_max_retries=q_raw.get('upload_max_retries', 3),
+        upload_retry_backoff=q_raw.get('upload_retry_backoff', 0.5),
+        upload_wait=q_raw.get('upload_wait', True),
+        collection_profile=q_raw.get('collection_profile', 'full_precision'),
+        profile_overrides=q_raw.get('profile_overrides'),
+        matryoshka_dim=q_raw.get('matryoshka_dim')
+    )
+
+    ingestion_cfg = IngestionConfig(
+        streaming=i_raw.get('streaming', False),
+        append=i_raw.get('append', False),
+        batch_size=i_raw.get('batch_size', 64),
+        queue_depth=i_raw.get('queue_depth', 4),
+        embedding_store_path=i_raw.get('embedding_store_path'),
+        embedding_store_max_rows=i_raw.get('embedding_store_max_rows', 500000)
+    )
+
+    query_batching_cfg = QueryBatchingConfig(
+        enabled=b_raw.get('enabled', True),
+        max_batch_size=b_raw.get('max_batch_size', 32),
+        max_wait_ms=b_raw.get('max_wait_ms', 5.0),
+        rerank_max_batch_size=b_raw.get('rerank_max_batch_size', 64)
+    )
+
+    query_cache_cfg = QueryCacheConfig(
+        enabled=qc_raw.get('enabled', True),
+        max_entries=qc_raw.get('max_entries', 10000),
+        ttl_seconds=qc_raw.get('ttl_seconds', 86400),
+        disk_path=qc_raw.get('disk_path'),
+        disk_max_entries=qc_raw.get('disk_max_entries', 100000),
+        disk_prune_interval=qc_raw.get('disk_prune_interval', 1000),
+        lowercase=qc_raw.get('lowercase', True)
+    )
+
+    hybrid_search_cfg = HybridSearchConfig(
+        fusion=h_raw.get('fusion', 'rrf'),
+        prefetch_multiplier=h_raw.get('prefetch_multiplier', 3.0),
+        min_prefetch=h_raw.get('min_prefetch', 20),
+        max_prefetch=h_raw.get('max_prefetch', 500),
+        hnsw_ef=h_raw.get('hnsw_ef'),
+        dense_weight=h_raw.get('dense_weight', 0.5),
+        rerank_candidates=h_raw.get('rerank_candidates'),
+        matryoshka_oversampling=h_raw.get('matryoshka_oversampling', 4.0)
     )
 
     llm_cfg = LLMConfig(
@@ -245,14 +618,23 @@ def load_config(config_path: str = "config.yaml") -> Config:
         model_name=r_raw.get('model_name', 'BAAI/bge-reranker-v2-m3'),
         device=r_raw.get('device', 'cpu'),
         batch_size=r_raw.get('batch_size', 32),
-        enabled=True
+        enabled=True,
+        max_candidates=r_raw.get('max_candidates'),
+        score_cache_size=r_raw.get('score_cache_size', 10000),
+        cascade_model_name=r_raw.get('cascade_model_name'),
+        cascade_top_k=r_raw.get('cascade_top_k', 10),
+        backend=r_raw.get('backend', 'torch'),
+        onnx=onnx_cfg,
+        max_batch_tokens=r_raw.get('max_batch_tokens', 16384)
     )
     
     compression_cfg = CompressionConfig(
         model_name=data.get('compression', {}).get('model_name', 'microsoft/llmlingua-2-bert-base-multilingual-cased-meetingbank'),
         compression_ratio=data.get('compression', {}).get('compression_ratio'),
         token_limit=data.get('compression', {}).get('token_limit'),
-        device=data.get('compression', {}).get('device', 'cpu')
+        device=data.get('compression', {}).get('device', 'cpu'),
+        backend=data.get('compression', {}).get('backend', 'torch'),
+        onnx=onnx_cfg
     )
     
     searxng_cfg = SearXNGConfig(
@@ -270,6 +652,21 @@ def load_config(config_path: str = "config.yaml") -> Config:
         default_category=data.get('searxng', {}).get('default_category', 'general')
     )
 
+    pdf_jobs_cfg = PdfJobsConfig(
+        enabled=p_raw.get('enabled', True),
+        workers=p_raw.get('workers', 2),
+        job_timeout_seconds=p_raw.get('job_timeout_seconds', 900.0),
+        max_pending_jobs=p_raw.get('max_pending_jobs', 100),
+        upload_dir=p_raw.get('upload_dir', 'uploads/pdf_jobs'),
+        result_ttl_seconds=p_raw.get('result_ttl_seconds', 3600.0),
+        pages_per_window=p_raw.get('pages_per_window', 20)
+    )
+
+    docling_cfg = DoclingConfig(
+        converters_per_options=dl_raw.get('converters_per_options', 1),
+        warm_up=dl_raw.get('warm_up', True)
+    )
+
     return Config(
         chunking=chunking_cfg,
         embedding=embedding_cfg,
@@ -278,4 +675,10 @@ def load_config(config_path: str = "config.yaml") -> Config:
         llm=llm_cfg,
         compression=compression_cfg,
         searxng=searxng_cfg,
+        ingestion=ingestion_cfg,
+        query_batching=query_batching_cfg,
+        query_cache=query_cache_cfg,
+        hybrid_search=hybrid_search_cfg,
+        pdf_jobs=pdf_jobs_cfg,
+        docling=docling_cfg,
     )
@@ -5,16 +5,35 @@ This package provides three independent components for embedding and reranking:
 - DenseEmbedder: Generate dense semantic embeddings using SentenceTransformer
 - SparseEmbedder: Generate sparse lexical embeddings using SPLADE
 - Reranker: Rerank search results using CrossEncoder models
+- EmbeddingExecutor: Run dense and sparse encoding off the event loop
+- MicroBatcher: Coalesce concurrent model calls into batches
+- QueryEncoder: Batched dense + sparse encoding for search queries
+- QueryEmbeddingCache: Two-tier (LRU + SQLite) cache of query embeddings
+- ChunkEmbeddingStore: Persistent content-addressed store of chunk embeddings
+- SparseBatch / SparseRow: CSR representation of sparse vectors
 """
 
 from .dense_embedder import DenseEmbedder
 from .sparse_embedder import SparseEmbedder
+from .embedding_executor import EmbeddingExecutor
+from .micro_batcher import MicroBatcher
+from .query_encoder import QueryEncoder
+from .query_cache import QueryEmbeddingCache
+from .embedding_store import ChunkEmbeddingStore
+from .vectors import SparseBatch, SparseRow
 from ..processing.reranker import Reranker
 
 __all__ = [
     'DenseEmbedder',
     'SparseEmbedder',
     'Reranker',
+    'EmbeddingExecutor',
+    'MicroBatcher',
+    'QueryEncoder',
+    'QueryEmbeddingCache',
+    'ChunkEmbeddingStore',
+    'SparseBatch',
+    'SparseRow',
 ]
 
 __version__ = '2.0.0'
\ No newline at end of file
@@ -5,6 +5,9 @@ from sentence_transformers import SentenceTransformer
 
 from internal.config import DenseEmbeddingConfig
 from internal.token_counter import TokenCounter
+from internal import onnx_backend
+from .vectors import empty_dense
+from internal.length_batching import token_budget_batches, run_in_batches, padding_efficiency
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +33,20 @@ class DenseEmbedder:
     Performance:
     - Supports GPU acceleration (device="cuda")
     - FP16 precision reduces memory usage on CUDA
+    - ONNX Runtime fp32/int8 backends for CPU-only nodes (config.backend)
     - Batch encoding for efficiency
     """
     def __init__(self, config: DenseEmbeddingConfig):
         self.config = config
+        self.backend = config.backend
         
-        logger.info(f"Loading dense model: {config.model_name}")
-        self.model = SentenceTransformer(config.model_name, device=config.device)
+        logger.info(f"Loading dense model: {config.model_name} ({config.backend})")
+        if config.backend == "torch":
+            self.model = SentenceTransformer(config.model_name, device=config.device)
+        else:
+            self.model = self._load_onnx()
         
-        if config.device == "cuda" and config.use_fp16:
+        if self.backend == "torch" and config.device == "cuda" and config.use_fp16:
             try:
                 self.model = self.model.half()
                 logger.info("Dense model converted to FP16")
@@ -52,7 +60,28 @@ class DenseEmbedder:
         logger.info(f"  Dimension: {self.get_dimension()}")
         logger.info(f"  Max sequence length: {self.max_seq_length}")
     
-    def encode(self, texts: List[str]) -> List[np.ndarray]:
+    def _load_onnx(self) -> SentenceTransformer:
+        """Load the ONNX model, falling back to PyTorch if outputs diverge"""
+        config = self.config
+        model = onnx_backend.load_sentence_transformer(config.model_name, config.backend, config.onnx)
+        if not config.onnx.parity_check:
+            return model
+        
+        reference = SentenceTransformer(config.model_name, device="cpu")
+        passed = onnx_backend.check_parity(
+            reference.encode(onnx_backend.PARITY_PROBES, normalize_embeddings=True),
+            model.encode(onnx_backend.PARITY_PROBES, normalize_embeddings=True),
+            onnx_backend.parity_tolerance(config.onnx, config.backend),
+            label=config.model_name
+        )
+        if passed:
+            return model
+        
+        logger.warning(f"Falling back to PyTorch for {config.model_name}")
+        self.backend = "torch"
+        return SentenceTransformer(config.model_name, device=config.device)
+    
+    def encode(self, texts: List[str]) -> np.ndarray:
         """
         Generate dense embeddings for a list of texts.
         
@@ -64,34 +93,57 @@ class DenseEmbedder:
             texts: List of text strings to embed
             
         Returns:
-            List of numpy arrays (embeddings), each with shape (embedding_dim,)
+            Contiguous float32 matrix with shape (len(texts), embedding_dim);
+            row i is the embedding of texts[i]
             
         Note:
             - Texts longer than max_seq_length are truncated with warning
-            - Batch processing uses config.batch_size for efficiency
+            - Texts are batched by token length under config.max_batch_tokens
+              (at most config.batch_size per batch)
             - Embeddings are L2-normalized for cosine similarity
         """
         if not texts:
-            return []
+            return empty_dense(self.get_dimension())
         
         logger.info(f"Generating dense embeddings for {len(texts)} texts")
         
-        validated_texts = TokenCounter.validate_and_truncate_batch(
+        validated_texts, token_counts, truncated_count = TokenCounter.truncate_batch_with_counts(
             texts=texts,
             max_tokens=self.max_seq_length,
             model_name=self.config.model_name,
-            tokenizer=self.tokenizer,
-            warn_on_truncation=True
+            tokenizer=self.tokenizer
         )
+        if truncated_count:
+            logger.warning(
+                f"{truncated_count}/{len(texts)} texts exceed {self.max_seq_length} tokens and were truncated"
+            )
         
-        embeddings = self.model.encode(
+        if self.config.max_batch_tokens is None:
+            embeddings = self._encode_batch(validated_texts, self.config.batch_size)
+            return np.ascontiguousarray(embeddings, dtype=np.float32)
+        
+        # Batch texts of similar length under a token budget instead of a
+        # fixed count, so short texts are not padded to the longest one
+        batches = token_budget_batches(token_counts, self.config.max_batch_tokens, self.config.batch_size)
+        logger.debug(
+            f"{len(batches)} length-bucketed batches, "
+            f"padding efficiency {padding_efficiency(token_counts, batches):.0%}"
+        )
+        embeddings = run_in_batches(
             validated_texts,
-            batch_size=self.config.batch_size,
+            batches,
+            lambda batch: self._encode_batch(batch, len(batch))
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
+    def _encode_batch(self, texts: List[str], batch_size: int) -> np.ndarray:
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
             show_progress_bar=self.config.show_progress_bar,
             convert_to_numpy=True,
             normalize_embeddings=True
         )
-        return [embedding for embedding in embeddings]
     
     def get_dimension(self) -> int:
         """
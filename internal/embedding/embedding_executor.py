@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Tuple, Optional
+import numpy as np
+
+from internal.config import EmbeddingExecutorConfig, DenseEmbeddingConfig, SparseEmbeddingConfig
+from .dense_embedder import DenseEmbedder
+from .sparse_embedder import SparseEmbedder
+from .vectors import SparseBatch, empty_dense
+
+logger = logging.getLogger(__name__)
+
+
+# Per-process model instances for the process pool workers
+_worker_dense_embedder: Optional[DenseEmbedder] = None
+_worker_sparse_embedder: Optional[SparseEmbedder] = None
+
+
+def _init_dense_worker(config: DenseEmbeddingConfig):
+    """Load the dense model once per worker process"""
+    global _worker_dense_embedder
+    _worker_dense_embedder = DenseEmbedder(config)
+
+
+def _init_sparse_worker(config: SparseEmbeddingConfig):
+    """Load the sparse model once per worker process"""
+    global _worker_sparse_embedder
+    _worker_sparse_embedder = SparseEmbedder(config)
+
+
+def _dense_encode_in_worker(texts: List[str]) -> np.ndarray:
+    return _worker_dense_embedder.encode(texts)
+
+
+def _sparse_encode_in_worker(texts: List[str]) -> SparseBatch:
+    return _worker_sparse_embedder.encode(texts)
+
+
+class EmbeddingExecutor:
+    """
+    Run dense and sparse encoding off the event loop.
+    
+    DenseEmbedder.encode and SparseEmbedder.encode are blocking CPU/GPU
+    calls. The executor runs each embedder on its own pool and returns
+    awaitables, so async handlers stay responsive and dense and sparse
+    encoding of the same texts run in parallel.
+    
+    Pool types:
+    - thread: workers share the already-loaded embedders. PyTorch and
+      ONNX Runtime release the GIL during inference, so threads overlap.
+    - process: every worker process loads its own model copy from the
+      embedders' configs (spawned, so CUDA is safe to initialize).
+      Results come back as a float32 matrix and a CSR SparseBatch, which
+      pickle as a few flat buffers.
+    
+    Attributes:
+        config: EmbeddingExecutorConfig with pool settings
+        dense_embedder: DenseEmbedder used by thread workers
+        sparse_embedder: SparseEmbedder used by thread workers
+    """
+    def __init__(
+        self,
+        dense_embedder: DenseEmbedder,
+        sparse_embedder: SparseEmbedder,
+        config: Optional[EmbeddingExecutorConfig] = None
+    ):
+        self.config = config or EmbeddingExecutorConfig()
+        self.dense_embedder = dense_embedder
+        self.sparse_embedder = sparse_embedder
+        
+        if self.config.pool_type == "process":
+            context = multiprocessing.get_context("spawn")
+            self._dense_pool: Executor = ProcessPoolExecutor(
+                max_workers=self.config.dense_workers,
+                mp_context=context,
+                initializer=_init_dense_worker,
+                initargs=(dense_embedder.config,)
+            )
+            self._sparse_pool: Executor = ProcessPoolExecutor(
+                max_workers=self.config.sparse_workers,
+                mp_context=context,
+                initializer=_init_sparse_worker,
+                initargs=(sparse_embedder.config,)
+            )
+            self._dense_fn = _dense_encode_in_worker
+            self._sparse_fn = _sparse_encode_in_worker
+        else:
+            self._dense_pool = ThreadPoolExecutor(
+                max_workers=self.config.dense_workers,
+                thread_name_prefix="dense-embed"
+            )
+            self._sparse_pool = ThreadPoolExecutor(
+                max_workers=self.config.sparse_workers,
+                thread_name_prefix="sparse-embed"
+            )
+            self._dense_fn = dense_embedder.encode
+            self._sparse_fn = sparse_embedder.encode
+        
+        logger.info(
+            f"EmbeddingExecutor initialized ({self.config.pool_type} pools, "
+            f"dense_workers={self.config.dense_workers}, "
+            f"sparse_workers={self.config.sparse_workers})"
+        )
+    
+    async def encode_dense(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate dense embeddings without blocking the event loop.
+        
+        Args:
+            texts: List of text strings to embed
+        
+        Returns:
+            Same as DenseEmbedder.encode
+        """
+        if not texts:
+            return empty_dense(self.dense_embedder.get_dimension())
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._dense_pool, self._dense_fn, texts)
+    
+    async def encode_sparse(self, texts: List[str]) -> SparseBatch:
+        """
+        Generate sparse embeddings without blocking the event loop.
+        
+        Args:
+            texts: List of text strings to embed
+        
+        Returns:
+            Same as SparseEmbedder.encode
+        """
+        if not texts:
+            return SparseBatch.empty()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._sparse_pool, self._sparse_fn, texts)
+    
+    async def encode(self, texts: List[str]) -> Tuple[np.ndarray, SparseBatch]:
+        """
+        Generate dense and sparse embeddings in parallel.
+        
+        Args:
+            texts: List of text strings to embed
+        
+        Returns:
+            Tuple of (dense_embeddings, sparse_embeddings)
+        """
+        dense, sparse = await asyncio.gather(
+            self.encode_dense(texts),
+            self.encode_sparse(texts)
+        )
+        return dense, sparse
+    
+    def shutdown(self, wait: bool = True):
+        """Shut down both worker pools"""
+        self._dense_pool.shutdown(wait=wait)
+        self._sparse_pool.shutdown(wait=wait)
+        logger.info("EmbeddingExecutor shut down")
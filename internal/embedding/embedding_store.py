@@ -0,0 +1,341 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+from .vectors import SparseBatch, SparseRow
+
+logger = logging.getLogger(__name__)
+
+# Compaction keeps this share of max_rows, so it runs once per many inserts
+_COMPACT_TARGET = 0.8
+
+
+class ChunkEmbeddingStore:
+    """
+    Persistent, content-addressed store of chunk embeddings.
+    
+    Lets re-ingestion skip the models for chunks whose text has not
+    changed. Entries are keyed by sha256(model_name, text), so a changed
+    chunk or a changed model is a miss and gets re-embedded.
+    
+    Layout under the store directory:
+    - dense.f16 (dense.<n>.f16 after compactions): append-only float16
+      matrix (rows x dim), read via np.memmap
+    - index.sqlite: key -> row for dense vectors, sparse vectors stored
+      inline as uint32 indices / float32 values blobs, and the name of
+      the current matrix file
+    
+    With max_rows set, the store is compacted once the dense matrix or
+    the sparse table exceeds it: rows no longer indexed (left behind by
+    edited chunks) are dropped, then the oldest vectors until
+    _COMPACT_TARGET * max_rows remain.
+    
+    Attributes:
+        path: Store directory
+        dim: Dense vector dimension
+        max_rows: Vectors kept per type; None = unbounded
+    """
+    def __init__(self, path: str, dim: int, max_rows: Optional[int] = None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.max_rows = max_rows
+        
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path / "index.sqlite"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS dense_index (key TEXT PRIMARY KEY, row INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sparse_entries ("
+            "key TEXT PRIMARY KEY, indices BLOB NOT NULL, vals BLOB NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._check_dimension()
+        self._db.commit()
+        
+        self._matrix_path = self.path / self._meta("matrix_file", "dense.f16")
+        self._remove_stale_matrices()
+        self._matrix: Optional[np.memmap] = None
+        self._rows = self._whole_rows()
+        self._sparse_rows = self._db.execute("SELECT COUNT(*) FROM sparse_entries").fetchone()[0]
+        
+        logger.info(f"ChunkEmbeddingStore opened at {self.path} ({self._rows} dense rows)")
+    
+    def _whole_rows(self) -> int:
+        """
+        Number of complete rows in the matrix file
+        
+        An append interrupted mid-write leaves a partial row at the end;
+        it is cut off so later appends stay row-aligned. Its rows were
+        never indexed (the index is committed after the write).
+        """
+        if not self._matrix_path.exists():
+            return 0
+        row_bytes = 2 * self.dim
+        size = self._matrix_path.stat().st_size
+        rows, partial = divmod(size, row_bytes)
+        if partial:
+            logger.warning(
+                f"Truncating {partial} trailing bytes of a partial row in {self._matrix_path}"
+            )
+            with open(self._matrix_path, "r+b") as f:
+                f.truncate(rows * row_bytes)
+                os.fsync(f.fileno())
+        return rows
+    
+    def _meta(self, name: str, default: str) -> str:
+        row = self._db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row is not None else default
+    
+    def _remove_stale_matrices(self):
+        """Delete matrix files left by an interrupted compaction"""
+        for candidate in self.path.glob("dense*.f16*"):
+            if candidate != self._matrix_path:
+                logger.info(f"Removing stale embedding matrix {candidate}")
+                candidate.unlink(missing_ok=True)
+    
+    def _check_dimension(self):
+        """Reject a store created for a different dense dimension"""
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO meta (name, value) VALUES ('dim', ?)", (str(self.dim),))
+        elif int(row[0]) != self.dim:
+            raise ValueError(
+                f"Embedding store at {self.path} has dimension {row[0]}, expected {self.dim}"
+            )
+    
+    @staticmethod
+    def _key(model_name: str, text: str) -> str:
+        return hashlib.sha256(f"{model_name}\x00{text}".encode("utf-8")).hexdigest()
+    
+    def _lookup(self, table: str, columns: str, keys: List[str]) -> Dict[str, tuple]:
+        """Fetch rows for keys in chunks below SQLite's variable limit"""
+        found = {}
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            for row in self._db.execute(
+                f"SELECT key, {columns} FROM {table} WHERE key IN ({placeholders})", batch
+            ):
+                found[row[0]] = row[1:]
+        return found
+    
+    def _dense_matrix(self) -> np.memmap:
+        """Memory-map the dense matrix, remapping after appends"""
+        if self._matrix is None or self._matrix.shape[0] != self._rows:
+            self._matrix = np.memmap(
+                self._matrix_path, dtype=np.float16, mode="r", shape=(self._rows, self.dim)
+            )
+        return self._matrix
+    
+    def get_dense(self, model_name: str, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up dense vectors.
+        
+        Args:
+            model_name: Dense model name
+            texts: Chunk texts
+        
+        Returns:
+            Tuple of (float32 matrix with one row per text, zero where not
+            stored; boolean mask of stored rows)
+        """
+        keys = [self._key(model_name, text) for text in texts]
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        found_mask = np.zeros(len(texts), dtype=bool)
+        with self._lock:
+            found = self._lookup("dense_index", "row", keys)
+            if not found:
+                return vectors, found_mask
+            positions = [i for i, key in enumerate(keys) if key in found]
+            rows = np.fromiter((found[keys[i]][0] for i in positions), dtype=np.int64)
+            vectors[positions] = self._dense_matrix()[rows]
+        found_mask[positions] = True
+        return vectors, found_mask
+    
+    def put_dense(self, model_name: str, texts: List[str], vectors: np.ndarray):
+        """
+        Append dense vectors to the matrix and index them.
+        
+        Args:
+            model_name: Dense model name
+            texts: Chunk texts
+            vectors: Matrix with one row per text
+        """
+        if not texts:
+            return
+        keys = [self._key(model_name, text) for text in texts]
+        block = np.ascontiguousarray(vectors, dtype=np.float16)
+        with self._lock:
+            with open(self._matrix_path, "ab") as f:
+                f.write(block.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            first_row = self._rows
+            self._rows += len(keys)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO dense_index (key, row) VALUES (?, ?)",
+                [(key, first_row + i) for i, key in enumerate(keys)]
+            )
+            self._db.commit()
+            if self.max_rows is not None and self._rows > self.max_rows:
+                self._compact_dense(int(self.max_rows * _COMPACT_TARGET))
+    
+    def get_sparse(self, model_name: str, texts: List[str]) -> List[Optional[SparseRow]]:
+        """
+        Look up sparse vectors.
+        
+        Args:
+            model_name: Sparse model name
+            texts: Chunk texts
+        
+        Returns:
+            SparseRow per text, or None where not stored
+        """
+        keys = [self._key(model_name, text) for text in texts]
+        with self._lock:
+            found = self._lookup("sparse_entries", "indices, vals", keys)
+        results = []
+        for key in keys:
+            if key not in found:
+                results.append(None)
+                continue
+            indices, values = found[key]
+            results.append(SparseRow(
+                np.frombuffer(indices, dtype=np.uint32),
+                np.frombuffer(values, dtype=np.float32)
+            ))
+        return results
+    
+    def put_sparse(self, model_name: str, texts: List[str], vectors: SparseBatch):
+        """
+        Store sparse vectors.
+        
+        Args:
+            model_name: Sparse model name
+            texts: Chunk texts
+            vectors: SparseBatch with one row per text
+        """
+        if not texts:
+            return
+        rows = [
+            (
+                self._key(model_name, text),
+                np.asarray(vector.indices, dtype=np.uint32).tobytes(),
+                np.asarray(vector.values, dtype=np.float32).tobytes(),
+            )
+            for text, vector in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO sparse_entries (key, indices, vals) VALUES (?, ?, ?)", rows
+            )
+            self._db.commit()
+            self._sparse_rows += len(rows)  # Upper bound; replaced keys are recounted on compaction
+            if self.max_rows is not None and self._sparse_rows > self.max_rows:
+                self._compact_sparse(int(self.max_rows * _COMPACT_TARGET))
+    
+    def compact(self, max_rows: Optional[int] = None):
+        """
+        Drop unindexed dense rows and, if a limit applies, the oldest vectors
+        
+        Args:
+            max_rows: Vectors to keep per type; defaults to max_rows
+                (unbounded if both are None)
+        """
+        keep = max_rows if max_rows is not None else self.max_rows
+        with self._lock:
+            self._compact_dense(keep)
+            self._compact_sparse(keep)
+    
+    def _compact_dense(self, keep: Optional[int]):
+        """
+        Rewrite the matrix with the newest indexed rows (caller holds the lock)
+        
+        The rows go to a new file; the index and the pointer to that file
+        are committed in one transaction before the old file is deleted,
+        so a crash leaves either the old or the new store intact.
+        """
+        started = time.perf_counter()
+        query = "SELECT key, row FROM dense_index ORDER BY row DESC"
+        entries = self._db.execute(
+            query + (" LIMIT ?" if keep is not None else ""), (keep,) if keep is not None else ()
+        ).fetchall()
+        entries.reverse()  # Keep write order, oldest first
+        
+        generation = int(self._meta("matrix_generation", "0")) + 1
+        new_path = self.path / f"dense.{generation}.f16"
+        old_matrix = self._dense_matrix() if self._rows else None
+        with open(new_path, "wb") as f:
+            for start in range(0, len(entries), 4096):
+                rows = np.fromiter((row for _, row in entries[start:start + 4096]), dtype=np.int64)
+                f.write(np.ascontiguousarray(old_matrix[rows]).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        self._matrix = old_matrix = None
+        
+        self._db.execute("DELETE FROM dense_index")
+        self._db.executemany(
+            "INSERT INTO dense_index (key, row) VALUES (?, ?)",
+            [(key, i) for i, (key, _) in enumerate(entries)]
+        )
+        self._db.executemany(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            [("matrix_file", new_path.name), ("matrix_generation", str(generation))]
+        )
+        self._db.commit()
+        
+        old_path, self._matrix_path = self._matrix_path, new_path
+        old_path.unlink(missing_ok=True)
+        dropped = self._rows - len(entries)
+        self._rows = len(entries)
+        logger.info(
+            f"Compacted dense embeddings: kept {self._rows} rows, dropped {dropped} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    
+    def _compact_sparse(self, keep: Optional[int]):
+        """Delete the oldest sparse entries beyond keep (caller holds the lock)"""
+        if keep is not None:
+            self._db.execute(
+                "DELETE FROM sparse_entries WHERE rowid IN ("
+                "SELECT rowid FROM sparse_entries ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                (keep,)
+            )
+            self._db.commit()
+        self._sparse_rows = self._db.execute("SELECT COUNT(*) FROM sparse_entries").fetchone()[0]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+        
+        Returns:
+            Dict with dense rows (stored and indexed), sparse entries,
+            max_rows and on-disk bytes
+        """
+        with self._lock:
+            indexed = self._db.execute("SELECT COUNT(*) FROM dense_index").fetchone()[0]
+            matrix_bytes = self._matrix_path.stat().st_size if self._matrix_path.exists() else 0
+            index_bytes = (self.path / "index.sqlite").stat().st_size
+            return {
+                "dense_rows": self._rows,
+                "dense_indexed": indexed,
+                "sparse_entries": self._sparse_rows,
+                "max_rows": self.max_rows,
+                "bytes": matrix_bytes + index_bytes,
+            }
+    
+    def close(self):
+        """Close the index"""
+        with self._lock:
+            self._matrix = None
+            self._db.close()
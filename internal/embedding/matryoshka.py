@@ -0,0 +1,87 @@
+import logging
+import math
+import time
+from typing import Dict, List, Sequence
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def truncate_and_normalize(vectors: np.ndarray, dim: int) -> np.ndarray:
+    """
+    Keep the first dim components of each vector and re-normalize to unit length
+    
+    Args:
+        vectors: float32 matrix (n, full_dim) or a single vector
+        dim: Target dimension
+    
+    Returns:
+        Contiguous float32 array with the last axis cut to dim
+    """
+    truncated = np.asarray(vectors, dtype=np.float32)[..., :dim]
+    norms = np.linalg.norm(truncated, axis=-1, keepdims=True)
+    return np.ascontiguousarray(truncated / np.maximum(norms, 1e-12))
+
+
+def recall_benchmark(
+    corpus: np.ndarray,
+    queries: np.ndarray,
+    dims: Sequence[int],
+    k: int = 10,
+    oversampling: float = 4.0
+) -> List[Dict[str, float]]:
+    """
+    Measure recall@k of truncated vectors against full-dimension search
+    
+    The baseline is exact top-k by full-vector cosine similarity. For each
+    dim, two variants are measured with exact (brute-force) search, so the
+    numbers isolate the effect of truncation from HNSW approximation:
+    - truncated: top-k on the truncated vectors alone
+    - two_stage: top-(k * oversampling) on truncated vectors, rescored
+      with full vectors (what Qdrant does with matryoshka_dim set)
+    
+    Args:
+        corpus: Normalized full vectors (n, full_dim)
+        queries: Normalized full query vectors (q, full_dim)
+        dims: Truncation dimensions to test
+        k: Results per query
+        oversampling: First-pass candidates per result for two_stage
+    
+    Returns:
+        One dict per dim with recall and per-query search time
+    """
+    k = min(k, len(corpus))
+    first_pass = min(len(corpus), math.ceil(k * oversampling))
+    baseline = np.argsort(-(queries @ corpus.T), axis=1)[:, :k]
+    
+    results = []
+    for dim in dims:
+        small_corpus = truncate_and_normalize(corpus, dim)
+        small_queries = truncate_and_normalize(queries, dim)
+        
+        started = time.perf_counter()
+        small_scores = small_queries @ small_corpus.T
+        candidates = np.argpartition(-small_scores, first_pass - 1, axis=1)[:, :first_pass]
+        truncated_top = np.take_along_axis(
+            candidates,
+            np.argsort(-np.take_along_axis(small_scores, candidates, axis=1), axis=1),
+            axis=1
+        )[:, :k]
+        rescored = np.einsum("qd,qcd->qc", queries, corpus[candidates])
+        two_stage_top = np.take_along_axis(candidates, np.argsort(-rescored, axis=1), axis=1)[:, :k]
+        elapsed = time.perf_counter() - started
+        
+        results.append({
+            "dim": dim,
+            "recall_truncated": _recall(baseline, truncated_top),
+            "recall_two_stage": _recall(baseline, two_stage_top),
+            "index_bytes_per_vector": dim * 4,
+            "ms_per_query": 1000 * elapsed / max(len(queries), 1),
+        })
+    return results
+
+
+def _recall(expected: np.ndarray, actual: np.ndarray) -> float:
+    hits = sum(len(set(e) & set(a)) for e, a in zip(expected.tolist(), actual.tolist()))
+    return hits / expected.size if expected.size else 0.0
+
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+
+BatchFn = Callable[[List[Any]], Union[Sequence[Any], Awaitable[Sequence[Any]]]]
+
+
+@dataclass
+class _PendingRequest:
+    items: List[Any]
+    future: asyncio.Future
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into batched model calls.
+    
+    Requests are queued; a background task takes the first waiting request,
+    then keeps collecting more until max_batch_size items are gathered or
+    max_wait_ms has passed since the first one arrived. The batch function
+    runs once for the whole batch and results are fanned back out to each
+    caller in order.
+    
+    While a batch is running, new requests accumulate in the queue, so
+    under load batches fill up without waiting for the deadline.
+    
+    Attributes:
+        name: Label used in logs and stats
+        batch_fn: Callable mapping a list of items to a same-length sequence
+            of results. Coroutine functions are awaited; plain functions run
+            on a dedicated worker thread.
+        max_batch_size: Item count that triggers an immediate dispatch
+        max_wait_ms: Longest time the first request waits for company
+    """
+    def __init__(
+        self,
+        name: str,
+        batch_fn: BatchFn,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+        
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        
+        self._is_async = asyncio.iscoroutinefunction(batch_fn)
+        self._thread: Optional[ThreadPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        
+        self._batches = 0
+        self._items = 0
+        self._largest_batch = 0
+        self._size_histogram: Dict[str, int] = {}
+        
+        logger.info(
+            f"MicroBatcher '{name}' initialized "
+            f"(max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms})"
+        )
+    
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit a single item and wait for its result.
+        
+        Args:
+            item: Input for batch_fn
+        
+        Returns:
+            The result for this item
+        """
+        results = await self.submit_many([item])
+        return results[0]
+    
+    async def submit_many(self, items: List[Any]) -> List[Any]:
+        """
+        Submit several items as one request; they stay in the same batch.
+        
+        Args:
+            items: Inputs for batch_fn
+        
+        Returns:
+            Results for these items, in order
+        """
+        if not items:
+            return []
+        
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(items=list(items), future=future))
+        return await future
+    
+    def _ensure_worker(self):
+        """Start the batching task on the running loop if needed"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+    
+    async def _run(self):
+        """Collect requests into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        max_wait = self.max_wait_ms / 1000
+        
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+            size = len(first.items)
+            deadline = loop.time() + max_wait
+            
+            while size < self.max_batch_size:
+                # Drain anything already waiting before sleeping
+                if self._queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        request = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    request = self._queue.get_nowait()
+                batch.append(request)
+                size += len(request.items)
+            
+            await self._dispatch(batch, size)
+    
+    async def _dispatch(self, batch: List[_PendingRequest], size: int):
+        """Run batch_fn once and resolve every request's future"""
+        items = [item for request in batch for item in request.items]
+        
+        try:
+            if self._is_async:
+                results = await self.batch_fn(items)
+            else:
+                if self._thread is None:
+                    self._thread = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix=f"batch-{self.name}"
+                    )
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(self._thread, self.batch_fn, items)
+            
+            if len(results) != len(items):
+                raise ValueError(
+                    f"{self.name} batch returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(f"MicroBatcher '{self.name}' batch of {size} failed: {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        
+        self._record(size)
+        
+        offset = 0
+        for request in batch:
+            count = len(request.items)
+            if not request.future.done():
+                request.future.set_result(list(results[offset:offset + count]))
+            offset += count
+        
+        logger.debug(f"MicroBatcher '{self.name}' ran batch of {size} from {len(batch)} requests")
+    
+    def _record(self, size: int):
+        """Update batch size metrics"""
+        self._batches += 1
+        self._items += size
+        self._largest_batch = max(self._largest_batch, size)
+        
+        # Power-of-two buckets: "1", "2", "3-4", "5-8", ...
+        upper = 1
+        while upper < size:
+            upper *= 2
+        bucket = str(upper) if upper <= 2 else f"{upper // 2 + 1}-{upper}"
+        self._size_histogram[bucket] = self._size_histogram.get(bucket, 0) + 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get achieved batch size metrics.
+        
+        Returns:
+            Dict with batch and item counts, mean and largest batch size,
+            a power-of-two histogram of batch sizes and the current queue depth
+        """
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "batches": self._batches,
+            "items": self._items,
+            "mean_batch_size": self._items / self._batches if self._batches else 0.0,
+            "largest_batch": self._largest_batch,
+            "batch_size_histogram": dict(self._size_histogram),
+            "queued": self._queue.qsize() if self._queue else 0,
+        }
+    
+    async def close(self):
+        """Stop the batching task and release the worker thread"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        
+        if self._queue is not None:
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if not request.future.done():
+                    request.future.cancel()
+        
+        if self._thread is not None:
+            self._thread.shutdown(wait=False)
+            self._thread = None
@@ -0,0 +1,282 @@
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import struct
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+from internal.config import QueryCacheConfig
+from .vectors import SparseRow
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache:
+    """
+    Two-tier cache for query embeddings.
+    
+    Tier 1 is an in-process LRU; tier 2 is an optional SQLite file that
+    survives restarts and is shared by workers on the same host. Entries are
+    keyed by (model_name, normalized query) and expire after ttl_seconds.
+    A disk hit is promoted into the LRU.
+    
+    Async callers use aget/aput: the LRU is checked on the event loop and
+    SQLite work runs on a dedicated single-thread executor. The disk tier
+    is trimmed to disk_max_entries every disk_prune_interval inserts.
+    
+    Values are either dense vectors (np.ndarray) or sparse vectors
+    (SparseRow). They are copied on insert so a cached row does not keep
+    the whole batch it was sliced from alive.
+    
+    Attributes:
+        config: QueryCacheConfig with size, TTL and disk settings
+    """
+    def __init__(self, config: QueryCacheConfig):
+        self.config = config
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._disk_executor: Optional[ThreadPoolExecutor] = None
+        self._inserts_since_prune = 0
+        
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._expired = 0
+        
+        if config.disk_path:
+            path = Path(config.disk_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings ("
+                "key TEXT PRIMARY KEY, created_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_query_embeddings_created "
+                "ON query_embeddings (created_at)"
+            )
+            self._prune()
+            self._db.commit()
+            self._disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="query-cache")
+            logger.info(f"Query embedding disk cache: {path}")
+        
+        logger.info(
+            f"QueryEmbeddingCache initialized (max_entries={config.max_entries}, "
+            f"ttl_seconds={config.ttl_seconds})"
+        )
+    
+    def normalize(self, query: str) -> str:
+        """
+        Normalize a query so trivially different spellings share an entry.
+        
+        Applies NFKC, collapses whitespace and, if configured, case-folds
+        (safe for the uncased BERT-family models used here).
+        """
+        normalized = " ".join(unicodedata.normalize("NFKC", query).split())
+        if self.config.lowercase:
+            normalized = normalized.casefold()
+        return normalized
+    
+    def _key(self, model_name: str, query: str) -> str:
+        digest = hashlib.sha256(f"{model_name}\x00{self.normalize(query)}".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _is_expired(self, created_at: float) -> bool:
+        return (
+            self.config.ttl_seconds is not None
+            and time.time() - created_at > self.config.ttl_seconds
+        )
+    
+    def get(self, model_name: str, query: str) -> Optional[Any]:
+        """
+        Look up a cached embedding (blocking on the disk tier).
+        
+        Args:
+            model_name: Model that produced the embedding
+            query: Raw query text (normalized internally)
+        
+        Returns:
+            Cached embedding or None on miss/expiry
+        """
+        key = self._key(model_name, query)
+        value = self._memory_get(key)
+        if value is None and self._db is not None:
+            value = self._disk_get(key)
+        if value is None:
+            self._count_miss()
+        return value
+    
+    async def aget(self, model_name: str, query: str) -> Optional[Any]:
+        """Like get, with the disk lookup off the event loop"""
+        key = self._key(model_name, query)
+        value = self._memory_get(key)
+        if value is None and self._db is not None:
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(self._disk_executor, self._disk_get, key)
+        if value is None:
+            self._count_miss()
+        return value
+    
+    def put(self, model_name: str, query: str, value: Any):
+        """
+        Store an embedding in both tiers (blocking on the disk tier).
+        
+        Args:
+            model_name: Model that produced the embedding
+            query: Raw query text (normalized internally)
+            value: Dense vector or SparseRow
+        """
+        key, created_at, value = self._memory_store(model_name, query, value)
+        if self._db is not None:
+            self._disk_put(key, created_at, value)
+    
+    async def aput(self, model_name: str, query: str, value: Any):
+        """Like put, with the disk write off the event loop"""
+        key, created_at, value = self._memory_store(model_name, query, value)
+        if self._db is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._disk_executor, self._disk_put, key, created_at, value)
+    
+    def _memory_get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if not self._is_expired(created_at):
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return value
+            del self._memory[key]
+            self._expired += 1
+            return None
+    
+    def _memory_store(self, model_name: str, query: str, value: Any) -> Tuple[str, float, Any]:
+        key = self._key(model_name, query)
+        created_at = time.time()
+        value = _compact(value)
+        with self._lock:
+            self._memory_put(key, created_at, value)
+        return key, created_at, value
+    
+    def _count_miss(self):
+        with self._lock:
+            self._misses += 1
+    
+    def _disk_get(self, key: str) -> Optional[Any]:
+        """Read the disk tier, promoting a hit into the LRU"""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT created_at, value FROM query_embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            created_at, blob = row
+            if self._is_expired(created_at):
+                self._db.execute("DELETE FROM query_embeddings WHERE key = ?", (key,))
+                self._db.commit()
+                with self._lock:
+                    self._expired += 1
+                return None
+        
+        value = _deserialize(blob)
+        with self._lock:
+            self._memory_put(key, created_at, value)
+            self._disk_hits += 1
+        return value
+    
+    def _disk_put(self, key: str, created_at: float, value: Any):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO query_embeddings (key, created_at, value) VALUES (?, ?, ?)",
+                (key, created_at, _serialize(value))
+            )
+            self._inserts_since_prune += 1
+            if self._inserts_since_prune >= self.config.disk_prune_interval:
+                self._prune()
+            self._db.commit()
+    
+    def _prune(self):
+        """Drop the oldest rows beyond disk_max_entries (caller holds the db lock)"""
+        self._db.execute(
+            "DELETE FROM query_embeddings WHERE key IN ("
+            "SELECT key FROM query_embeddings ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.config.disk_max_entries,)
+        )
+        self._inserts_since_prune = 0
+    
+    def _memory_put(self, key: str, created_at: float, value: Any):
+        """Insert into the LRU tier (caller holds the lock)"""
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.max_entries:
+            self._memory.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with tier sizes, hits per tier, misses, expirations and hit_rate
+        """
+        disk_size = None
+        if self._db is not None:
+            with self._db_lock:
+                disk_size = self._db.execute("SELECT COUNT(*) FROM query_embeddings").fetchone()[0]
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            return {
+                "memory_size": len(self._memory),
+                "disk_size": disk_size,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "hit_rate": (self._memory_hits + self._disk_hits) / lookups if lookups else 0.0,
+            }
+    
+    def close(self):
+        """Finish pending disk writes and close the disk tier"""
+        if self._disk_executor is not None:
+            self._disk_executor.shutdown(wait=True)
+            self._disk_executor = None
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+
+
+def _compact(value: Any) -> Any:
+    """Copy array views into standalone arrays"""
+    if isinstance(value, SparseRow):
+        return SparseRow(np.array(value.indices), np.array(value.values))
+    return np.array(value, dtype=np.float32)
+
+
+def _serialize(value: Any) -> bytes:
+    """Encode a dense (b"D") or sparse (b"S") embedding as bytes"""
+    if isinstance(value, SparseRow):
+        indices = np.asarray(value.indices, dtype=np.uint32)
+        values = np.asarray(value.values, dtype=np.float32)
+        return b"S" + struct.pack("<I", len(indices)) + indices.tobytes() + values.tobytes()
+    return b"D" + np.asarray(value, dtype=np.float32).tobytes()
+
+
+def _deserialize(blob: bytes) -> Any:
+    """Inverse of _serialize"""
+    kind, payload = blob[:1], blob[1:]
+    if kind == b"S":
+        (count,) = struct.unpack("<I", payload[:4])
+        indices = np.frombuffer(payload[4:4 + 4 * count], dtype=np.uint32)
+        values = np.frombuffer(payload[4 + 4 * count:], dtype=np.float32)
+        return SparseRow(indices.copy(), values.copy())
+    return np.frombuffer(payload, dtype=np.float32).copy()
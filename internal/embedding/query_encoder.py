@@ -0,0 +1,130 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+from internal.config import QueryBatchingConfig
+from .embedding_executor import EmbeddingExecutor
+from .micro_batcher import MicroBatcher
+from .query_cache import QueryEmbeddingCache
+from .vectors import SparseRow
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEncoder:
+    """
+    Encode search queries into dense and sparse vectors.
+    
+    Sits in front of the EmbeddingExecutor for the query path. An optional
+    QueryEmbeddingCache is checked first; a hit skips inference for that
+    model entirely. When batching is enabled, concurrent cache misses are
+    coalesced by one MicroBatcher per model so each forward pass serves
+    many requests.
+    
+    Attributes:
+        executor: EmbeddingExecutor that runs the models
+        config: QueryBatchingConfig with batching settings
+        cache: Optional QueryEmbeddingCache
+    """
+    def __init__(
+        self,
+        executor: EmbeddingExecutor,
+        config: Optional[QueryBatchingConfig] = None,
+        cache: Optional[QueryEmbeddingCache] = None
+    ):
+        self.executor = executor
+        self.config = config or QueryBatchingConfig()
+        self.cache = cache
+        self.dense_model_name = executor.dense_embedder.config.model_name
+        self.sparse_model_name = executor.sparse_embedder.config.model_name
+        
+        self.dense_batcher: Optional[MicroBatcher] = None
+        self.sparse_batcher: Optional[MicroBatcher] = None
+        
+        if self.config.enabled:
+            self.dense_batcher = MicroBatcher(
+                "dense",
+                executor.encode_dense,
+                max_batch_size=self.config.max_batch_size,
+                max_wait_ms=self.config.max_wait_ms
+            )
+            self.sparse_batcher = MicroBatcher(
+                "sparse",
+                executor.encode_sparse,
+                max_batch_size=self.config.max_batch_size,
+                max_wait_ms=self.config.max_wait_ms
+            )
+        
+        logger.info(f"QueryEncoder initialized (batching={self.config.enabled})")
+    
+    async def encode(self, query: str) -> Tuple[np.ndarray, SparseRow]:
+        """
+        Generate dense and sparse embeddings for a single query.
+        
+        Args:
+            query: Query text
+        
+        Returns:
+            Tuple of (dense_embedding, sparse_embedding): a float32 vector
+            and a SparseRow
+        """
+        dense = sparse = None
+        if self.cache:
+            dense, sparse = await asyncio.gather(
+                self.cache.aget(self.dense_model_name, query),
+                self.cache.aget(self.sparse_model_name, query)
+            )
+            if dense is not None and sparse is not None:
+                return dense, sparse
+        
+        if dense is None and sparse is None:
+            dense, sparse = await asyncio.gather(
+                self._encode_dense(query),
+                self._encode_sparse(query)
+            )
+            await asyncio.gather(
+                self._cache_put(self.dense_model_name, query, dense),
+                self._cache_put(self.sparse_model_name, query, sparse)
+            )
+        elif dense is None:
+            dense = await self._encode_dense(query)
+            await self._cache_put(self.dense_model_name, query, dense)
+        else:
+            sparse = await self._encode_sparse(query)
+            await self._cache_put(self.sparse_model_name, query, sparse)
+        
+        return dense, sparse
+    
+    async def _encode_dense(self, query: str) -> np.ndarray:
+        if self.dense_batcher:
+            return await self.dense_batcher.submit(query)
+        return (await self.executor.encode_dense([query]))[0]
+    
+    async def _encode_sparse(self, query: str) -> SparseRow:
+        if self.sparse_batcher:
+            return await self.sparse_batcher.submit(query)
+        return (await self.executor.encode_sparse([query]))[0]
+    
+    async def _cache_put(self, model_name: str, query: str, value: Any):
+        if self.cache:
+            await self.cache.aput(model_name, query, value)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Batching metrics per model"""
+        if not self.dense_batcher or not self.sparse_batcher:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "dense": self.dense_batcher.stats(),
+            "sparse": self.sparse_batcher.stats(),
+        }
+    
+    async def close(self):
+        """Stop the batchers and close the cache"""
+        if self.dense_batcher:
+            await self.dense_batcher.close()
+        if self.sparse_batcher:
+            await self.sparse_batcher.close()
+        if self.cache:
+            self.cache.close()
@@ -1,9 +1,10 @@
-from typing import List, Dict
+from typing import List
 import logging
 from fastembed import SparseTextEmbedding
 
 from internal.config import SparseEmbeddingConfig
 from internal.token_counter import TokenCounter
+from .vectors import SparseBatch, SparseRow
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +29,10 @@ class SparseEmbedder:
     
     Note:
         Sparse vectors use (indices, values) representation:
-        - indices: List of token IDs (non-zero positions)
-        - values: List of token weights (relevance scores)
-        Most positions are zero, making storage efficient
+        - indices: Token IDs (non-zero positions)
+        - values: Token weights (relevance scores)
+        Most positions are zero, making storage efficient. A batch is
+        returned as a CSR SparseBatch.
     """
     def __init__(self, config: SparseEmbeddingConfig):
         self.config = config
@@ -53,7 +55,7 @@ class SparseEmbedder:
         logger.info(f"  Vocab size: {self.get_dimension()}")
         logger.info(f"  Max sequence length: {self.max_seq_length}")
     
-    def encode(self, texts: List[str]) -> List[Dict[str, List]]:
+    def encode(self, texts: List[str]) -> SparseBatch:
         """
         Generate sparse embeddings for a list of texts.
         
@@ -65,9 +67,9 @@ class SparseEmbedder:
             texts: List of text strings to embed
             
         Returns:
-            List of dictionaries with 'indices' and 'values' keys:
-            - indices: List[int] - Non-zero token IDs
-            - values: List[float] - Corresponding weights/scores
+            SparseBatch with one row per text:
+            - indices: Non-zero token IDs
+            - values: Corresponding weights/scores
             
         Note:
             - Texts longer than max_seq_length are truncated
@@ -75,7 +77,7 @@ class SparseEmbedder:
             - Returns are compatible with Qdrant sparse vector storage
         """
         if not texts:
-            return []
+            return SparseBatch.empty()
         
         logger.info(f"Generating sparse embeddings for {len(texts)} texts")
         
@@ -96,13 +98,10 @@ class SparseEmbedder:
             batch_generator = self.model.embed(batch, batch_size=batch_size)
             
             for sparse_vec in batch_generator:
-                results.append({
-                    "indices": sparse_vec.indices.tolist(),
-                    "values": sparse_vec.values.tolist()
-                })
+                results.append(SparseRow(sparse_vec.indices, sparse_vec.values))
         
         logger.info(f"Generated {len(results)} sparse vectors")
-        return results
+        return SparseBatch.from_rows(results)
     
     def get_dimension(self) -> int:
         """
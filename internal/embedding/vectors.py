@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple, Sequence, Tuple, Union
+import numpy as np
+
+
+class SparseRow(NamedTuple):
+    """One sparse vector: non-zero token IDs and their weights"""
+    indices: np.ndarray
+    values: np.ndarray
+
+
+@dataclass
+class SparseBatch:
+    """
+    A batch of sparse vectors in CSR layout.
+    
+    Row i's non-zeros are indices[indptr[i]:indptr[i + 1]] with weights
+    values[indptr[i]:indptr[i + 1]]. Three flat arrays instead of one dict
+    of Python lists per vector keep batches cheap to pickle between
+    processes and to hand to Qdrant.
+    
+    Indexing with an int returns a SparseRow of array views; slicing and
+    take() return a new SparseBatch.
+    
+    Attributes:
+        indptr: int64 row offsets, length len(batch) + 1
+        indices: uint32 token IDs of all rows, concatenated
+        values: float32 weights of all rows, concatenated
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    values: np.ndarray
+    
+    @classmethod
+    def empty(cls) -> "SparseBatch":
+        return cls(
+            indptr=np.zeros(1, dtype=np.int64),
+            indices=np.empty(0, dtype=np.uint32),
+            values=np.empty(0, dtype=np.float32)
+        )
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[np.ndarray, np.ndarray]]) -> "SparseBatch":
+        """Build a batch from (indices, values) pairs, e.g. SparseRows"""
+        if not rows:
+            return cls.empty()
+        lengths = np.fromiter((len(indices) for indices, _ in rows), dtype=np.int64, count=len(rows))
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=np.concatenate([np.asarray(i, dtype=np.uint32) for i, _ in rows]),
+            values=np.concatenate([np.asarray(v, dtype=np.float32) for _, v in rows])
+        )
+    
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+    
+    def __iter__(self) -> Iterator[SparseRow]:
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __getitem__(self, key: Union[int, slice]) -> Union[SparseRow, "SparseBatch"]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return self.take(np.arange(start, stop, step))
+            stop = max(start, stop)
+            begin, end = self.indptr[start], self.indptr[stop]
+            return SparseBatch(
+                indptr=self.indptr[start:stop + 1] - begin,
+                indices=self.indices[begin:end],
+                values=self.values[begin:end]
+            )
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("SparseBatch index out of range")
+        begin, end = self.indptr[key], self.indptr[key + 1]
+        return SparseRow(self.indices[begin:end], self.values[begin:end])
+    
+    def take(self, positions: Sequence[int]) -> "SparseBatch":
+        """Select rows by position"""
+        return SparseBatch.from_rows([self[int(i)] for i in positions])
+
+
+def empty_dense(dim: int) -> np.ndarray:
+    """A (0, dim) float32 matrix, the dense result for no texts"""
+    return np.empty((0, dim), dtype=np.float32)
@@ -1,9 +1,10 @@
 """
 URL fetching package with bot detection bypass capabilities.
 
-Provides enhanced HTTP requests with rotating User-Agents, realistic browser headers,
-and intelligent retry logic to avoid bot detection. Falls back to Playwright browser
-automation for advanced bot protection systems.
+Provides non-blocking HTTP requests (httpx, pooled connections, HTTP/2) with rotating
+User-Agents, realistic browser headers, and intelligent retry logic to avoid bot
+detection. Falls back to Playwright browser automation for advanced bot protection
+systems.
 
 Example:
     >>> from internal.fetcher import URLFetcher, fetch_url_content
@@ -19,6 +20,8 @@ Example:
 from internal.fetcher.constants import USER_AGENTS
 from internal.fetcher.config import URLFetcherConfig
 from internal.fetcher.http_fetcher import HTTPFetcher
+from internal.fetcher.scheduler import PolitenessScheduler, RobotsDisallowedError
+from internal.fetcher.async_http_fetcher import AsyncHTTPFetcher, ResponseTooLargeError
 from internal.fetcher.playwright_fetcher import PlaywrightFetcher
 from internal.fetcher.fetcher import URLFetcher
 from internal.fetcher.utils import (
@@ -33,11 +36,16 @@ __all__ = [
     # Fetcher classes
     "URLFetcher",
     "HTTPFetcher",
+    "AsyncHTTPFetcher",
+    "PolitenessScheduler",
     "PlaywrightFetcher",
     # Utility functions
     "fetch_url_content",
     "fetch_url_content_async",
     "load_fetcher_config",
+    # Exceptions
+    "ResponseTooLargeError",
+    "RobotsDisallowedError",
     # Constants
     "USER_AGENTS",
 ]
@@ -0,0 +1,205 @@
+"""
+Asynchronous HTTP URL fetcher built on httpx.
+
+Provides non-blocking fetching with a shared connection pool, HTTP/2,
+per-host concurrency limits, asyncio-based retry backoff and a cap on
+response size. Used by URLFetcher for all plain HTTP requests.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from internal.fetcher.config import URLFetcherConfig
+from internal.fetcher.constants import (
+    USER_AGENTS,
+    BROWSER_HEADERS,
+    BOT_DETECTION_STATUS_CODES,
+)
+from internal.fetcher.scheduler import PolitenessScheduler
+
+logger = logging.getLogger(__name__)
+
+# Negotiated by httpx itself (compression support, HTTP/2 framing)
+_TRANSPORT_HEADERS = {"Accept-Encoding", "Connection"}
+
+
+class ResponseTooLargeError(httpx.HTTPError):
+    """Raised when a response body exceeds max_response_bytes."""
+
+
+class AsyncHTTPFetcher:
+    """
+    httpx-based URL fetcher with retry logic.
+
+    Features:
+    - One connection pool (keep-alive, HTTP/2 when available) shared by
+      all requests of this fetcher
+    - Per-host politeness (PolitenessScheduler): token bucket,
+      concurrency cap and robots.txt, with independent hosts in parallel
+    - Rotating User-Agent strings and realistic browser headers
+    - Retry with exponential backoff that never blocks the event loop
+    - Responses larger than max_response_bytes are aborted
+    """
+
+    def __init__(self, config: URLFetcherConfig):
+        """
+        Initialize the async HTTP fetcher.
+
+        Args:
+            config: Configuration object
+        """
+        self.config = config
+        self._client: Optional[httpx.AsyncClient] = None
+        self.scheduler = PolitenessScheduler(config, robots_loader=self._load_robots)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled httpx client."""
+        if self._client is None:
+            http2 = self.config.http2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("h2 not installed, using HTTP/1.1. Run: pip install 'httpx[http2]'")
+                    http2 = False
+
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_concurrency,
+                    max_keepalive_connections=self.config.max_concurrency,
+                ),
+            )
+        return self._client
+
+    def _build_headers(self) -> Dict[str, str]:
+        """
+        Build realistic browser headers for the request.
+
+        Returns:
+            Dictionary of HTTP headers
+        """
+        user_agent = (
+            random.choice(USER_AGENTS)
+            if self.config.rotate_user_agents
+            else USER_AGENTS[0]
+        )
+        headers = {"User-Agent": user_agent, **BROWSER_HEADERS}
+        for name in _TRANSPORT_HEADERS:
+            headers.pop(name, None)
+        return headers
+
+    async def _load_robots(self, robots_url: str) -> Optional[str]:
+        """Fetch a robots.txt without retries; None if the site has none."""
+        response, body = await self._get(robots_url, self._build_headers(), self.config.timeout)
+        if response.status_code != 200:
+            return None
+        return body.decode(response.encoding or "utf-8", errors="replace")
+
+    async def _get(self, url: str, headers: Dict[str, str], timeout: float) -> Tuple[httpx.Response, bytes]:
+        """
+        Send one GET request and read the body up to max_response_bytes.
+
+        Returns:
+            The (closed) response and its decompressed body
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds max_response_bytes
+        """
+        limit = self.config.max_response_bytes
+        async with self._get_client().stream("GET", url, headers=headers, timeout=timeout) as response:
+            declared = response.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > limit:
+                raise ResponseTooLargeError(f"{url} is {declared} bytes (limit {limit})")
+
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) > limit:
+                    raise ResponseTooLargeError(f"{url} exceeds {limit} bytes")
+
+        return response, bytes(body)
+
+    async def fetch(self, url: str, timeout: Optional[int] = None, priority: int = 0) -> str:
+        """
+        Fetch content using httpx.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            priority: Scheduling priority; lower values are served first
+
+        Returns:
+            HTML content as string
+
+        Raises:
+            httpx.HTTPError: If request fails after all retries
+            RobotsDisallowedError: If robots.txt disallows the URL
+        """
+        timeout = timeout or self.config.timeout
+        headers = self._build_headers()
+
+        for attempt in range(self.config.max_retries + 1):
+            delay = self.config.retry_delay * (self.config.retry_backoff ** attempt)
+            can_retry = attempt < self.config.max_retries
+            try:
+                async with self.scheduler.slot(url, priority):
+                    logger.debug(
+                        f"Fetching URL (attempt {attempt + 1}/{self.config.max_retries + 1}): {url}"
+                    )
+                    response, body = await self._get(url, headers, timeout)
+
+                if response.status_code in BOT_DETECTION_STATUS_CODES and can_retry:
+                    logger.warning(
+                        f"Request blocked with {response.status_code} (attempt {attempt + 1}), "
+                        f"retrying in {delay:.1f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                    # Rotate User-Agent for next attempt
+                    if self.config.rotate_user_agents:
+                        headers = self._build_headers()
+                    continue
+
+                response.raise_for_status()
+
+                text = body.decode(response.encoding or "utf-8", errors="replace")
+                logger.info(
+                    f"Successfully fetched {len(text)} chars from {url} "
+                    f"(attempt {attempt + 1}, {response.http_version})"
+                )
+                return text
+
+            except ResponseTooLargeError:
+                raise
+
+            except httpx.HTTPStatusError as e:
+                if not can_retry:
+                    raise
+                logger.warning(
+                    f"HTTP error {e.response.status_code} "
+                    f"(attempt {attempt + 1}), retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+
+            except httpx.TransportError as e:
+                if not can_retry:
+                    raise
+                logger.warning(
+                    f"{type(e).__name__} (attempt {attempt + 1}), "
+                    f"retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+
+        raise httpx.HTTPError(f"Failed to fetch {url}")
+
+    async def close(self):
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.debug("AsyncHTTPFetcher client closed")
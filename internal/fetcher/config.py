@@ -5,7 +5,8 @@ Provides the URLFetcherConfig dataclass with validation for all
 fetching parameters including timeouts, retries, and feature toggles.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 
 from internal.fetcher.constants import (
     DEFAULT_TIMEOUT,
@@ -15,6 +16,16 @@ from internal.fetcher.constants import (
     DEFAULT_REQUEST_DELAY,
     DEFAULT_PLAYWRIGHT_TIMEOUT,
     DEFAULT_PLAYWRIGHT_WAIT_UNTIL,
+    DEFAULT_PLAYWRIGHT_CONTEXTS,
+    DEFAULT_PLAYWRIGHT_CONTEXT_MAX_USES,
+    DEFAULT_PLAYWRIGHT_READY_TIMEOUT,
+    DEFAULT_PLAYWRIGHT_MIN_TEXT_CHARS,
+    PLAYWRIGHT_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_PER_HOST,
+    DEFAULT_MAX_RESPONSE_BYTES,
+    DEFAULT_HOST_BURST,
+    DEFAULT_MAX_CRAWL_DELAY,
 )
 
 
@@ -31,6 +42,20 @@ class URLFetcherConfig:
     use_playwright_fallback: bool = True
     playwright_timeout: int = DEFAULT_PLAYWRIGHT_TIMEOUT
     playwright_wait_until: str = DEFAULT_PLAYWRIGHT_WAIT_UNTIL
+    playwright_contexts: int = DEFAULT_PLAYWRIGHT_CONTEXTS
+    playwright_context_max_uses: int = DEFAULT_PLAYWRIGHT_CONTEXT_MAX_USES
+    playwright_ready_timeout: float = DEFAULT_PLAYWRIGHT_READY_TIMEOUT
+    playwright_min_text_chars: int = DEFAULT_PLAYWRIGHT_MIN_TEXT_CHARS
+    playwright_block_resources: List[str] = field(
+        default_factory=lambda: list(PLAYWRIGHT_BLOCKED_RESOURCE_TYPES)
+    )
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    max_per_host: int = DEFAULT_MAX_PER_HOST
+    http2: bool = True
+    max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES
+    host_burst: int = DEFAULT_HOST_BURST
+    robots_txt: bool = True
+    max_crawl_delay: float = DEFAULT_MAX_CRAWL_DELAY
 
     def __post_init__(self):
         """Validate configuration values."""
@@ -42,3 +67,19 @@ class URLFetcherConfig:
             raise ValueError("retry_delay cannot be negative")
         if self.retry_backoff < 1.0:
             raise ValueError("retry_backoff must be at least 1.0")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self.max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1")
+        if self.max_response_bytes < 1:
+            raise ValueError("max_response_bytes must be at least 1")
+        if self.host_burst < 1:
+            raise ValueError("host_burst must be at least 1")
+        if self.max_crawl_delay < 0:
+            raise ValueError("max_crawl_delay cannot be negative")
+        if self.playwright_contexts < 1:
+            raise ValueError("playwright_contexts must be at least 1")
+        if self.playwright_context_max_uses < 1:
+            raise ValueError("playwright_context_max_uses must be at least 1")
+        if self.playwright_ready_timeout < 0:
+            raise ValueError("playwright_ready_timeout cannot be negative")
@@ -27,6 +27,21 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.0 Edg/120.0.0.0",
 ]
 
+# Headers a desktop browser sends when navigating to a page
+BROWSER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
 # Default configuration values
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
@@ -34,7 +49,16 @@ DEFAULT_RETRY_DELAY = 1.0
 DEFAULT_RETRY_BACKOFF = 2.0
 DEFAULT_REQUEST_DELAY = 0.0
 DEFAULT_PLAYWRIGHT_TIMEOUT = 30
-DEFAULT_PLAYWRIGHT_WAIT_UNTIL = "networkidle"
+DEFAULT_PLAYWRIGHT_WAIT_UNTIL = "domcontentloaded"
+DEFAULT_PLAYWRIGHT_CONTEXTS = 2
+DEFAULT_PLAYWRIGHT_CONTEXT_MAX_USES = 50
+DEFAULT_PLAYWRIGHT_READY_TIMEOUT = 10.0
+DEFAULT_PLAYWRIGHT_MIN_TEXT_CHARS = 200
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_PER_HOST = 2
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+DEFAULT_HOST_BURST = 1
+DEFAULT_MAX_CRAWL_DELAY = 30.0
 
 # HTTP status codes that indicate bot detection or rate limiting
 BOT_DETECTION_STATUS_CODES = [401, 403, 429]
@@ -43,6 +67,17 @@ BOT_DETECTION_STATUS_CODES = [401, 403, 429]
 VIEWPORT_WIDTH = 1920
 VIEWPORT_HEIGHT = 1080
 
+# Playwright resource types aborted by request interception
+PLAYWRIGHT_BLOCKED_RESOURCE_TYPES = ["image", "font", "media"]
+
+# Page titles of bot-check interstitials that replace themselves with the real page
+PLAYWRIGHT_CHALLENGE_TITLES = [
+    "just a moment",
+    "checking your browser",
+    "attention required",
+    "please wait",
+]
+
 # Playwright browser launch arguments
 PLAYWRIGHT_BROWSER_ARGS = [
     '--no-sandbox',
@@ -8,10 +8,10 @@ to browser automation when bot detection is encountered.
 import logging
 from typing import Optional
 
-import requests
+import httpx
 
 from internal.fetcher.config import URLFetcherConfig
-from internal.fetcher.http_fetcher import HTTPFetcher
+from internal.fetcher.async_http_fetcher import AsyncHTTPFetcher
 from internal.fetcher.playwright_fetcher import PlaywrightFetcher
 from internal.fetcher.constants import BOT_DETECTION_STATUS_CODES
 
@@ -23,10 +23,11 @@ class URLFetcher:
     Enhanced URL fetcher with bot detection bypass capabilities.
 
     Features:
+    - Non-blocking HTTP with a pooled httpx client (HTTP/2, keep-alive)
     - Rotating User-Agent strings
     - Realistic browser headers
     - Intelligent retry logic with exponential backoff
-    - Configurable delays between requests
+    - Configurable per-host delays and concurrency limits
     - Playwright fallback for advanced bot detection
 
     Example:
@@ -43,7 +44,7 @@ class URLFetcher:
             config: Configuration object. If None, uses default configuration.
         """
         self.config = config or URLFetcherConfig()
-        self._http_fetcher: Optional[HTTPFetcher] = None
+        self._http_fetcher: Optional[AsyncHTTPFetcher] = None
         self._playwright_fetcher: Optional[PlaywrightFetcher] = None
 
         logger.info(
@@ -52,12 +53,18 @@ class URLFetcher:
             f"playwright_fallback={self.config.use_playwright_fallback}"
         )
 
-    def _get_http_fetcher(self) -> HTTPFetcher:
+    def _get_http_fetcher(self) -> AsyncHTTPFetcher:
         """Get or create HTTP fetcher instance."""
         if self._http_fetcher is None:
-            self._http_fetcher = HTTPFetcher(self.config)
+            self._http_fetcher = AsyncHTTPFetcher(self.config)
         return self._http_fetcher
 
+    def _get_playwright_fetcher(self) -> PlaywrightFetcher:
+        """Get or create the Playwright fetcher (one browser pool per URLFetcher)."""
+        if self._playwright_fetcher is None:
+            self._playwright_fetcher = PlaywrightFetcher(self.config)
+        return self._playwright_fetcher
+
     async def _fetch_with_playwright(self, url: str) -> str:
         """
         Fetch content using Playwright browser automation (async).
@@ -68,12 +75,19 @@ class URLFetcher:
         Returns:
             HTML content as string
         """
-        if self._playwright_fetcher is None:
-            self._playwright_fetcher = PlaywrightFetcher(self.config)
+        return await self._get_playwright_fetcher().fetch(url)
+
+    async def start(self):
+        """
+        Warm the Playwright browser pool ahead of the first fallback fetch.
 
-        return await self._playwright_fetcher.fetch(url)
+        Long-lived fetchers (e.g. the server's) call this once at startup;
+        short-lived ones launch the browser lazily when first needed.
+        """
+        if self.config.use_playwright_fallback:
+            await self._get_playwright_fetcher().start()
 
-    def _should_fallback_to_playwright(self, error: requests.HTTPError) -> bool:
+    def _should_fallback_to_playwright(self, error: httpx.HTTPStatusError) -> bool:
         """
         Determine if we should fallback to Playwright based on the error.
 
@@ -91,29 +105,31 @@ class URLFetcher:
 
         return error.response.status_code in BOT_DETECTION_STATUS_CODES
 
-    async def fetch(self, url: str, timeout: Optional[int] = None) -> str:
+    async def fetch(self, url: str, timeout: Optional[int] = None, priority: int = 0) -> str:
         """
         Fetch content from a URL with retry logic and bot detection bypass.
 
-        First tries with requests library, then falls back to Playwright
-        if configured and requests fail with bot detection errors.
+        First tries with the async httpx fetcher, then falls back to
+        Playwright if configured and requests fail with bot detection errors.
 
         Args:
             url: URL to fetch
             timeout: Request timeout in seconds. If None, uses config timeout.
+            priority: Scheduling priority among queued requests; lower
+                values are served first
 
         Returns:
             HTML content as string
 
         Raises:
-            requests.RequestException: If all attempts fail
+            httpx.HTTPError: If all attempts fail
+            RobotsDisallowedError: If robots.txt disallows the URL
         """
         http_fetcher = self._get_http_fetcher()
 
-        # First try with requests (synchronous)
         try:
-            return http_fetcher.fetch(url, timeout=timeout)
-        except requests.HTTPError as e:
+            return await http_fetcher.fetch(url, timeout=timeout, priority=priority)
+        except httpx.HTTPStatusError as e:
             # If we got a bot detection error and Playwright fallback is enabled
             if self._should_fallback_to_playwright(e):
                 logger.warning(
@@ -134,7 +150,7 @@ class URLFetcher:
     async def close(self):
         """Close all fetchers and cleanup resources."""
         if self._http_fetcher is not None:
-            self._http_fetcher.close()
+            await self._http_fetcher.close()
             self._http_fetcher = None
             logger.debug("URLFetcher HTTP fetcher closed")
 
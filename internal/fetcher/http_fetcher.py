@@ -7,14 +7,17 @@ intelligent retry logic, User-Agent rotation, and realistic browser headers.
 
 import logging
 import random
+import threading
 import time
 from typing import Dict, Optional
+from urllib.parse import urlparse
 
 import requests
 
 from internal.fetcher.config import URLFetcherConfig
 from internal.fetcher.constants import (
     USER_AGENTS,
+    BROWSER_HEADERS,
     BOT_DETECTION_STATUS_CODES,
     VIEWPORT_WIDTH,
     VIEWPORT_HEIGHT,
@@ -43,7 +46,9 @@ class HTTPFetcher:
         """
         self.config = config
         self._session: Optional[requests.Session] = None
-        self._last_request_time: Optional[float] = None
+        # Next allowed request time per host; fetch() may run on several threads
+        self._next_request_time: Dict[str, float] = {}
+        self._delay_lock = threading.Lock()
 
     def _get_session(self) -> requests.Session:
         """Get or create a requests session."""
@@ -71,32 +76,22 @@ class HTTPFetcher:
             else USER_AGENTS[0]
         )
 
-        headers = {
-            "User-Agent": user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        }
+        headers = {"User-Agent": user_agent, **BROWSER_HEADERS}
 
         return headers
 
-    def _apply_request_delay(self):
-        """Apply configured delay between requests."""
-        if self.config.request_delay > 0 and self._last_request_time is not None:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.config.request_delay:
-                sleep_time = self.config.request_delay - elapsed
-                logger.debug(f"Applying request delay: {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        self._last_request_time = time.time()
+    def _apply_request_delay(self, url: str):
+        """Apply configured delay between requests to the same host."""
+        if self.config.request_delay <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._delay_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time.get(host, now))
+            self._next_request_time[host] = start + self.config.request_delay
+        if start > now:
+            logger.debug(f"Applying request delay: {start - now:.2f}s")
+            time.sleep(start - now)
 
     def fetch(self, url: str, timeout: Optional[int] = None) -> str:
         """
@@ -121,7 +116,7 @@ class HTTPFetcher:
         for attempt in range(self.config.max_retries + 1):
             try:
                 # Apply request delay if configured
-                self._apply_request_delay()
+                self._apply_request_delay(url)
 
                 logger.debug(
                     f"Fetching URL (attempt {attempt + 1}/{self.config.max_retries + 1}): {url}"
@@ -3,23 +3,52 @@ Browser-based URL fetcher using Playwright (Async API).
 
 Provides browser automation for fetching URLs that are protected by
 advanced bot detection systems. Uses a real Chromium browser to make
-requests appear as coming from a real user.
+requests appear as coming from a real user. One long-lived browser
+serves all fetches through a pool of warm contexts.
 """
 
+import asyncio
 import logging
 import random
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 
 from internal.fetcher.config import URLFetcherConfig
 from internal.fetcher.constants import (
     USER_AGENTS,
     PLAYWRIGHT_BROWSER_ARGS,
+    PLAYWRIGHT_CHALLENGE_TITLES,
     VIEWPORT_WIDTH,
     VIEWPORT_HEIGHT,
 )
 
 logger = logging.getLogger(__name__)
 
+# Milliseconds between readiness checks; text must be unchanged across two
+_READY_POLL_MS = 250
+
+# True once the document is parsed, is not a bot-check interstitial and its
+# visible text is long enough and has stopped changing since the last poll
+_READY_SCRIPT = """
+([minChars, challengeTitles]) => {
+    if (document.readyState === "loading" || !document.body) return false;
+    const title = (document.title || "").toLowerCase();
+    if (challengeTitles.some((t) => title.includes(t))) return false;
+    const length = document.body.innerText.length;
+    const previous = window.__fetcherTextLength;
+    window.__fetcherTextLength = length;
+    return length >= minChars && length === previous;
+}
+"""
+
+
+@dataclass
+class _BrowserSlot:
+    """A warm browser context with its reusable page."""
+    context: Any
+    page: Any
+    uses: int = 0
+
 
 class PlaywrightFetcher:
     """
@@ -27,6 +56,15 @@ class PlaywrightFetcher:
 
     Uses a real browser (Chromium) to fetch URLs, making it much harder
     for bot detection systems to identify as automated.
+
+    Features:
+    - One Chromium instance for the lifetime of the fetcher
+    - Pool of playwright_contexts warm contexts, each with one reused
+      page; a context is recycled after playwright_context_max_uses
+      pages or after a failed fetch
+    - Images, fonts and media (playwright_block_resources) are aborted
+      by request interception
+    - Waits for the page text to settle instead of a fixed sleep
     """
 
     def __init__(self, config: URLFetcherConfig):
@@ -39,10 +77,15 @@ class PlaywrightFetcher:
         self.config = config
         self._playwright = None
         self._browser = None
+        self._launch_lock = asyncio.Lock()
+        self._slots: Optional[asyncio.Queue] = None
+        self._blocked_types = frozenset(config.playwright_block_resources)
 
     async def _ensure_browser(self):
-        """Ensure Playwright browser is initialized."""
-        if self._browser is None:
+        """Ensure Playwright browser is initialized (once, for concurrent fetches)."""
+        async with self._launch_lock:
+            if self._browser is not None:
+                return
             try:
                 from playwright.async_api import async_playwright
 
@@ -51,7 +94,14 @@ class PlaywrightFetcher:
                     headless=True,
                     args=PLAYWRIGHT_BROWSER_ARGS
                 )
-                logger.info("Playwright browser initialized")
+                # None marks a slot whose context is created on first use
+                self._slots = asyncio.Queue()
+                for _ in range(self.config.playwright_contexts):
+                    self._slots.put_nowait(None)
+                logger.info(
+                    f"Playwright browser initialized "
+                    f"({self.config.playwright_contexts} contexts)"
+                )
             except ImportError:
                 logger.error(
                     "Playwright not installed. Run: pip install playwright && playwright install chromium"
@@ -61,10 +111,84 @@ class PlaywrightFetcher:
                 logger.error(f"Failed to initialize Playwright browser: {e}")
                 raise
 
+    async def start(self):
+        """Launch the browser and open every pooled context ahead of the first fetch."""
+        await self._ensure_browser()
+        slots = [await self._slots.get() for _ in range(self.config.playwright_contexts)]
+        try:
+            for i, slot in enumerate(slots):
+                if slot is None:
+                    slots[i] = await self._new_slot()
+        finally:
+            for slot in slots:
+                self._slots.put_nowait(slot)
+
+    async def _new_slot(self) -> _BrowserSlot:
+        """Create a browser context with realistic fingerprint and a blank page."""
+        context = await self._browser.new_context(
+            viewport={'width': VIEWPORT_WIDTH, 'height': VIEWPORT_HEIGHT},
+            user_agent=random.choice(USER_AGENTS),
+            locale='en-US',
+            timezone_id='America/New_York',
+        )
+        try:
+            # Add extra headers to appear more like a real browser
+            await context.set_extra_http_headers({
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+                'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+                'sec-ch-ua-mobile': '?0',
+                'sec-ch-ua-platform': '"Windows"',
+            })
+            if self._blocked_types:
+                await context.route("**/*", self._route)
+            page = await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+        return _BrowserSlot(context=context, page=page)
+
+    async def _route(self, route):
+        """Abort requests for resource types that never affect page text."""
+        if route.request.resource_type in self._blocked_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _release(self, slot: Optional[_BrowserSlot], reusable: bool):
+        """Return a slot to the pool, closing its context unless it can be reused."""
+        closed = self._slots is None  # Fetcher closed while this fetch ran
+        if slot is not None and (closed or not reusable or slot.uses >= self.config.playwright_context_max_uses):
+            try:
+                await slot.context.close()
+            except Exception as e:
+                logger.debug(f"Playwright: Failed to close context: {e}")
+            slot = None
+        if not closed:
+            self._slots.put_nowait(slot)
+
+    async def _wait_until_ready(self, page, url: str):
+        """Wait for the page text to settle, up to playwright_ready_timeout."""
+        if self.config.playwright_ready_timeout <= 0:
+            return
+        try:
+            await page.wait_for_function(
+                _READY_SCRIPT,
+                arg=[self.config.playwright_min_text_chars, PLAYWRIGHT_CHALLENGE_TITLES],
+                polling=_READY_POLL_MS,
+                timeout=self.config.playwright_ready_timeout * 1000,
+            )
+        except Exception as e:
+            # Short or constantly changing pages: use what has rendered so far
+            logger.debug(f"Playwright: Readiness wait ended for {url}: {type(e).__name__}")
+
     async def fetch(self, url: str) -> str:
         """
         Fetch content from a URL using Playwright browser (async).
 
+        Waits for a free pooled context, so at most playwright_contexts
+        pages load at once.
+
         Args:
             url: URL to fetch
 
@@ -76,33 +200,18 @@ class PlaywrightFetcher:
         """
         await self._ensure_browser()
 
-        context = None
-        page = None
+        slot = await self._slots.get()
+        reusable = False
 
         try:
-            # Create a new browser context with realistic viewport and locale
-            context = await self._browser.new_context(
-                viewport={'width': VIEWPORT_WIDTH, 'height': VIEWPORT_HEIGHT},
-                user_agent=random.choice(USER_AGENTS),
-                locale='en-US',
-                timezone_id='America/New_York',
-            )
-
-            # Add extra headers to appear more like a real browser
-            await context.set_extra_http_headers({
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-            })
-
-            page = await context.new_page()
+            if slot is None:
+                slot = await self._new_slot()
+            slot.uses += 1
 
             logger.info(f"Playwright: Navigating to {url}")
 
             # Navigate to the URL
-            response = await page.goto(
+            response = await slot.page.goto(
                 url,
                 wait_until=self.config.playwright_wait_until,
                 timeout=self.config.playwright_timeout * 1000
@@ -114,11 +223,14 @@ class PlaywrightFetcher:
             if not response.ok:
                 raise Exception(f"Playwright: HTTP {response.status} for {url}")
 
-            # Wait a bit for any dynamic content to load
-            await page.wait_for_timeout(2000)
+            await self._wait_until_ready(slot.page, url)
 
             # Get the page content
-            content = await page.content()
+            content = await slot.page.content()
+
+            # Stop scripts and timers of this page before the next fetch
+            await slot.page.goto("about:blank")
+            reusable = True
 
             logger.info(
                 f"Playwright: Successfully fetched {len(content)} chars from {url}"
@@ -131,13 +243,20 @@ class PlaywrightFetcher:
             raise
 
         finally:
-            if page:
-                await page.close()
-            if context:
-                await context.close()
+            await self._release(slot, reusable)
 
     async def close(self):
-        """Close the Playwright browser and cleanup."""
+        """Close pooled contexts, the Playwright browser and cleanup."""
+        if self._slots is not None:
+            while not self._slots.empty():
+                slot = self._slots.get_nowait()
+                if slot is not None:
+                    try:
+                        await slot.context.close()
+                    except Exception as e:
+                        logger.debug(f"Playwright: Failed to close context: {e}")
+            self._slots = None
+
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -0,0 +1,246 @@
+"""
+Per-host politeness scheduling for URL fetching.
+
+Provides PolitenessScheduler, which decides when each request may start:
+requests to different hosts run in parallel, while each host gets its
+own token bucket, concurrency cap and robots.txt crawl-delay.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
+from internal.fetcher.config import URLFetcherConfig
+
+logger = logging.getLogger(__name__)
+
+# robots.txt group to follow; the rotating browser User-Agents match no named group
+ROBOTS_USER_AGENT = "*"
+
+RobotsLoader = Callable[[str], Awaitable[Optional[str]]]
+
+
+class RobotsDisallowedError(PermissionError):
+    """Raised when robots.txt disallows fetching a URL."""
+
+
+def _crawl_delay(robots_text: str, useragent: str = ROBOTS_USER_AGENT) -> Optional[float]:
+    """
+    Crawl-delay of the group matching useragent
+
+    urllib.robotparser only accepts whole seconds; sites commonly use
+    fractional values such as "0.5".
+    """
+    agents: List[str] = []
+    in_rules = False
+    for line in robots_text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        key = key.lower()
+        if key == "user-agent":
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+        else:
+            in_rules = True
+            if key == "crawl-delay" and useragent.lower() in agents:
+                try:
+                    return float(value)
+                except ValueError:
+                    return None
+    return None
+
+
+@dataclass
+class _HostState:
+    """Rate and concurrency state of one host."""
+    interval: float  # Seconds per token; 0 = no rate limit
+    tokens: float
+    refilled_at: float = field(default_factory=time.monotonic)
+    active: int = 0
+    robots: Optional[RobotFileParser] = None
+    robots_task: Optional[asyncio.Task] = None
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    host: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class PolitenessScheduler:
+    """
+    Grants request slots per host, in priority order.
+
+    Each host has a token bucket refilled every
+    max(request_delay, robots.txt crawl-delay) seconds and holding up to
+    host_burst tokens, plus a cap of max_per_host requests in flight.
+    At most max_concurrency requests run in total. Waiting requests are
+    served lowest priority value first (FIFO within a priority), but a
+    request blocked by its own host's limits never holds up requests to
+    other hosts.
+
+    Example:
+        >>> scheduler = PolitenessScheduler(config, robots_loader)
+        >>> async with scheduler.slot(url, priority=0):
+        ...     response = await client.get(url)
+    """
+
+    def __init__(self, config: URLFetcherConfig, robots_loader: Optional[RobotsLoader] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config: Configuration object
+            robots_loader: Coroutine returning the text of a robots.txt URL,
+                or None if unavailable. Without it robots.txt is ignored.
+        """
+        self.config = config
+        self._robots_loader = robots_loader if config.robots_txt else None
+        self._hosts: Dict[str, _HostState] = {}
+        self._waiting: List[_Waiter] = []
+        self._active = 0
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+    @asynccontextmanager
+    async def slot(self, url: str, priority: int = 0) -> AsyncIterator[None]:
+        """
+        Wait until a request to url may start, and hold the slot while it runs.
+
+        Args:
+            url: URL about to be requested
+            priority: Lower values are served first
+
+        Raises:
+            RobotsDisallowedError: If robots.txt disallows the URL
+        """
+        parsed = urlparse(url)
+        host = parsed.netloc
+        state = await self._host_state(parsed)
+        if state.robots is not None and not state.robots.can_fetch(ROBOTS_USER_AGENT, url):
+            raise RobotsDisallowedError(f"robots.txt disallows {url}")
+
+        waiter = _Waiter(priority, next(self._seq), host, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiting, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Granted just before the cancellation arrived: give the slot back
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(host)
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "active": self._active,
+            "waiting": sum(1 for waiter in self._waiting if not waiter.future.done()),
+            "hosts": {
+                host: {"active": state.active, "interval": round(state.interval, 3)}
+                for host, state in self._hosts.items()
+                if state.active
+            },
+        }
+
+    async def _host_state(self, parsed) -> _HostState:
+        """Get or create a host's state, loading its robots.txt once."""
+        state = self._hosts.get(parsed.netloc)
+        if state is None:
+            state = _HostState(
+                interval=self.config.request_delay,
+                tokens=float(self.config.host_burst),
+            )
+            self._hosts[parsed.netloc] = state
+            if self._robots_loader is not None:
+                state.robots_task = asyncio.create_task(self._load_robots(parsed, state))
+        if state.robots_task is not None:
+            await asyncio.shield(state.robots_task)
+        return state
+
+    async def _load_robots(self, parsed, state: _HostState):
+        robots_url = urlunparse((parsed.scheme, parsed.netloc, "/robots.txt", "", "", ""))
+        try:
+            text = await self._robots_loader(robots_url)
+        except Exception as e:
+            logger.debug(f"Could not load {robots_url}: {e}")
+            return
+        if not text:
+            return
+
+        robots = RobotFileParser(robots_url)
+        robots.parse(text.splitlines())
+        state.robots = robots
+
+        crawl_delay = _crawl_delay(text)
+        request_rate = robots.request_rate(ROBOTS_USER_AGENT)
+        if crawl_delay is None and request_rate is not None and request_rate.requests:
+            crawl_delay = request_rate.seconds / request_rate.requests
+        if crawl_delay:
+            crawl_delay = min(float(crawl_delay), self.config.max_crawl_delay)
+            if crawl_delay > state.interval:
+                state.interval = crawl_delay
+                logger.info(f"{parsed.netloc}: robots.txt crawl-delay {crawl_delay:.1f}s")
+
+    def _refill(self, state: _HostState, now: float):
+        if state.interval <= 0:
+            state.tokens = float(self.config.host_burst)
+        else:
+            earned = (now - state.refilled_at) / state.interval
+            state.tokens = min(float(self.config.host_burst), state.tokens + earned)
+        state.refilled_at = now
+
+    def _dispatch(self):
+        """Grant every waiter whose host and the global limit allow it to start."""
+        now = time.monotonic()
+        blocked: List[_Waiter] = []
+        next_wakeup: Optional[float] = None
+
+        while self._waiting and self._active < self.config.max_concurrency:
+            waiter = heapq.heappop(self._waiting)
+            if waiter.future.done():
+                continue  # Cancelled while waiting
+            state = self._hosts[waiter.host]
+            if state.active >= self.config.max_per_host:
+                blocked.append(waiter)
+                continue
+            self._refill(state, now)
+            if state.tokens < 1:
+                wait = (1 - state.tokens) * state.interval
+                next_wakeup = wait if next_wakeup is None else min(next_wakeup, wait)
+                blocked.append(waiter)
+                continue
+
+            state.tokens -= 1
+            state.active += 1
+            self._active += 1
+            waiter.future.set_result(None)
+
+        for waiter in blocked:
+            heapq.heappush(self._waiting, waiter)
+
+        if next_wakeup is not None:
+            if self._wakeup is not None:
+                self._wakeup.cancel()
+            self._wakeup = asyncio.get_running_loop().call_later(next_wakeup, self._dispatch)
+
+    def _release(self, host: str):
+        self._hosts[host].active -= 1
+        self._active -= 1
+        self._dispatch()
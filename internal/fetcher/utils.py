@@ -7,6 +7,7 @@ URLs with both sync and async interfaces.
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -51,6 +52,18 @@ def load_fetcher_config(config_path: Optional[Path] = None) -> URLFetcherConfig:
                     use_playwright_fallback=fetch_config.get('use_playwright_fallback', config.use_playwright_fallback),
                     playwright_timeout=fetch_config.get('playwright_timeout', config.playwright_timeout),
                     playwright_wait_until=fetch_config.get('playwright_wait_until', config.playwright_wait_until),
+                    playwright_contexts=fetch_config.get('playwright_contexts', config.playwright_contexts),
+                    playwright_context_max_uses=fetch_config.get('playwright_context_max_uses', config.playwright_context_max_uses),
+                    playwright_ready_timeout=fetch_config.get('playwright_ready_timeout', config.playwright_ready_timeout),
+                    playwright_min_text_chars=fetch_config.get('playwright_min_text_chars', config.playwright_min_text_chars),
+                    playwright_block_resources=fetch_config.get('playwright_block_resources', config.playwright_block_resources),
+                    max_concurrency=fetch_config.get('max_concurrency', config.max_concurrency),
+                    max_per_host=fetch_config.get('max_per_host', config.max_per_host),
+                    http2=fetch_config.get('http2', config.http2),
+                    max_response_bytes=fetch_config.get('max_response_bytes', config.max_response_bytes),
+                    host_burst=fetch_config.get('host_burst', config.host_burst),
+                    robots_txt=fetch_config.get('robots_txt', config.robots_txt),
+                    max_crawl_delay=fetch_config.get('max_crawl_delay', config.max_crawl_delay),
                 )
                 logger.info("Loaded URL fetcher configuration from config.yaml")
         except Exception as e:
@@ -59,23 +72,33 @@ def load_fetcher_config(config_path: Optional[Path] = None) -> URLFetcherConfig:
     return config
 
 
-async def fetch_url_content_async(url: str, timeout: Optional[int] = None) -> str:
+async def fetch_url_content_async(
+    url: str,
+    timeout: Optional[int] = None,
+    fetcher: Optional[URLFetcher] = None,
+) -> str:
     """
     Fetch HTML content from a URL using enhanced headers and retry logic (async).
 
     This is an async convenience function that creates a URLFetcher with configuration
     loaded from config.yaml. Falls back to Playwright for bot-protected sites.
+    Pass a long-lived fetcher to reuse its connection and browser pools;
+    otherwise both are created and torn down for this one URL.
 
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds. If None, uses config timeout.
+        fetcher: Shared fetcher to use; it is left open.
 
     Returns:
         HTML content as string
 
     Raises:
-        requests.RequestException: If the request fails
+        httpx.HTTPError: If the request fails
     """
+    if fetcher is not None:
+        return await fetcher.fetch(url, timeout=timeout)
+
     config = load_fetcher_config()
 
     async with URLFetcher(config) as fetcher:
@@ -86,9 +109,10 @@ def fetch_url_content(url: str, timeout: Optional[int] = None) -> str:
     """
     Fetch HTML content from a URL using enhanced headers and retry logic.
 
-    This function handles both sync and async contexts. When called from within an
-    async context (like FastAPI), it uses nest_asyncio to allow nested event loops.
-    When called from sync context, it uses asyncio.run().
+    Synchronous wrapper around fetch_url_content_async. From sync code it
+    uses asyncio.run(); when called from within a running event loop it
+    runs the fetch on a private loop in a helper thread instead of
+    nesting loops. Async callers should await fetch_url_content_async.
 
     Falls back to Playwright for bot-protected sites.
 
@@ -100,61 +124,12 @@ def fetch_url_content(url: str, timeout: Optional[int] = None) -> str:
         HTML content as string
 
     Raises:
-        requests.RequestException: If the request fails
+        httpx.HTTPError: If the request fails
     """
-    from internal.fetcher.http_fetcher import HTTPFetcher
-    from internal.fetcher.playwright_fetcher import PlaywrightFetcher
-    import requests
-
-    config = load_fetcher_config()
-
-    # Create HTTP fetcher
-    http_fetcher = HTTPFetcher(config)
-
     try:
-        # Try synchronous requests first
-        return http_fetcher.fetch(url, timeout=timeout)
-    except requests.HTTPError as e:
-        # If we got a bot detection error and Playwright fallback is enabled
-        if (config.use_playwright_fallback and
-            e.response is not None and
-            e.response.status_code in [401, 403, 429]):
-
-            logger.warning(
-                f"Requests failed with {e.response.status_code}, "
-                f"falling back to Playwright browser automation"
-            )
-
-            # Check if we're already in an event loop
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, use nest_asyncio
-                import nest_asyncio
-                nest_asyncio.apply()
-                # Now we can use asyncio.run even though we're in a loop
-                return asyncio.run(_fetch_with_playwright_wrapper(config, url))
-            except RuntimeError:
-                # No event loop running, safe to use asyncio.run
-                return asyncio.run(_fetch_with_playwright_wrapper(config, url))
-            except ImportError:
-                logger.error("nest_asyncio not installed. Run: pip install nest_asyncio")
-                raise
-            except Exception as playwright_error:
-                logger.error(f"Playwright fallback also failed: {playwright_error}")
-                raise
-        else:
-            raise
-    finally:
-        # Close the HTTP fetcher
-        http_fetcher.close()
-
-
-async def _fetch_with_playwright_wrapper(config: URLFetcherConfig, url: str) -> str:
-    """Wrapper to run Playwright fetch and cleanup."""
-    from internal.fetcher.playwright_fetcher import PlaywrightFetcher
-    
-    playwright_fetcher = PlaywrightFetcher(config)
-    try:
-        return await playwright_fetcher.fetch(url)
-    finally:
-        await playwright_fetcher.close()
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(fetch_url_content_async(url, timeout=timeout))
+
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, fetch_url_content_async(url, timeout=timeout)).result()
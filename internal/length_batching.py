@@ -0,0 +1,70 @@
+from typing import Callable, List, Sequence
+import numpy as np
+
+
+def token_budget_batches(
+    lengths: Sequence[int],
+    max_batch_tokens: int,
+    max_batch_size: int
+) -> List[np.ndarray]:
+    """
+    Group inputs of similar token length into batches under a token budget.
+    
+    Inputs are sorted by length (longest first) and cut into consecutive
+    batches whose padded size, len(batch) x longest input, stays within
+    max_batch_tokens. Short inputs therefore share large batches while
+    long ones run in small ones, and nobody is padded far beyond its own
+    length. An input longer than the budget gets a batch of its own.
+    
+    Args:
+        lengths: Token count of each input
+        max_batch_tokens: Padded tokens allowed per batch
+        max_batch_size: Upper bound on inputs per batch
+    
+    Returns:
+        Batches as arrays of positions into lengths; together they cover
+        every position exactly once
+    """
+    order = np.argsort(-np.asarray(lengths, dtype=np.int64), kind="stable")
+    batches = []
+    start = 0
+    while start < len(order):
+        # Sorted descending, so the first item sets the padded length
+        longest = max(int(lengths[order[start]]), 1)
+        size = max(1, min(max_batch_size, max_batch_tokens // longest))
+        batches.append(order[start:start + size])
+        start += size
+    return batches
+
+
+def run_in_batches(
+    items: Sequence,
+    batches: Sequence[np.ndarray],
+    run_batch: Callable[[List], np.ndarray]
+) -> np.ndarray:
+    """
+    Run a model batch by batch and restore the input order
+    
+    Args:
+        items: Model inputs (texts or query-document pairs)
+        batches: Positions into items per batch, from token_budget_batches
+        run_batch: Runs the model on a list of items, returning one row
+            (or score) per item
+    
+    Returns:
+        Outputs stacked in the order of items
+    """
+    output = None
+    for positions in batches:
+        result = np.asarray(run_batch([items[i] for i in positions]))
+        if output is None:
+            output = np.empty((len(items),) + result.shape[1:], dtype=result.dtype)
+        output[positions] = result
+    return output
+
+
+def padding_efficiency(lengths: Sequence[int], batches: Sequence[np.ndarray]) -> float:
+    """Share of real tokens among all (padded) tokens processed"""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    padded = sum(len(batch) * int(lengths[batch].max()) for batch in batches if len(batch))
+    return float(lengths.sum()) / padded if padded else 1.0
@@ -0,0 +1,212 @@
+"""
+ONNX Runtime inference backends for the transformer models.
+
+Models are exported with optimum on first load and cached under
+onnx.cache_dir, so later starts load the ONNX graph directly:
+    
+    {cache_dir}/{model_name}/{task}/fp32   exported graph + tokenizer
+    {cache_dir}/{model_name}/{task}/int8   dynamically quantized graph
+
+Backends:
+- torch: the PyTorch model (default)
+- onnx: ONNX Runtime, fp32 graph
+- onnx-int8: ONNX Runtime, weights quantized to int8 (dynamic quantization,
+  activations quantized at run time). The fastest option on CPU.
+
+optimum[onnxruntime] is only required when an onnx backend is configured.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+import numpy as np
+
+from internal.config import OnnxConfig
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_FILE_NAME = "model_quantized.onnx"
+
+# Inputs compared between the PyTorch and ONNX models after loading
+PARITY_PROBES = [
+    "What is hybrid search?",
+    "Dense vectors capture semantic meaning, sparse vectors capture exact terms.",
+    "Qdrant stores points with named vectors and a JSON payload.",
+    "The quick brown fox jumps over the lazy dog.",
+]
+
+
+def _require_optimum():
+    try:
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError:
+        logger.error(
+            "ONNX backend requires optimum. Run: pip install 'optimum[onnxruntime]'"
+        )
+        raise
+
+
+def _session_options(config: OnnxConfig):
+    from onnxruntime import SessionOptions
+    
+    options = SessionOptions()
+    if config.threads:
+        options.intra_op_num_threads = config.threads
+    return options
+
+
+def _quantization_config(config: OnnxConfig):
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    
+    factory = getattr(AutoQuantizationConfig, config.quantization_arch)
+    return factory(is_static=False, per_channel=False)
+
+
+def model_cache_dir(config: OnnxConfig, model_name: str, task: str, backend: str) -> Path:
+    """Directory of the exported (and, for onnx-int8, quantized) model"""
+    precision = "int8" if backend == "onnx-int8" else "fp32"
+    return Path(config.cache_dir) / model_name.replace("/", "__") / task / precision
+
+
+def load_ort_model(
+    model_class: Any,
+    model_name: str,
+    task: str,
+    backend: str,
+    config: OnnxConfig
+) -> Tuple[Any, Any]:
+    """
+    Load an optimum ORTModel, exporting and quantizing it on first use
+    
+    Args:
+        model_class: optimum ORTModel class, e.g. ORTModelForSequenceClassification
+        model_name: HuggingFace model name
+        task: Cache subdirectory for the model head (e.g. "sequence-classification")
+        backend: onnx | onnx-int8
+        config: OnnxConfig
+    
+    Returns:
+        (ort_model, tokenizer)
+    """
+    _require_optimum()
+    from optimum.onnxruntime import ORTQuantizer
+    from transformers import AutoTokenizer
+    
+    fp32_dir = model_cache_dir(config, model_name, task, "onnx")
+    if not (fp32_dir / "model.onnx").exists():
+        logger.info(f"Exporting {model_name} to ONNX: {fp32_dir}")
+        model = model_class.from_pretrained(model_name, export=True)
+        model.save_pretrained(fp32_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(fp32_dir)
+    
+    model_dir, file_name = fp32_dir, "model.onnx"
+    if backend == "onnx-int8":
+        model_dir, file_name = model_cache_dir(config, model_name, task, backend), QUANTIZED_FILE_NAME
+        if not (model_dir / file_name).exists():
+            logger.info(f"Quantizing {model_name} to int8 ({config.quantization_arch}): {model_dir}")
+            quantizer = ORTQuantizer.from_pretrained(fp32_dir)
+            quantizer.quantize(save_dir=model_dir, quantization_config=_quantization_config(config))
+            AutoTokenizer.from_pretrained(fp32_dir).save_pretrained(model_dir)
+    
+    model = model_class.from_pretrained(
+        model_dir,
+        file_name=file_name,
+        session_options=_session_options(config)
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    logger.info(f"Loaded {model_name} with {backend} backend from {model_dir}")
+    return model, tokenizer
+
+
+def load_sentence_transformer(model_name: str, backend: str, config: OnnxConfig):
+    """
+    Load a SentenceTransformer on ONNX Runtime, exporting it on first use
+    
+    Goes through sentence-transformers' own ONNX backend so the model's
+    pooling and normalization modules are kept.
+    
+    Returns:
+        SentenceTransformer running on ONNX Runtime (CPU)
+    """
+    _require_optimum()
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+    
+    model_dir = model_cache_dir(config, model_name, "sentence-embedding", "onnx")
+    model_kwargs = {"session_options": _session_options(config)}
+    
+    if not (model_dir / "onnx" / "model.onnx").exists():
+        logger.info(f"Exporting {model_name} to ONNX: {model_dir}")
+        SentenceTransformer(model_name, device="cpu", backend="onnx").save_pretrained(str(model_dir))
+    
+    if backend == "onnx-int8":
+        file_name = f"onnx/model_qint8_{config.quantization_arch}.onnx"
+        if not (model_dir / file_name).exists():
+            logger.info(f"Quantizing {model_name} to int8 ({config.quantization_arch})")
+            export_dynamic_quantized_onnx_model(
+                SentenceTransformer(str(model_dir), device="cpu", backend="onnx"),
+                config.quantization_arch,
+                str(model_dir)
+            )
+        model_kwargs["file_name"] = file_name
+    
+    model = SentenceTransformer(str(model_dir), device="cpu", backend="onnx", model_kwargs=model_kwargs)
+    logger.info(f"Loaded {model_name} with {backend} backend from {model_dir}")
+    return model
+
+
+def parity_tolerance(config: OnnxConfig, backend: str) -> float:
+    return config.int8_parity_tolerance if backend == "onnx-int8" else config.parity_tolerance
+
+
+def check_parity(reference: np.ndarray, candidate: np.ndarray, tolerance: float, label: str) -> bool:
+    """
+    Compare ONNX outputs against the PyTorch outputs for the same inputs
+    
+    Returns:
+        Whether the largest absolute difference is within tolerance
+    """
+    error = float(np.max(np.abs(np.asarray(reference, dtype=np.float32) - np.asarray(candidate, dtype=np.float32))))
+    if error > tolerance:
+        logger.warning(f"{label}: ONNX parity check failed (max abs diff {error:.4g} > {tolerance})")
+        return False
+    logger.info(f"{label}: ONNX parity check passed (max abs diff {error:.4g})")
+    return True
+
+
+class OnnxCrossEncoder:
+    """
+    CrossEncoder.predict() on an ONNX Runtime sequence classification model
+    
+    Single-label models get a sigmoid, as CrossEncoder applies by default.
+    
+    Attributes:
+        model: optimum ORTModelForSequenceClassification
+        tokenizer: Matching tokenizer
+        max_length: Truncation length of a (query, document) pair
+    """
+    def __init__(self, model: Any, tokenizer: Any, max_length: Optional[int] = None):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_length = max_length or min(tokenizer.model_max_length, 512)
+    
+    def predict(self, pairs: Sequence[Sequence[str]], batch_size: int = 32) -> np.ndarray:
+        scores: List[np.ndarray] = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            inputs = self.tokenizer(
+                [pair[0] for pair in batch],
+                [pair[1] for pair in batch],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            logits = self.model(**inputs).logits
+            logits = np.asarray(logits, dtype=np.float32)
+            if logits.shape[-1] == 1:
+                scores.append(1.0 / (1.0 + np.exp(-logits[:, 0])))
+            else:
+                scores.append(logits)
+        if not scores:
+            return np.array([])
+        return np.concatenate(scores)
@@ -5,6 +5,7 @@ from llmlingua import PromptCompressor
 
 from ..config import CompressionConfig
 from ..token_counter import TokenCounter
+from .. import onnx_backend
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,14 @@ class ContextCompressor():
                 device_map=config.device,
                 use_llmlingua2=True,
             )
+            if config.backend != "torch":
+                try:
+                    self._use_onnx_model()
+                except Exception as e:
+                    logger.warning(
+                        f"ONNX backend unavailable for {config.model_name}: {e}. "
+                        f"Keeping PyTorch model"
+                    )
             
             logger.info("Loading tokenizer for token counting...")
             self.tokenizer = TokenCounter.get_tokenizer(config.model_name)
@@ -47,6 +56,44 @@ class ContextCompressor():
             self.compressor = None
             self.tokenizer = None
     
+    def _use_onnx_model(self):
+        """
+        Swap LLMLingua's token classifier for its ONNX Runtime export
+        
+        LLMLingua-2 only calls model(input_ids=..., attention_mask=...) and
+        reads .logits, which the optimum model provides. The PyTorch model
+        is kept if the keep-probabilities of the two diverge.
+        """
+        from optimum.onnxruntime import ORTModelForTokenClassification
+        
+        onnx_config = self.config.onnx
+        ort_model, _ = onnx_backend.load_ort_model(
+            ORTModelForTokenClassification,
+            self.config.model_name,
+            "token-classification",
+            self.config.backend,
+            onnx_config
+        )
+        
+        if onnx_config.parity_check:
+            inputs = self.compressor.tokenizer(
+                onnx_backend.PARITY_PROBES, padding=True, return_tensors="pt"
+            ).to(self.compressor.model.device)
+            reference = self.compressor.model(**inputs).logits.softmax(-1).detach().cpu().numpy()
+            candidate = ort_model(**inputs.to("cpu")).logits.softmax(-1).detach().numpy()
+            mask = inputs["attention_mask"].cpu().numpy().astype(bool)
+            if not onnx_backend.check_parity(
+                reference[mask],
+                candidate[mask],
+                onnx_backend.parity_tolerance(onnx_config, self.config.backend),
+                label=self.config.model_name
+            ):
+                logger.warning(f"Keeping PyTorch model for {self.config.model_name}")
+                return
+        
+        self.compressor.model = ort_model
+        self.compressor.device = "cpu"
+    
     def _combine_chunks(self, results: List[Dict[str, Any]]) -> str:
         """Combine chunks with structured separators (unchanged)"""
         combined_parts = []
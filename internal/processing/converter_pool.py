@@ -0,0 +1,240 @@
+import logging
+import queue
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from docling.document_converter import DocumentConverter, PdfFormatOption, HTMLFormatOption
+from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+from docling.datamodel.base_models import InputFormat
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting lease re-checks for a free slot; a failed build frees
+# its slot without returning a converter, so waiters must not block forever
+_SLOT_RECHECK_SECONDS = 1.0
+
+
+def pdf_pipeline_options(do_ocr: bool = True, table_mode: str = "accurate") -> PdfPipelineOptions:
+    """
+    PDF pipeline options used for markdown extraction
+    
+    Args:
+        do_ocr: Run OCR on bitmap content
+        table_mode: TableFormer mode, "accurate" or "fast"
+    """
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = do_ocr
+    pipeline_options.do_table_structure = True
+    pipeline_options.table_structure_options.do_cell_matching = True
+    pipeline_options.table_structure_options.mode = TableFormerMode(table_mode)
+    pipeline_options.generate_picture_images = False
+    pipeline_options.generate_page_images = False
+    return pipeline_options
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, or the peak if /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass
+class _PoolEntry:
+    """Converters built for one set of options"""
+    input_format: InputFormat
+    format_option: Any
+    idle: "queue.LifoQueue[DocumentConverter]"
+    created: int = 0
+    conversions: int = 0
+    init_seconds: float = 0.0
+    init_rss_bytes: int = 0
+
+
+class ConverterPool:
+    """
+    Process-wide pool of warm Docling DocumentConverters.
+    
+    Building a DocumentConverter is cheap, but its first conversion loads
+    the layout, OCR and TableFormer models, which dominates the time for
+    small documents. The pool keeps converters alive between calls, keyed
+    by input format and pipeline options, so every distinct configuration
+    loads its models once per process.
+    
+    lease() hands a converter to one caller at a time. Up to
+    max_per_key converters (or max_converters, if a caller passes a
+    higher limit) are built per key for concurrent callers; further
+    callers wait for one to be returned. PDF worker processes
+    (PdfJobManager) each get their own pool, since models cannot be
+    shared across processes.
+    
+    Usage:
+        with ConverterPool.lease_pdf() as converter:
+            result = converter.convert(path)
+    
+    Class attributes:
+        max_per_key: Converters built per (format, options) key
+    """
+    max_per_key: int = 1
+    
+    _entries: Dict[str, _PoolEntry] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def configure(cls, max_per_key: int):
+        if max_per_key <= 0:
+            raise ValueError("max_per_key must be positive")
+        cls.max_per_key = max_per_key
+    
+    @staticmethod
+    def _key(input_format: InputFormat, pipeline_options: Optional[Any]) -> str:
+        options = pipeline_options.model_dump_json() if pipeline_options is not None else ""
+        return f"{input_format.value}:{options}"
+    
+    @classmethod
+    def _entry(cls, input_format: InputFormat, format_option: Any, key: str) -> _PoolEntry:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                entry = _PoolEntry(input_format, format_option, queue.LifoQueue())
+                cls._entries[key] = entry
+            return entry
+    
+    @classmethod
+    @contextmanager
+    def lease(
+        cls,
+        input_format: InputFormat,
+        format_option: Any,
+        max_converters: Optional[int] = None
+    ) -> Iterator[DocumentConverter]:
+        """
+        Borrow a warm converter for one format and its options
+        
+        Args:
+            input_format: Docling input format
+            format_option: PdfFormatOption / HTMLFormatOption with the pipeline options
+            max_converters: Converters this caller's workers may use at
+                once; raises max_per_key for this lease only
+        
+        Yields:
+            DocumentConverter for exclusive use until the block exits
+        """
+        key = cls._key(input_format, getattr(format_option, "pipeline_options", None))
+        entry = cls._entry(input_format, format_option, key)
+        converter = cls._acquire(entry, max(cls.max_per_key, max_converters or 0))
+        
+        try:
+            yield converter
+            entry.conversions += 1
+        finally:
+            entry.idle.put(converter)
+    
+    @classmethod
+    def lease_pdf(cls, do_ocr: bool = True, table_mode: str = "accurate"):
+        return cls.lease(
+            InputFormat.PDF,
+            PdfFormatOption(pipeline_options=pdf_pipeline_options(do_ocr, table_mode))
+        )
+    
+    @classmethod
+    def lease_html(cls, max_converters: Optional[int] = None):
+        return cls.lease(InputFormat.HTML, HTMLFormatOption(), max_converters)
+    
+    @classmethod
+    def _acquire(cls, entry: _PoolEntry, limit: int) -> DocumentConverter:
+        """Take an idle converter, build one if under limit, else wait for one"""
+        while True:
+            try:
+                return entry.idle.get_nowait()
+            except queue.Empty:
+                pass
+            if cls._reserve(entry, limit):
+                return cls._build(entry)
+            try:
+                return entry.idle.get(timeout=_SLOT_RECHECK_SECONDS)
+            except queue.Empty:
+                continue
+    
+    @classmethod
+    def _reserve(cls, entry: _PoolEntry, limit: int) -> bool:
+        """Claim a slot for a new converter if fewer than limit exist"""
+        with cls._lock:
+            if entry.created >= limit:
+                return False
+            entry.created += 1
+            return True
+    
+    @classmethod
+    def _build(cls, entry: _PoolEntry) -> DocumentConverter:
+        """Create a converter for a reserved slot and load its pipeline models"""
+        started, rss_before = time.perf_counter(), _rss_bytes()
+        try:
+            converter = DocumentConverter(format_options={entry.input_format: entry.format_option})
+            converter.initialize_pipeline(entry.input_format)
+        except Exception:
+            with cls._lock:
+                entry.created -= 1
+            raise
+        
+        elapsed = time.perf_counter() - started
+        entry.init_seconds += elapsed
+        entry.init_rss_bytes += max(_rss_bytes() - rss_before, 0)
+        logger.info(
+            f"Docling {entry.input_format.value} converter ready in {elapsed:.2f}s "
+            f"({entry.created} for these options)"
+        )
+        return converter
+    
+    @classmethod
+    def warm_up(cls, formats: Tuple[str, ...] = ("pdf", "html")):
+        """
+        Load the models of one converter per format (default options)
+        
+        Args:
+            formats: "pdf" and/or "html"
+        """
+        format_options = {
+            "pdf": lambda: (InputFormat.PDF, PdfFormatOption(pipeline_options=pdf_pipeline_options())),
+            "html": lambda: (InputFormat.HTML, HTMLFormatOption()),
+        }
+        for name in formats:
+            if name not in format_options:
+                raise ValueError(f"Unknown converter format: {name}")
+            input_format, format_option = format_options[name]()
+            key = cls._key(input_format, getattr(format_option, "pipeline_options", None))
+            entry = cls._entry(input_format, format_option, key)
+            if cls._reserve(entry, 1):
+                entry.idle.put(cls._build(entry))
+    
+    @classmethod
+    def clear(cls):
+        """Drop all converters (and their models, once garbage collected)"""
+        with cls._lock:
+            cls._entries.clear()
+    
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        with cls._lock:
+            entries: List[Dict[str, Any]] = [
+                {
+                    "format": entry.input_format.value,
+                    "converters": entry.created,
+                    "idle": entry.idle.qsize(),
+                    "conversions": entry.conversions,
+                    "init_seconds": round(entry.init_seconds, 3),
+                    "init_rss_mb": round(entry.init_rss_bytes / 2**20, 1),
+                }
+                for entry in cls._entries.values()
+            ]
+        return {
+            "max_per_key": cls.max_per_key,
+            "rss_mb": round(_rss_bytes() / 2**20, 1),
+            "pools": entries,
+        }
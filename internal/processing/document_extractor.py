@@ -1,16 +1,21 @@
+import asyncio
 import logging
 import re
 import tempfile
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from typing import Union, List, Tuple, Optional
+from typing import AsyncIterator, List, Tuple, Optional, Union
 from urllib.parse import urlparse
 
-from docling.document_converter import DocumentConverter, PdfFormatOption, HTMLFormatOption
-from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import DocumentStream
 
-from internal.fetcher import fetch_url_content
+from internal.fetcher import URLFetcher, URLFetcherConfig, load_fetcher_config
+from .converter_pool import ConverterPool
+from .html_markdown import simple_html_to_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -18,33 +23,26 @@ logger = logging.getLogger(__name__)
 DEFAULT_EXPORTS_DIR = Path("exports")
 
 
-def convert_pdf_to_markdown(pdf_path: Path) -> str:
+def convert_pdf_to_markdown(pdf_path: Path, page_range: Optional[Tuple[int, int]] = None) -> str:
     """
     Convert PDF to markdown using Docling
     
     Args:
         pdf_path: Path to PDF file
+        page_range: 1-based inclusive (first, last) pages to convert;
+            None converts the whole file
         
     Returns:
         Markdown content as string
     """
-    logger.info(f"Converting PDF to markdown: {pdf_path.name}")
-    
-    pipeline_options = PdfPipelineOptions()
-    pipeline_options.do_ocr = True
-    pipeline_options.do_table_structure = True
-    pipeline_options.table_structure_options.do_cell_matching = True
-    pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
-    pipeline_options.generate_picture_images = False
-    pipeline_options.generate_page_images = False
-    
-    converter = DocumentConverter(
-        format_options={
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-        }
-    )
-    
-    result = converter.convert(pdf_path)
+    pages = f" pages {page_range[0]}-{page_range[1]}" if page_range else ""
+    logger.info(f"Converting PDF to markdown: {pdf_path.name}{pages}")
+    
+    with ConverterPool.lease_pdf() as converter:
+        if page_range:
+            result = converter.convert(pdf_path, page_range=page_range)
+        else:
+            result = converter.convert(pdf_path)
     markdown_content = result.document.export_to_markdown()
     
     logger.info(f"PDF converted successfully ({len(markdown_content)} chars)")
@@ -63,21 +61,62 @@ def convert_html_to_markdown(html_path: Path) -> str:
     """
     logger.info(f"Converting HTML to markdown: {html_path.name}")
     
-    converter = DocumentConverter(
-        format_options={
-            InputFormat.HTML: HTMLFormatOption()
-        }
-    )
-    
-    result = converter.convert(html_path)
+    with ConverterPool.lease_html() as converter:
+        result = converter.convert(html_path)
     markdown_content = result.document.export_to_markdown()
     
     logger.info(f"HTML converted successfully ({len(markdown_content)} chars)")
     return markdown_content
 
 
-# Note: fetch_url_content is now imported from internal.processing.url_fetcher
-# It provides enhanced headers, User-Agent rotation, and retry logic
+def convert_html_string_to_markdown(
+    html_content: Union[str, bytes],
+    name: str = "page.html",
+    max_converters: Optional[int] = None
+) -> str:
+    """
+    Convert HTML held in memory to markdown using Docling
+    
+    The HTML is passed to Docling as a DocumentStream, so nothing is
+    written to disk.
+    
+    Args:
+        html_content: HTML page as text or bytes
+        name: Document name; its extension tells Docling the format
+        max_converters: Concurrent callers to build converters for
+            (defaults to docling.converters_per_options)
+        
+    Returns:
+        Markdown content as string
+    """
+    if isinstance(html_content, str):
+        html_content = html_content.encode("utf-8")
+    with ConverterPool.lease_html(max_converters) as converter:
+        result = converter.convert(DocumentStream(name=name, stream=BytesIO(html_content)))
+    return result.document.export_to_markdown()
+
+
+def html_to_markdown(
+    html_content: str,
+    fast_path: bool = True,
+    max_converters: Optional[int] = None
+) -> Tuple[str, str]:
+    """
+    Convert an HTML page to markdown, trying the lightweight converter first
+    
+    Args:
+        html_content: HTML page
+        fast_path: Try simple_html_to_markdown before Docling
+        max_converters: Concurrent callers to build Docling converters for
+        
+    Returns:
+        (markdown, converter) where converter is "fast" or "docling"
+    """
+    if fast_path:
+        markdown_content = simple_html_to_markdown(html_content)
+        if markdown_content is not None:
+            return markdown_content, "fast"
+    return convert_html_string_to_markdown(html_content, max_converters=max_converters), "docling"
 
 
 def _sanitize_filename(url: str, max_length: int = 100) -> str:
@@ -157,18 +196,165 @@ def _generate_unique_filename(url: str, exports_dir: Path, timestamp: Optional[s
     return file_path
 
 
+@dataclass
+class UrlConversion:
+    """Result of converting one URL, with where its time went"""
+    url: str
+    index: int  # Position in the input list
+    markdown: str = ""
+    file_path: Optional[Path] = None
+    error: Optional[str] = None
+    converter: Optional[str] = None  # "fast" or "docling"
+    fetch_seconds: float = 0.0  # Including waits for the fetcher's host limits
+    convert_seconds: float = 0.0
+    
+    @property
+    def seconds(self) -> float:
+        return self.fetch_seconds + self.convert_seconds
+
+
+def _prepare_exports(
+    save_to_disk: bool,
+    exports_dir: Optional[Path],
+    include_timestamp: bool
+) -> Tuple[Optional[Path], Optional[str]]:
+    """Create the exports directory and the filename timestamp, if saving"""
+    if not save_to_disk:
+        return None, None
+    exports_dir = Path(exports_dir or DEFAULT_EXPORTS_DIR)
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Exports directory: {exports_dir.absolute()}")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") if include_timestamp else None
+    return exports_dir, timestamp
+
+
+async def convert_urls_to_markdown_async(
+    urls: List[str],
+    timeout: int = 30,
+    save_to_disk: bool = False,
+    exports_dir: Optional[Path] = None,
+    include_timestamp: bool = True,
+    fetcher_config: Optional[URLFetcherConfig] = None,
+    executor: Optional[Executor] = None,
+    convert_workers: int = 4,
+    fast_path: bool = True,
+    fetcher: Optional[URLFetcher] = None
+) -> AsyncIterator[UrlConversion]:
+    """
+    Convert URLs to markdown concurrently, yielding results as they complete
+    
+    All URLs are handed to the fetcher at once; its politeness scheduler
+    limits requests in flight (max_concurrency overall, max_per_host and
+    crawl-delay per host), so a URL waiting for its host does not hold up
+    URLs of other hosts. Fetched HTML is converted on a
+    worker pool while other fetches continue, so a batch takes about as
+    long as its slowest URLs rather than the sum of all of them.
+    
+    Args:
+        urls: URLs to convert
+        timeout: Request timeout in seconds for each URL
+        save_to_disk: Whether to save markdown files to disk
+        exports_dir: Directory to save files (defaults to ./exports/)
+        include_timestamp: Whether to include timestamp in filenames
+        fetcher_config: Fetching and concurrency settings (defaults to
+            the url_fetching section of config.yaml)
+        executor: Pool for Docling conversions, e.g. a ProcessPoolExecutor
+            for CPU-heavy batches. Defaults to convert_workers threads.
+        convert_workers: Size of the default conversion pool; up to
+            this many HTML converters are built so the workers do not
+            queue for one
+        fast_path: Convert simple article pages with the lightweight
+            HTML converter and only use Docling for the rest
+        fetcher: Shared fetcher (e.g. the server's, with its warm browser
+            pool); it is left open. Defaults to a fetcher for this batch.
+        
+    Yields:
+        UrlConversion per URL in completion order; failed URLs have an
+        error and empty markdown
+    """
+    if fetcher_config is None:
+        fetcher_config = fetcher.config if fetcher is not None else load_fetcher_config()
+    config = fetcher_config
+    exports_dir, timestamp = _prepare_exports(save_to_disk, exports_dir, include_timestamp)
+    logger.info(
+        f"Converting {len(urls)} URLs to markdown (concurrency={config.max_concurrency}, "
+        f"per_host={config.max_per_host}, save_to_disk={save_to_disk})"
+    )
+    
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=convert_workers, thread_name_prefix="url-convert")
+    loop = asyncio.get_running_loop()
+    started_at = time.perf_counter()
+    
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = URLFetcher(config)
+    
+    async def convert(index: int, url: str) -> UrlConversion:
+        result = UrlConversion(url=url, index=index)
+        try:
+            fetch_started = time.perf_counter()
+            html_content = await fetcher.fetch(url, timeout=timeout)
+            result.fetch_seconds = time.perf_counter() - fetch_started
+            
+            convert_started = time.perf_counter()
+            result.markdown, result.converter = await loop.run_in_executor(
+                executor, html_to_markdown, html_content, fast_path, convert_workers
+            )
+            result.convert_seconds = time.perf_counter() - convert_started
+            
+            if save_to_disk and result.markdown:
+                result.file_path = _generate_unique_filename(url, exports_dir, timestamp)
+                result.file_path.write_text(result.markdown, encoding="utf-8")
+            logger.info(
+                f"URL {index + 1} converted by {result.converter} ({len(result.markdown)} chars, "
+                f"fetch {result.fetch_seconds:.2f}s, convert {result.convert_seconds:.2f}s)"
+            )
+        except Exception as e:
+            logger.error(f"Failed to convert URL {url}: {e}")
+            result.markdown, result.file_path = "", None
+            result.error = f"{type(e).__name__}: {e}"
+        return result
+    
+    try:
+        tasks = [asyncio.create_task(convert(i, url)) for i, url in enumerate(urls)]
+        try:
+            total_seconds = 0.0
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                total_seconds += result.seconds
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(
+            f"Completed conversion of {len(urls)} URLs in {time.perf_counter() - started_at:.2f}s "
+            f"(sum of per-URL times {total_seconds:.2f}s)"
+        )
+    finally:
+        if own_fetcher:
+            await fetcher.close()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
 def convert_urls_to_markdown(
     urls: List[str], 
     timeout: int = 30,
     save_to_disk: bool = False,
     exports_dir: Optional[Path] = None,
-    include_timestamp: bool = True
+    include_timestamp: bool = True,
+    fast_path: bool = True
 ) -> List[Tuple[str, Optional[Path]]]:
     """
     Convert a list of URLs to markdown using Docling
     
     Fetches HTML content from each URL and converts it to markdown.
-    Optionally saves the markdown content to disk.
+    Optionally saves the markdown content to disk. Synchronous wrapper
+    around convert_urls_to_markdown_async, so URLs are still processed
+    concurrently.
     
     Args:
         urls: List of URLs to convert
@@ -176,6 +362,7 @@ def convert_urls_to_markdown(
         save_to_disk: Whether to save markdown files to disk
         exports_dir: Directory to save files (defaults to ./exports/)
         include_timestamp: Whether to include timestamp in filenames
+        fast_path: Convert simple article pages without Docling
         
     Returns:
         List of tuples containing (markdown_content, file_path) for each URL.
@@ -185,71 +372,31 @@ def convert_urls_to_markdown(
         If a URL fails to fetch or convert, an empty string is returned
         for that URL and the error is logged.
     """
-    logger.info(f"Converting {len(urls)} URLs to markdown (save_to_disk={save_to_disk})")
-    
-    # Setup exports directory
-    if save_to_disk:
-        if exports_dir is None:
-            exports_dir = DEFAULT_EXPORTS_DIR
-        exports_dir = Path(exports_dir)
-        exports_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Exports directory: {exports_dir.absolute()}")
-    
-    # Generate timestamp for filenames
-    timestamp = None
-    if save_to_disk and include_timestamp:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    converter = DocumentConverter(
-        format_options={
-            InputFormat.HTML: HTMLFormatOption()
-        }
-    )
-    
-    results = []
+    async def collect() -> List[UrlConversion]:
+        results: List[Optional[UrlConversion]] = [None] * len(urls)
+        async for result in convert_urls_to_markdown_async(
+            urls,
+            timeout=timeout,
+            save_to_disk=save_to_disk,
+            exports_dir=exports_dir,
+            include_timestamp=include_timestamp,
+            fast_path=fast_path
+        ):
+            results[result.index] = result
+        return results
     
-    for i, url in enumerate(urls):
-        file_path: Optional[Path] = None
-        markdown_content = ""
-        
-        try:
-            logger.info(f"Processing URL {i + 1}/{len(urls)}: {url}")
-            
-            # Fetch HTML content
-            html_content = fetch_url_content(url, timeout=timeout)
-            
-            # Create temporary file with HTML content
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_file:
-                temp_file.write(html_content)
-                temp_html_path = Path(temp_file.name)
-            
-            try:
-                # Convert HTML to markdown
-                result = converter.convert(temp_html_path)
-                markdown_content = result.document.export_to_markdown()
-                
-                # Save to disk if requested
-                if save_to_disk and markdown_content:
-                    file_path = _generate_unique_filename(url, exports_dir, timestamp)
-                    file_path.write_text(markdown_content, encoding="utf-8")
-                    logger.info(f"URL {i + 1} converted and saved to {file_path.name} ({len(markdown_content)} chars)")
-                else:
-                    logger.info(f"URL {i + 1} converted successfully ({len(markdown_content)} chars)")
-                    
-            finally:
-                # Clean up temporary file
-                temp_html_path.unlink()
-                
-        except Exception as e:
-            logger.error(f"Failed to convert URL {url}: {e}")
-            markdown_content = ""
-            file_path = None
-        
-        results.append((markdown_content, file_path))
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(collect())
+    else:
+        # Called from async code: run on a private loop instead of nesting one
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            results = runner.submit(asyncio.run, collect()).result()
     
-    saved_count = sum(1 for _, fp in results if fp is not None)
+    saved_count = sum(1 for result in results if result.file_path is not None)
     logger.info(f"Completed conversion of {len(urls)} URLs ({saved_count} saved to disk)")
-    return results
+    return [(result.markdown, result.file_path) for result in results]
 
 
 if __name__ == "__main__":
@@ -1,27 +1,49 @@
+import asyncio
 import logging
+import time
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, AsyncIterable, AsyncIterator, Union
 import numpy as np
 from qdrant_client.http.exceptions import UnexpectedResponse
 
 from ..chunkers.base_chunker import BaseDocumentChunker
+from ..chunkers.schema import SemanticChunk
+from ..config import IngestionConfig
 from ..embedding.dense_embedder import DenseEmbedder
 from ..embedding.sparse_embedder import SparseEmbedder
+from ..embedding.embedding_executor import EmbeddingExecutor
+from ..embedding.embedding_store import ChunkEmbeddingStore
+from ..embedding.vectors import SparseBatch
 from ..storage.qdrant_client import QdrantClient
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a pipeline queue
+_END_OF_STREAM = object()
+
+
+async def _single_part(markdown: str) -> AsyncIterator[str]:
+    yield markdown
+
 
 class DocumentProcessor:
     """
     Handles chunking, embedding, and storage of markdown documents
     
     Workflow:
-    1. Auto-generate document ID (UUID)
+    1. Use the given document ID or auto-generate one (UUID)
     2. Chunk document using MarkdownDocumentChunker
     3. Generate dense embeddings
     4. Generate sparse embeddings
     5. Store in Qdrant
+    
+    In streaming mode, steps 2-5 run as overlapping stages connected by
+    bounded queues, so only queue_depth batches of chunks and vectors are
+    held in memory at any time.
+    
+    If ingestion.embedding_store_path is set, vectors are looked up in a
+    persistent ChunkEmbeddingStore first and only new or edited chunks are
+    sent to the embedders.
     """
     
     def __init__(
@@ -29,65 +51,322 @@ class DocumentProcessor:
         chunker: BaseDocumentChunker,
         dense_embedder: DenseEmbedder,
         sparse_embedder: SparseEmbedder,
-        qdrant_client: QdrantClient
+        qdrant_client: QdrantClient,
+        ingestion_config: Optional[IngestionConfig] = None,
+        embedding_executor: Optional[EmbeddingExecutor] = None,
+        embedding_store: Optional[ChunkEmbeddingStore] = None
     ):
         self.chunker = chunker
         self.dense_embedder = dense_embedder
         self.sparse_embedder = sparse_embedder
         self.qdrant_client = qdrant_client
+        self.ingestion_config = ingestion_config or IngestionConfig()
+        self.embedding_executor = embedding_executor or EmbeddingExecutor(
+            dense_embedder, sparse_embedder
+        )
+        
+        self.embedding_store = embedding_store
+        if self.embedding_store is None and self.ingestion_config.embedding_store_path:
+            self.embedding_store = ChunkEmbeddingStore(
+                self.ingestion_config.embedding_store_path,
+                dim=dense_embedder.get_dimension(),
+                max_rows=self.ingestion_config.embedding_store_max_rows
+            )
         
         logger.info("DocumentProcessor initialized")
+        logger.info(f"  Streaming ingestion: {self.ingestion_config.streaming}")
+        logger.info(f"  Append mode: {self.ingestion_config.append}")
+        logger.info(f"  Embedding store: {self.ingestion_config.embedding_store_path}")
     
     async def process_markdown_file(
         self,
-        markdown_content: str,
-        collection_name: str
+        markdown_content: Union[str, AsyncIterable[str]],
+        collection_name: str,
+        streaming: Optional[bool] = None,
+        document_id: Optional[str] = None,
+        append: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Process markdown file: chunk → embed → store
         
+        Point IDs are derived from document_id and chunk content, so with a
+        caller-supplied document_id re-ingesting is idempotent. If the
+        collection already exists and document_id is given, the document's
+        chunks are upserted and its points that no longer correspond to a
+        chunk are deleted (upsert-diff); other documents are untouched.
+        
+        In append mode the collection is shared by many documents: it is
+        created on first use and later documents are added to it.
+        
+        markdown_content may also be an async iterable of markdown parts
+        that each chunk on their own (e.g. PDF page windows, see
+        MarkdownStitcher); parts always go through the streaming pipeline
+        and are chunked as they arrive.
+        
         Args:
-            markdown_content: Raw markdown text
+            markdown_content: Raw markdown text, or markdown parts
             collection_name: Target Qdrant collection name
-            
+            streaming: Use the streaming pipeline. If None, uses config.
+            document_id: Stable ID of the document. If None, a UUID is
+                generated.
+            append: Allow ingesting into an existing collection. If None,
+                uses config.
+        
         Returns:
-            Dict with success status and document_id
-            
+            Dict with success status, document_id and point counts
+        
         Raises:
-            ValueError: If collection already exists
+            ValueError: If collection already exists, append mode is off and
+                no document_id is given
             Exception: If processing fails
         """
+        if append is None:
+            append = self.ingestion_config.append
+        
         collection_exists = await self.qdrant_client.client.collection_exists(collection_name)
-        if collection_exists:
+        if collection_exists and document_id is None and not append:
             raise ValueError(f"Collection '{collection_name}' already exists")
         
-        document_id = str(uuid.uuid4())
-        logger.info(f"Processing document: {document_id}")
-        
-        chunks = self.chunker.chunk_document(markdown_content, document_id)
-        logger.info(f"Created {len(chunks)} chunks")
+        if collection_exists:
+            await self.qdrant_client.ensure_payload_indexes(collection_name)
         
-        chunk_texts = [chunk.content for chunk in chunks]
-        dense_embeddings = self.dense_embedder.encode(chunk_texts)
-        logger.info(f"Generated {len(dense_embeddings)} dense embeddings")
+        # Only a caller-supplied ID can have points from an earlier ingest
+        replace_existing = collection_exists and document_id is not None
         
-        sparse_embeddings = self.sparse_embedder.encode(chunk_texts)
-        logger.info(f"Generated {len(sparse_embeddings)} sparse embeddings")
+        if document_id is None:
+            document_id = str(uuid.uuid4())
+        logger.info(f"Processing document: {document_id}")
         
-        await self.qdrant_client.initialize(collection_name)
+        if streaming is None:
+            streaming = self.ingestion_config.streaming
+        is_text = isinstance(markdown_content, str)
+        if not is_text:
+            # Parts are only chunked one at a time
+            streaming = True
         
-        await self.qdrant_client.store_chunks(
-            collection_name=collection_name,
-            chunks=chunks,
-            dense_vectors=dense_embeddings,
-            sparse_vectors=sparse_embeddings,
-            document_id=document_id
-        )
+        if streaming:
+            if not collection_exists:
+                await self.qdrant_client.ensure_collection(collection_name)
+            point_ids = await self._run_streaming_pipeline(
+                self._iter_chunks(markdown_content, document_id),
+                collection_name=collection_name,
+                document_id=document_id
+            )
+            logger.info(f"Successfully streamed {len(point_ids)} chunks for document: {document_id}")
+        else:
+            chunks = self.chunker.chunk_document(markdown_content, document_id)
+            logger.info(f"Created {len(chunks)} chunks")
+            
+            chunk_texts = [chunk.content for chunk in chunks]
+            dense_embeddings, sparse_embeddings = await asyncio.gather(
+                self._encode_dense(chunk_texts),
+                self._encode_sparse(chunk_texts)
+            )
+            logger.info(f"Generated {len(dense_embeddings)} dense embeddings")
+            logger.info(f"Generated {len(sparse_embeddings)} sparse embeddings")
+            
+            if not collection_exists:
+                await self.qdrant_client.ensure_collection(collection_name)
+            
+            point_ids = await self.qdrant_client.store_chunks(
+                collection_name=collection_name,
+                chunks=chunks,
+                dense_vectors=dense_embeddings,
+                sparse_vectors=sparse_embeddings,
+                document_id=document_id
+            )
+            logger.info(f"Successfully processed and stored document: {document_id}")
         
-        logger.info(f"Successfully processed and stored document: {document_id}")
+        deleted = 0
+        if replace_existing:
+            deleted = await self.qdrant_client.delete_stale_points(
+                collection_name, document_id, keep_ids=set(point_ids)
+            )
         
         return {
             "success": True,
             "document_id": document_id,
-            "collection_name": collection_name
+            "collection_name": collection_name,
+            "points_upserted": len(point_ids),
+            "points_deleted": deleted
         }
+    
+    async def _run_streaming_pipeline(
+        self,
+        chunk_batches: AsyncIterable[List[SemanticChunk]],
+        collection_name: str,
+        document_id: str
+    ) -> List[int]:
+        """
+        Run chunking, dense encoding, sparse encoding and storage as
+        concurrent stages connected by bounded queues
+        
+        Each stage blocks on put() when the next stage falls behind, so at
+        most queue_depth batches are buffered between any two stages.
+        Chunking runs in the default executor (see _iter_chunks) and
+        encoding on the EmbeddingExecutor pools, keeping the event loop free.
+        
+        Args:
+            chunk_batches: Chunks in document order, in any batch sizes
+            collection_name: Target Qdrant collection (must exist)
+            document_id: ID of the source document
+        
+        Returns:
+            IDs of the stored points, in document order
+        """
+        config = self.ingestion_config
+        dense_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_depth)
+        sparse_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_depth)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_depth)
+        started_at = time.perf_counter()
+        
+        async def chunk_stage():
+            async for batch in self._rebatch(chunk_batches, config.batch_size):
+                await dense_queue.put(batch)
+            await dense_queue.put(_END_OF_STREAM)
+        
+        async def dense_stage():
+            while (batch := await dense_queue.get()) is not _END_OF_STREAM:
+                texts = [chunk.content for chunk in batch]
+                dense = await self._encode_dense(texts)
+                await sparse_queue.put((batch, texts, dense))
+            await sparse_queue.put(_END_OF_STREAM)
+        
+        async def sparse_stage():
+            while (item := await sparse_queue.get()) is not _END_OF_STREAM:
+                batch, texts, dense = item
+                sparse = await self._encode_sparse(texts)
+                await store_queue.put((batch, dense, sparse))
+            await store_queue.put(_END_OF_STREAM)
+        
+        point_ids: List[int] = []
+        occurrences: Dict[str, int] = {}
+        uploader = self.qdrant_client.create_uploader(collection_name)
+        
+        async def store_stage():
+            while (item := await store_queue.get()) is not _END_OF_STREAM:
+                batch, dense, sparse = item
+                batch_ids = await self.qdrant_client.store_chunks(
+                    collection_name=collection_name,
+                    chunks=batch,
+                    dense_vectors=dense,
+                    sparse_vectors=sparse,
+                    document_id=document_id,
+                    occurrences=occurrences,
+                    uploader=uploader
+                )
+                if not point_ids:
+                    logger.info(
+                        f"First {len(batch)} points stored after "
+                        f"{time.perf_counter() - started_at:.2f}s"
+                    )
+                point_ids.extend(batch_ids)
+            await self.qdrant_client.flush_uploader(uploader)
+        
+        tasks = [
+            asyncio.create_task(chunk_stage()),
+            asyncio.create_task(dense_stage()),
+            asyncio.create_task(sparse_stage()),
+            asyncio.create_task(store_stage()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed stage would leave its neighbours blocked on the queues
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            uploader.abort()
+            raise
+        
+        logger.info(
+            f"Streaming pipeline stored {len(point_ids)} chunks in "
+            f"{time.perf_counter() - started_at:.2f}s"
+        )
+        return point_ids
+    
+    async def _iter_chunks(
+        self,
+        markdown_content: Union[str, AsyncIterable[str]],
+        document_id: str
+    ) -> AsyncIterator[List[SemanticChunk]]:
+        """
+        Chunk markdown text, or markdown parts as they arrive
+        
+        Only chunking runs in the default executor. The next part is
+        awaited on the event loop, so no thread is held while a part is
+        still being produced (e.g. a PDF window converting).
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(markdown_content, str):
+            markdown_content = _single_part(markdown_content)
+        
+        async for part in markdown_content:
+            batches = self.chunker.iter_chunks(part, document_id)
+            while True:
+                chunks = await loop.run_in_executor(None, next, batches, _END_OF_STREAM)
+                if chunks is _END_OF_STREAM:
+                    break
+                yield chunks
+    
+    async def _encode_dense(self, texts: List[str]) -> np.ndarray:
+        """Dense-encode texts, reusing stored vectors for unchanged chunks"""
+        if not self.embedding_store:
+            return await self.embedding_executor.encode_dense(texts)
+        
+        model_name = self.dense_embedder.config.model_name
+        vectors, found_mask = await asyncio.to_thread(
+            self.embedding_store.get_dense, model_name, texts
+        )
+        missing = np.flatnonzero(~found_mask)
+        
+        if len(missing):
+            missing_texts = [texts[i] for i in missing]
+            encoded = await self.embedding_executor.encode_dense(missing_texts)
+            vectors[missing] = encoded
+            await asyncio.to_thread(
+                self.embedding_store.put_dense, model_name, missing_texts, encoded
+            )
+        
+        self._log_reuse(model_name, len(texts), len(missing))
+        return vectors
+    
+    async def _encode_sparse(self, texts: List[str]) -> SparseBatch:
+        """Sparse-encode texts, reusing stored vectors for unchanged chunks"""
+        if not self.embedding_store:
+            return await self.embedding_executor.encode_sparse(texts)
+        
+        model_name = self.sparse_embedder.config.model_name
+        rows = await asyncio.to_thread(self.embedding_store.get_sparse, model_name, texts)
+        missing = [i for i, row in enumerate(rows) if row is None]
+        
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            encoded = await self.embedding_executor.encode_sparse(missing_texts)
+            for i, row in zip(missing, encoded):
+                rows[i] = row
+            await asyncio.to_thread(
+                self.embedding_store.put_sparse, model_name, missing_texts, encoded
+            )
+        
+        self._log_reuse(model_name, len(texts), len(missing))
+        return SparseBatch.from_rows(rows)
+    
+    @staticmethod
+    def _log_reuse(model_name: str, total: int, encoded: int):
+        logger.info(f"{model_name}: reused {total - encoded}/{total} stored embeddings")
+    
+    @staticmethod
+    async def _rebatch(
+        chunk_batches: AsyncIterable[List[SemanticChunk]],
+        batch_size: int
+    ) -> AsyncIterator[List[SemanticChunk]]:
+        """Regroup chunk lists of arbitrary size into batches of batch_size"""
+        buffer: List[SemanticChunk] = []
+        async for chunks in chunk_batches:
+            buffer.extend(chunks)
+            while len(buffer) >= batch_size:
+                yield buffer[:batch_size]
+                buffer = buffer[batch_size:]
+        if buffer:
+            yield buffer
@@ -0,0 +1,221 @@
+import logging
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Subtrees that are never article content
+_SKIP_TAGS = {
+    "head", "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+    "nav", "aside", "form", "button", "select", "dialog",
+}
+# Page chrome outside <article>/<main>; inside them they hold e.g. the title
+_CHROME_TAGS = {"header", "footer"}
+_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+# Content the fast path cannot render faithfully; these pages go to Docling
+_UNSUPPORTED_TAGS = {"table", "math", "frameset", "object", "embed"}
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "param", "source", "track", "wbr",
+}
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "blockquote", "ul", "ol", "li",
+    "dl", "dt", "dd", "figure", "figcaption", "h1", "h2", "h3", "h4", "h5", "h6",
+    "pre", "hr", "br", "address", "details", "summary",
+}
+_CONTENT_ROOTS = {"article", "main"}
+_INLINE_MARKS = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _MarkdownBuilder(HTMLParser):
+    """Collects markdown blocks from an HTML page, in document order"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # (markdown, kind, inside <article>/<main>)
+        self.blocks: List[Tuple[str, str, bool]] = []
+        self.unsupported: Optional[str] = None
+        self._inline: List[str] = []
+        self._prefix = ""
+        self._kind = "p"
+        self._skip_tag: Optional[str] = None
+        self._skip_depth = 0
+        self._content_depth = 0
+        self._quote_depth = 0
+        self._lists: List[List] = []  # [tag, next item number]
+        self._links: List[Tuple[int, Optional[str]]] = []
+        self._marks: List[Tuple[int, str]] = []
+        self._pre: Optional[List[str]] = None
+    
+    def handle_starttag(self, tag, attrs):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        if tag in _SKIP_TAGS or (tag in _CHROME_TAGS and not self._content_depth):
+            self._skip_tag, self._skip_depth = tag, 1
+            return
+        if tag in _UNSUPPORTED_TAGS and self.unsupported is None:
+            self.unsupported = tag
+        if self._pre is not None:
+            return
+        
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if tag in _CONTENT_ROOTS:
+            self._content_depth += 1
+        elif tag in _HEADING_TAGS:
+            self._prefix, self._kind = "#" * int(tag[1]) + " ", "h"
+        elif tag in ("ul", "ol"):
+            self._lists.append([tag, 1])
+        elif tag == "li":
+            indent = "  " * max(len(self._lists) - 1, 0)
+            if self._lists and self._lists[-1][0] == "ol":
+                marker = f"{self._lists[-1][1]}. "
+                self._lists[-1][1] += 1
+            else:
+                marker = "- "
+            self._prefix, self._kind = indent + marker, "li"
+        elif tag == "blockquote":
+            self._quote_depth += 1
+        elif tag == "pre":
+            self._pre = []
+        elif tag == "hr":
+            self._add_block("---", "hr")
+        elif tag == "code" or tag in _INLINE_MARKS:
+            self._marks.append((len(self._inline), _INLINE_MARKS.get(tag, "`")))
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            self._links.append((len(self._inline), href if href.startswith(("http://", "https://")) else None))
+    
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+    
+    def handle_endtag(self, tag):
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._skip_tag = None
+            return
+        if self._pre is not None:
+            if tag == "pre":
+                code = "".join(self._pre).strip("\n")
+                self._pre = None
+                if code.strip():
+                    self._add_block(f"```\n{code}\n```", "pre")
+            return
+        
+        if tag in _BLOCK_TAGS:
+            # A list item or heading ends here even if it had no text
+            self._flush(reset=tag == "li" or tag in _HEADING_TAGS)
+        if tag in _CONTENT_ROOTS:
+            self._content_depth = max(self._content_depth - 1, 0)
+        elif tag in ("ul", "ol") and self._lists:
+            self._lists.pop()
+        elif tag == "blockquote":
+            self._quote_depth = max(self._quote_depth - 1, 0)
+        elif (tag == "code" or tag in _INLINE_MARKS) and self._marks:
+            self._close_mark()
+        elif tag == "a" and self._links:
+            start, href = self._links.pop()
+            text = _WHITESPACE.sub(" ", "".join(self._inline[start:])).strip()
+            if href and text:
+                self._inline[start:] = [f"[{text}]({href})"]
+    
+    def handle_data(self, data):
+        if self._skip_tag is not None:
+            return
+        if self._pre is not None:
+            self._pre.append(data)
+        else:
+            self._inline.append(data)
+    
+    def close(self):
+        super().close()
+        self._flush()
+    
+    def _close_mark(self):
+        """Wrap the text since the matching start tag in its marker"""
+        start, mark = self._marks.pop()
+        text = "".join(self._inline[start:])
+        if not text.strip():
+            # Nothing to emphasize, e.g. <b> around an image
+            return
+        lead = text[:len(text) - len(text.lstrip())]
+        trail = text[len(text.rstrip()):]
+        self._inline[start:] = [lead, mark, text.strip(), mark, trail]
+    
+    def _flush(self, reset: bool = False):
+        """
+        Emit the pending inline text as a block
+        
+        The list marker or heading prefix is kept until text is emitted,
+        so <li><p>item</p></li> still renders as a list item.
+        """
+        text = _WHITESPACE.sub(" ", "".join(self._inline)).strip()
+        if text:
+            self._add_block(self._prefix + text, self._kind)
+        if text or reset:
+            self._prefix, self._kind = "", "p"
+        self._inline, self._marks, self._links = [], [], []
+    
+    def _add_block(self, markdown: str, kind: str):
+        if self._quote_depth:
+            quote = "> " * self._quote_depth
+            markdown = "\n".join(quote + line for line in markdown.split("\n"))
+        self.blocks.append((markdown, kind, self._content_depth > 0))
+
+
+def simple_html_to_markdown(html_content: str, min_chars: int = 200) -> Optional[str]:
+    """
+    Convert a simple article page to markdown without Docling
+    
+    Handles headings, paragraphs, lists, quotes, code blocks, links and
+    emphasis with the standard library HTML parser. Navigation, headers,
+    footers, scripts and forms are dropped; if the page has <article> or
+    <main> content, only that is kept.
+    
+    Args:
+        html_content: HTML page
+        min_chars: Minimum markdown length to accept the result
+    
+    Returns:
+        Markdown, or None if the page needs the full Docling pipeline
+        (tables, formulas, embedded objects, or too little text found)
+    """
+    builder = _MarkdownBuilder()
+    try:
+        builder.feed(html_content)
+        builder.close()
+    except Exception as e:
+        logger.debug(f"HTML fast path could not parse page: {e}")
+        return None
+    
+    if builder.unsupported:
+        logger.debug(f"HTML fast path skipped: page contains <{builder.unsupported}>")
+        return None
+    
+    blocks = builder.blocks
+    if any(in_content for _, _, in_content in blocks):
+        blocks = [block for block in blocks if block[2]]
+    if not any(kind == "p" for _, kind, _ in blocks):
+        return None
+    
+    parts: List[str] = []
+    previous_kind = None
+    for markdown, kind, _ in blocks:
+        if parts:
+            # Keep list items of one list together
+            parts.append("\n" if kind == previous_kind == "li" else "\n\n")
+        parts.append(markdown)
+        previous_kind = kind
+    markdown = "".join(parts)
+    
+    if len(markdown) < min_chars:
+        return None
+    return markdown
@@ -0,0 +1,459 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from internal.config import DoclingConfig, PdfJobsConfig
+from internal.processing.pdf_windows import MarkdownStitcher, PageRange, page_windows, pdf_page_count
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
+
+
+FINISHED_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.TIMED_OUT}
+
+
+@dataclass
+class PageWindow:
+    """A page range of a job, converted by one worker"""
+    index: int
+    page_range: Optional[PageRange]  # None = the whole file
+    status: JobStatus = JobStatus.QUEUED
+    markdown: Optional[str] = None  # As converted, before stitching
+    piece: Optional[str] = None  # Continuation of the stitched document
+    standalone: Optional[str] = None  # With enclosing headings, for chunking on its own
+    error: Optional[str] = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    
+    @property
+    def label(self) -> str:
+        return f"pages {self.page_range[0]}-{self.page_range[1]}" if self.page_range else "all pages"
+    
+    def to_dict(self, include_markdown: bool = False) -> Dict[str, Any]:
+        data = {
+            "window": self.index,
+            "pages": list(self.page_range) if self.page_range else None,
+            "status": self.status.value,
+            "error": self.error,
+        }
+        if include_markdown and self.piece is not None:
+            data["markdown"] = self.piece
+        return data
+
+
+@dataclass
+class PdfJob:
+    """One PDF extraction job and, once finished, its result"""
+    id: str
+    filename: str
+    path: Path
+    status: JobStatus = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    markdown: Optional[str] = None
+    error: Optional[str] = None
+    page_count: Optional[int] = None
+    windows: List[PageWindow] = field(default_factory=list)
+    planned: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+    
+    def to_dict(self, include_markdown: bool = False) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "filename": self.filename,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "page_count": self.page_count,
+        }
+        if self.windows:
+            data["windows"] = {
+                "total": len(self.windows),
+                "converted": sum(1 for window in self.windows if window.status == JobStatus.SUCCEEDED),
+            }
+        if self.started_at and self.finished_at:
+            data["seconds"] = round(self.finished_at - self.started_at, 3)
+        if self.markdown is not None:
+            data["char_count"] = len(self.markdown)
+            if include_markdown:
+                data["markdown"] = self.markdown
+        return data
+
+
+def _worker_main(conn, docling_config: DoclingConfig):
+    """
+    Worker process loop: receive PDF page windows, send back markdown
+    
+    Messages in are (path, page_range) or None to exit, page_range being
+    None for the whole file; messages out are (True, markdown) or
+    (False, error message). The worker's PDF converter stays warm
+    between jobs.
+    """
+    from internal.processing.document_extractor import convert_pdf_to_markdown
+    from internal.processing.converter_pool import ConverterPool
+    
+    if docling_config.warm_up:
+        ConverterPool.warm_up(("pdf",))
+    
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        path, page_range = message
+        try:
+            conn.send((True, convert_pdf_to_markdown(Path(path), page_range)))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    """
+    A long-lived conversion process talking over a pipe
+    
+    Unlike a ProcessPoolExecutor worker it can be killed on its own, so a
+    timed-out or cancelled job does not take other running jobs down.
+    """
+    def __init__(self, index: int, context, docling_config: DoclingConfig):
+        self.index = index
+        self._context = context
+        self._docling_config = docling_config
+        self.process = None
+        self.conn = None
+    
+    def start(self):
+        parent_conn, child_conn = self._context.Pipe()
+        self.process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._docling_config),
+            name=f"pdf-worker-{self.index}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+    
+    def convert(self, path: Path, page_range: Optional[PageRange] = None):
+        """Blocking round trip; raises EOFError if the process dies"""
+        self.conn.send((str(path), page_range))
+        return self.conn.recv()
+    
+    def restart(self):
+        """Kill the process (aborting its conversion) and start a fresh one"""
+        self.stop(graceful=False)
+        self.start()
+    
+    def stop(self, graceful: bool = True):
+        if self.process is None:
+            return
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+        self.conn.close()
+        self.process = None
+
+
+class PdfJobManager:
+    """
+    Background PDF-to-markdown conversion on a pool of worker processes.
+    
+    submit() stores the PDF and returns immediately with a queued job; a
+    server-owned task waits for an idle worker, runs the conversion and
+    records the result, so jobs keep running when the client disconnects.
+    Clients poll status()/result() or consume stream().
+    
+    A PDF longer than pages_per_window is split into page windows that
+    are converted in parallel, one per idle worker process, so a single
+    long document also uses up to `workers` cores. Windows are stitched
+    back together in page order (MarkdownStitcher) as they finish;
+    windows() yields them as soon as they are stitched, so the start of
+    a document can be streamed or ingested while the rest converts.
+    
+    A window that exceeds job_timeout_seconds, or is cancelled while
+    running, kills its worker, which is replaced by a fresh process. The
+    first failed window fails the job and cancels its other windows.
+    
+    Attributes:
+        config: PdfJobsConfig with pool size, timeout and retention
+        docling_config: DoclingConfig for the workers' converters
+    """
+    def __init__(self, config: PdfJobsConfig, docling_config: Optional[DoclingConfig] = None):
+        self.config = config
+        self.docling_config = docling_config or DoclingConfig()
+        self.upload_dir = Path(config.upload_dir)
+        self._jobs: Dict[str, PdfJob] = {}
+        self._workers: List[_Worker] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._closing = False
+    
+    async def start(self):
+        """Start the worker processes"""
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        context = multiprocessing.get_context("spawn")
+        self._threads = ThreadPoolExecutor(
+            max_workers=self.config.workers,
+            thread_name_prefix="pdf-job"
+        )
+        self._idle = asyncio.Queue()
+        for index in range(self.config.workers):
+            worker = _Worker(index, context, self.docling_config)
+            await asyncio.to_thread(worker.start)
+            self._workers.append(worker)
+            self._idle.put_nowait(worker)
+        logger.info(f"PdfJobManager started with {self.config.workers} workers")
+    
+    async def submit(self, filename: str, data: bytes) -> PdfJob:
+        """
+        Queue a PDF for conversion
+        
+        Args:
+            filename: Original file name
+            data: PDF bytes
+        
+        Returns:
+            The queued PdfJob
+        
+        Raises:
+            RuntimeError: If max_pending_jobs jobs are already queued or running
+        """
+        self._prune()
+        pending = sum(1 for job in self._jobs.values() if not job.finished)
+        if pending >= self.config.max_pending_jobs:
+            raise RuntimeError(f"Too many pending PDF jobs ({pending})")
+        
+        job_id = uuid.uuid4().hex
+        path = self.upload_dir / f"{job_id}.pdf"
+        await asyncio.to_thread(path.write_bytes, data)
+        
+        job = PdfJob(id=job_id, filename=filename, path=path)
+        job.task = asyncio.create_task(self._run(job))
+        self._jobs[job_id] = job
+        logger.info(f"Queued PDF job {job_id} ({filename}, {len(data)} bytes)")
+        return job
+    
+    def get(self, job_id: str) -> Optional[PdfJob]:
+        return self._jobs.get(job_id)
+    
+    def list_jobs(self) -> List[PdfJob]:
+        return sorted(self._jobs.values(), key=lambda job: job.created_at)
+    
+    def cancel(self, job_id: str) -> Optional[PdfJob]:
+        """
+        Cancel a queued or running job; finished jobs are left unchanged
+        
+        Returns:
+            The job, or None if it is unknown
+        """
+        job = self._jobs.get(job_id)
+        if job is not None and not job.finished and job.task is not None:
+            job.task.cancel()
+        return job
+    
+    async def wait(self, job_id: str) -> PdfJob:
+        """Wait until a job is finished"""
+        job = self._jobs[job_id]
+        await job.done.wait()
+        return job
+    
+    async def stream(self, job_ids: Sequence[str]) -> AsyncIterator[PdfJob]:
+        """
+        Yield jobs in the order they finish
+        
+        Args:
+            job_ids: Known job IDs (unknown ones are skipped)
+        """
+        jobs = [self._jobs[job_id] for job_id in job_ids if job_id in self._jobs]
+        
+        async def finished(job: PdfJob) -> PdfJob:
+            await job.done.wait()
+            return job
+        
+        for next_done in asyncio.as_completed([finished(job) for job in jobs]):
+            yield await next_done
+    
+    async def windows(self, job_id: str) -> AsyncIterator[PageWindow]:
+        """
+        Yield a job's page windows in page order, each once it is stitched
+        
+        Stops early if the job fails or is cancelled; check job.status
+        after the iteration ends.
+        
+        Args:
+            job_id: A known job ID
+        """
+        job = self._jobs[job_id]
+        await job.planned.wait()
+        for window in job.windows:
+            await window.ready.wait()
+            if window.piece is None:
+                return
+            yield window
+    
+    def stats(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status.value] = counts.get(job.status.value, 0) + 1
+        return {
+            "workers": self.config.workers,
+            "idle_workers": self._idle.qsize() if self._idle else 0,
+            "jobs": counts,
+        }
+    
+    async def shutdown(self):
+        """Cancel unfinished jobs and stop the workers"""
+        self._closing = True
+        tasks = [job.task for job in self._jobs.values() if job.task and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for worker in self._workers:
+            await asyncio.to_thread(worker.stop)
+        if self._threads:
+            self._threads.shutdown(wait=False)
+        logger.info("PdfJobManager stopped")
+    
+    async def _run(self, job: PdfJob):
+        tasks: List[asyncio.Task] = []
+        try:
+            job.windows = await self._plan(job)
+            job.planned.set()
+            tasks = [asyncio.create_task(self._run_window(job, window)) for window in job.windows]
+            
+            stitcher = MarkdownStitcher()
+            stitched = 0
+            pending = set(tasks)
+            while pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                failed = next(
+                    (window for window in job.windows
+                     if window.status in FINISHED_STATUSES and window.status != JobStatus.SUCCEEDED),
+                    None
+                )
+                if failed is not None:
+                    job.status = failed.status
+                    job.error = failed.error if len(job.windows) == 1 else f"{failed.label}: {failed.error}"
+                    break
+                # Stitch the finished windows that directly follow the stitched ones
+                while stitched < len(job.windows) and job.windows[stitched].status == JobStatus.SUCCEEDED:
+                    window = job.windows[stitched]
+                    window.piece, window.standalone = stitcher.add(window.markdown)
+                    window.ready.set()
+                    stitched += 1
+            else:
+                job.status = JobStatus.SUCCEEDED
+                job.markdown = "".join(window.piece for window in job.windows)
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+        except Exception as e:
+            # E.g. a stitching error; never leave the job queued/running
+            logger.error(f"PDF job {job.id} failed: {e}")
+            job.status = JobStatus.FAILED
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+            
+            job.finished_at = time.time()
+            job.path.unlink(missing_ok=True)
+            job.planned.set()
+            for window in job.windows:
+                window.ready.set()
+            job.done.set()
+            logger.info(f"PDF job {job.id} {job.status.value}")
+    
+    async def _plan(self, job: PdfJob) -> List[PageWindow]:
+        """Split a job into page windows"""
+        try:
+            job.page_count = await asyncio.to_thread(pdf_page_count, job.path)
+            ranges = page_windows(job.page_count, self.config.pages_per_window)
+        except Exception as e:
+            # Let the worker convert the file whole and report the real error
+            logger.warning(f"Could not count pages of {job.filename}: {e}")
+            ranges = [None]
+        if len(ranges) > 1:
+            logger.info(f"PDF job {job.id}: {job.page_count} pages in {len(ranges)} windows")
+        return [PageWindow(index=index, page_range=page_range) for index, page_range in enumerate(ranges)]
+    
+    async def _run_window(self, job: PdfJob, window: PageWindow):
+        worker: Optional[_Worker] = None
+        try:
+            worker = await self._idle.get()
+            window.status = JobStatus.RUNNING
+            if job.started_at is None:
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+            logger.info(f"PDF job {job.id} {window.label} running on worker {worker.index}")
+            
+            loop = asyncio.get_running_loop()
+            ok, payload = await asyncio.wait_for(
+                loop.run_in_executor(self._threads, worker.convert, job.path, window.page_range),
+                timeout=self.config.job_timeout_seconds
+            )
+            if ok:
+                window.status, window.markdown = JobStatus.SUCCEEDED, payload
+            else:
+                window.status, window.error = JobStatus.FAILED, payload
+        except asyncio.TimeoutError:
+            window.status = JobStatus.TIMED_OUT
+            window.error = f"Conversion exceeded {self.config.job_timeout_seconds}s"
+            await self._restart(worker)
+        except asyncio.CancelledError:
+            if window.status == JobStatus.RUNNING:
+                await self._restart(worker)
+            window.status = JobStatus.CANCELLED
+        except Exception as e:
+            # EOFError/BrokenPipeError: the worker died (e.g. out of memory)
+            window.status, window.error = JobStatus.FAILED, f"Worker failed: {type(e).__name__}: {e}"
+            if worker is not None:
+                await self._restart(worker)
+        finally:
+            if worker is not None:
+                self._idle.put_nowait(worker)
+    
+    async def _restart(self, worker: _Worker):
+        if self._closing:
+            return
+        logger.warning(f"Restarting PDF worker {worker.index}")
+        await asyncio.shield(asyncio.to_thread(worker.restart))
+    
+    def _prune(self):
+        """Forget finished jobs older than result_ttl_seconds"""
+        cutoff = time.time() - self.config.result_ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
@@ -0,0 +1,149 @@
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# 1-based, inclusive page range as accepted by DocumentConverter.convert
+PageRange = Tuple[int, int]
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+# Lines that are not running paragraph text: headings, lists, tables,
+# quotes, fences, images and comments
+_BLOCK_START = re.compile(r"^\s*([#|>`~!*+-]|\d+[.)]\s|<!--)")
+_SENTENCE_END = ".!?:;\"')]”’"
+
+
+def pdf_page_count(pdf_path: Path) -> int:
+    """Number of pages in a PDF (pypdfium2 ships with Docling)"""
+    import pypdfium2 as pdfium
+    
+    document = pdfium.PdfDocument(str(pdf_path))
+    try:
+        return len(document)
+    finally:
+        document.close()
+
+
+def page_windows(page_count: int, pages_per_window: Optional[int]) -> List[Optional[PageRange]]:
+    """
+    Split pages 1..page_count into consecutive windows
+    
+    Args:
+        page_count: Pages in the document
+        pages_per_window: Window size; None converts the file in one piece
+    
+    Returns:
+        Page ranges in page order, or [None] (whole file) when the document
+        fits in one window
+    """
+    if not pages_per_window or page_count <= pages_per_window:
+        return [None]
+    return [
+        (start, min(start + pages_per_window - 1, page_count))
+        for start in range(1, page_count + 1, pages_per_window)
+    ]
+
+
+def _is_paragraph_line(line: str) -> bool:
+    return bool(line.strip()) and not _BLOCK_START.match(line)
+
+
+class MarkdownStitcher:
+    """
+    Join markdown converted from consecutive page windows, in page order.
+    
+    Docling converts every window as if it were a whole document, so:
+    - the first heading of a later window is often exported as a document
+      title ("# "); in windows after the first these are demoted to "## "
+    - a paragraph running across the window boundary comes out as two
+      paragraphs; they are joined when the first does not end a sentence
+      and the second starts in lower case
+    - content at the top of a window belongs to the section still open at
+      the end of the previous one; add() tracks the heading stack so a
+      window can also be chunked on its own under the right section path
+    
+    Concatenating the pieces returned by add() gives the stitched document.
+    """
+    def __init__(self):
+        self.windows = 0
+        self._headings: List[Tuple[int, str]] = []
+        self._open_paragraph = False
+        self._emitted = False
+    
+    def add(self, markdown: str) -> Tuple[str, str]:
+        """
+        Append the next window
+        
+        Args:
+            markdown: Markdown of the window, as exported by Docling
+        
+        Returns:
+            (piece, standalone): piece continues the stitched document;
+            standalone is the window prefixed with the headings of the
+            sections it continues, for chunking it independently
+        """
+        lines = self._normalize(markdown.strip("\n").splitlines())
+        self.windows += 1
+        if not any(line.strip() for line in lines):
+            return "", ""
+        
+        context = self._context(lines)
+        body = "\n".join(lines)
+        if not self._emitted:
+            separator = ""
+        elif self._open_paragraph and _is_paragraph_line(lines[0]) and lines[0].lstrip()[:1].islower():
+            separator = " "
+        else:
+            separator = "\n\n"
+        
+        self._track(lines)
+        self._emitted = True
+        return separator + body, context + body
+    
+    def _normalize(self, lines: List[str]) -> List[str]:
+        """Demote title headings in windows after the first"""
+        if not self._emitted:
+            return lines
+        normalized, in_fence = [], False
+        for line in lines:
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith("# "):
+                line = "#" + line
+            normalized.append(line)
+        return normalized
+    
+    def _context(self, lines: List[str]) -> str:
+        """Open headings that enclose the start of this window"""
+        first = next(line for line in lines if line.strip())
+        match = _HEADING.match(first)
+        level = len(match.group(1)) if match else 7
+        enclosing = [f"{'#' * depth} {title}" for depth, title in self._headings if depth < level]
+        return "\n\n".join(enclosing) + "\n\n" if enclosing else ""
+    
+    def _track(self, lines: List[str]):
+        """Update the heading stack and whether the last paragraph is unfinished"""
+        in_fence = False
+        for line in lines:
+            if _FENCE.match(line):
+                in_fence = not in_fence
+                continue
+            match = None if in_fence else _HEADING.match(line)
+            if match:
+                depth = len(match.group(1))
+                while self._headings and self._headings[-1][0] >= depth:
+                    self._headings.pop()
+                self._headings.append((depth, match.group(2)))
+        
+        last = next(line for line in reversed(lines) if line.strip())
+        self._open_paragraph = (
+            not in_fence
+            and _is_paragraph_line(last)
+            and not last.rstrip().endswith(tuple(_SENTENCE_END))
+        )
+
+
+def stitch_markdown(parts: Iterable[str]) -> str:
+    """Join the markdown of consecutive page windows into one document"""
+    stitcher = MarkdownStitcher()
+    return "".join(stitcher.add(part)[0] for part in parts)
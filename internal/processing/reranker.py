@@ -1,9 +1,12 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 import numpy as np
 from sentence_transformers import CrossEncoder
 
 from internal.config import RerankerConfig
+from internal import onnx_backend
+from internal.token_counter import TokenCounter
+from internal.length_batching import token_budget_batches, run_in_batches, padding_efficiency
 
 logger = logging.getLogger(__name__)
 
@@ -11,13 +14,58 @@ logger = logging.getLogger(__name__)
 class Reranker:
     """Rerank search results using CrossEncoder models"""
     
-    def __init__(self, config: RerankerConfig):
+    def __init__(self, config: RerankerConfig, model_name: Optional[str] = None):
+        """
+        Args:
+            config: Reranker settings
+            model_name: Model to load instead of config.model_name, e.g.
+                config.cascade_model_name for the cascade's first stage
+        """
         self.config = config
+        self.model_name = model_name or config.model_name
+        self.backend = config.backend
+        
+        logger.info(f"Loading reranker model: {self.model_name} ({config.backend})")
+        if config.backend == "torch":
+            self.model = CrossEncoder(self.model_name, device=config.device)
+        else:
+            self.model = self._load_onnx()
         
-        logger.info(f"Loading reranker model: {config.model_name}")
-        self.model = CrossEncoder(config.model_name, device=config.device)
+        self.tokenizer = TokenCounter.get_tokenizer(self.model_name)
+        self.max_length = getattr(self.model, "max_length", None) or 512
         logger.info("Reranker model loaded successfully")
     
+    def _load_onnx(self):
+        """Load the ONNX model, falling back to PyTorch if scores diverge"""
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        
+        onnx_config = self.config.onnx
+        ort_model, tokenizer = onnx_backend.load_ort_model(
+            ORTModelForSequenceClassification,
+            self.model_name,
+            "sequence-classification",
+            self.config.backend,
+            onnx_config
+        )
+        model = onnx_backend.OnnxCrossEncoder(ort_model, tokenizer)
+        if not onnx_config.parity_check:
+            return model
+        
+        reference = CrossEncoder(self.model_name, device="cpu")
+        probes = [[onnx_backend.PARITY_PROBES[0], text] for text in onnx_backend.PARITY_PROBES]
+        passed = onnx_backend.check_parity(
+            reference.predict(probes),
+            model.predict(probes),
+            onnx_backend.parity_tolerance(onnx_config, self.config.backend),
+            label=self.model_name
+        )
+        if passed:
+            return model
+        
+        logger.warning(f"Falling back to PyTorch for {self.model_name}")
+        self.backend = "torch"
+        return CrossEncoder(self.model_name, device=self.config.device)
+    
     def predict(self, query_doc_pairs: List[List[str]]) -> np.ndarray:
         """
         Score query-document pairs
@@ -32,5 +80,32 @@ class Reranker:
             return np.array([])
         
         logger.info(f"Reranking {len(query_doc_pairs)} query-document pairs")
-        scores = self.model.predict(query_doc_pairs, batch_size=self.config.batch_size)
-        return scores
\ No newline at end of file
+        if self.config.max_batch_tokens is None:
+            return self.model.predict(query_doc_pairs, batch_size=self.config.batch_size)
+        
+        lengths = self._pair_lengths(query_doc_pairs)
+        batches = token_budget_batches(lengths, self.config.max_batch_tokens, self.config.batch_size)
+        logger.debug(
+            f"{len(batches)} length-bucketed batches, "
+            f"padding efficiency {padding_efficiency(lengths, batches):.0%}"
+        )
+        return run_in_batches(
+            query_doc_pairs,
+            batches,
+            lambda batch: self.model.predict(batch, batch_size=len(batch))
+        )
+    
+    def _pair_lengths(self, query_doc_pairs: List[List[str]]) -> List[int]:
+        """
+        Estimate the token length of each (query, document) pair
+        
+        Uses cached single-text counts (query + document, capped at the
+        model's max length) rather than encoding the pairs, which is
+        accurate enough to group pairs by length.
+        """
+        texts = list({text for pair in query_doc_pairs for text in pair})
+        _, counts, _ = TokenCounter.truncate_batch_with_counts(
+            texts, self.max_length, self.model_name, self.tokenizer
+        )
+        count_of = dict(zip(texts, counts))
+        return [min(count_of[query] + count_of[doc], self.max_length) for query, doc in query_doc_pairs]
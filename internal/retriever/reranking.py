@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..processing.reranker import Reranker
+from ..embedding.micro_batcher import MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+
+class RerankScoreCache:
+    """
+    LRU cache of cross-encoder scores keyed by (model, query, point id).
+
+    Point IDs are derived from chunk content, so a cached score stays valid
+    until the chunk text changes. Queries are hashed after whitespace
+    normalization; the cache lives on the event loop and needs no lock.
+
+    Attributes:
+        max_entries: Scores kept before the least recently used are evicted
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._scores: "OrderedDict[Tuple[str, str, Any], float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def query_key(model_name: str, query_text: str) -> str:
+        normalized = " ".join(query_text.split())
+        return hashlib.sha256(f"{model_name}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, query_key: str, point_id: Any) -> Optional[float]:
+        key = (query_key, point_id)
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, query_key: str, point_id: Any, score: float):
+        key = (query_key, point_id)
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_entries:
+            self._scores.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._scores),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class RerankPipeline:
+    """
+    Budgeted cross-encoder reranking of fused search candidates.
+
+    Only the first max_candidates candidates (in fusion order) are scored;
+    the rest are appended unscored in fusion order, so reranking cost is
+    fixed per query instead of growing with the number of candidates.
+
+    With a cascade model, the small cross-encoder scores every budgeted
+    candidate and only its cascade_top_k best are scored by the large
+    model. The final order is: large-model ranking, then the remaining
+    small-model ranking, then the unscored tail. Scores from different
+    stages are not comparable; only the order is meaningful across stages.
+
+    Scores of both models are cached per (query, point id).
+
+    Attributes:
+        reranker: Final cross-encoder
+        rerank_batcher: Optional MicroBatcher over reranker.predict
+        cascade_reranker: Optional small cross-encoder for the first stage
+        cache: RerankScoreCache, None when disabled
+    """
+    def __init__(
+        self,
+        reranker: Reranker,
+        rerank_batcher: Optional[MicroBatcher] = None,
+        cascade_reranker: Optional[Reranker] = None
+    ):
+        self.reranker = reranker
+        self.rerank_batcher = rerank_batcher
+        self.cascade_reranker = cascade_reranker
+        self.config = reranker.config
+        self.cache = (
+            RerankScoreCache(self.config.score_cache_size)
+            if self.config.score_cache_size > 0 else None
+        )
+
+    async def rerank(self, query_text: str, points: Sequence[Any]) -> List[Tuple[Any, float]]:
+        """
+        Rerank candidates within the configured budget
+
+        Args:
+            query_text: Original query text
+            points: Candidates from Qdrant in fusion order
+
+        Returns:
+            (point, score) pairs in final order; unscored points keep
+            their fusion score
+        """
+        budget = self.config.max_candidates or len(points)
+        candidates, tail = list(points[:budget]), list(points[budget:])
+
+        ranked: List[Tuple[Any, float]] = []
+        if self.cascade_reranker is not None and len(candidates) > self.config.cascade_top_k:
+            first_stage = await self._score(self.cascade_reranker, query_text, candidates)
+            first_stage.sort(key=lambda x: x[1], reverse=True)
+            candidates = [point for point, _ in first_stage[:self.config.cascade_top_k]]
+            ranked = first_stage[self.config.cascade_top_k:]
+
+        final_stage = await self._score(self.reranker, query_text, candidates)
+        final_stage.sort(key=lambda x: x[1], reverse=True)
+
+        logger.info(
+            f"Reranked {len(candidates)} candidates"
+            + (f" after cascade over {len(candidates) + len(ranked)}" if ranked else "")
+            + (f", {len(tail)} kept in fusion order" if tail else "")
+        )
+        return final_stage + ranked + [(point, point.score) for point in tail]
+
+    async def _score(self, model: Reranker, query_text: str, points: List[Any]) -> List[Tuple[Any, float]]:
+        """Score points with one model, reusing cached scores"""
+        query_key = RerankScoreCache.query_key(model.model_name, query_text)
+        scores: List[Optional[float]] = [
+            self.cache.get(query_key, point.id) if self.cache else None
+            for point in points
+        ]
+
+        misses = [i for i, score in enumerate(scores) if score is None]
+        if misses:
+            pairs = [[query_text, points[i].payload.get("content", "")] for i in misses]
+            if model is self.reranker and self.rerank_batcher:
+                computed = await self.rerank_batcher.submit_many(pairs)
+            else:
+                computed = await asyncio.to_thread(model.predict, pairs)
+
+            for i, score in zip(misses, computed):
+                scores[i] = float(score)
+                if self.cache:
+                    self.cache.put(query_key, points[i].id, scores[i])
+
+        logger.debug(f"{model.model_name}: {len(points) - len(misses)}/{len(points)} scores cached")
+        return list(zip(points, scores))
@@ -2,9 +2,15 @@ from typing import List, Dict, Any, Optional
 import logging
 import numpy as np
 
+from qdrant_client.models import Filter
+
 from ..storage.qdrant_client import QdrantClient
+from ..storage.query_planner import HybridQueryPlanner
+from ..embedding.vectors import SparseRow
 from ..processing.reranker import Reranker
-from ..config import LLMConfig
+from ..embedding.micro_batcher import MicroBatcher
+from .reranking import RerankPipeline
+from ..config import LLMConfig, HybridSearchConfig
 
 logger = logging.getLogger(__name__)
 
@@ -15,23 +21,37 @@ class Retriever:
     def __init__(
         self, 
         qdrant_client: QdrantClient,
-        reranker: Reranker,
+        reranker: Optional[Reranker],
         llm_config: Optional[LLMConfig] = None,
         processor = None,
+        rerank_batcher: Optional[MicroBatcher] = None,
+        search_config: Optional[HybridSearchConfig] = None,
+        cascade_reranker: Optional[Reranker] = None,
     ):
         """
         Initialize search engine
         
         Args:
             qdrant_client: Qdrant client for vector search
-            reranker: Reranker for scoring results
+            reranker: Reranker for scoring results; None keeps fusion order
             llm_config: Configuration for LLM generation
             processor: Optional processor for post-processing (e.g., compression)
+            rerank_batcher: Optional MicroBatcher over reranker.predict that
+                shares cross-encoder passes between concurrent searches
+            search_config: Hybrid query planning defaults
+            cascade_reranker: Optional small cross-encoder that pre-scores
+                candidates so only the best reach the reranker
         """
         self.qdrant_client = qdrant_client
         self.reranker = reranker
         self.llm_config = llm_config
         self.processor = processor
+        self.rerank_batcher = rerank_batcher
+        self.planner = HybridQueryPlanner(search_config)
+        self.rerank_pipeline = (
+            RerankPipeline(reranker, rerank_batcher, cascade_reranker)
+            if reranker is not None else None
+        )
         
     
     async def search(
@@ -39,8 +59,13 @@ class Retriever:
         query_text: str,
         collection_name: str,
         query_dense_embedding: np.ndarray,
-        query_sparse_embedding: Dict[str, Any],
-        limit: int = 10
+        query_sparse_embedding: SparseRow,
+        limit: int = 10,
+        query_filter: Optional[Filter] = None,
+        prefetch_limit: Optional[int] = None,
+        fusion: Optional[str] = None,
+        hnsw_ef: Optional[int] = None,
+        dense_weight: Optional[float] = None
     ) -> str:
         """
         Execute search with reranking, optional processing, and LLM generation
@@ -50,16 +75,36 @@ class Retriever:
             query_dense_embedding: Dense embedding vector for the query
             query_sparse_embedding: Sparse embedding for the query
             limit: Maximum number of results to return
+            query_filter: Optional payload filter, e.g. restricting the
+                search to some documents of a shared collection
+            prefetch_limit: Per-branch candidate depth (default: adaptive)
+            fusion: rrf | dbsf | weighted (default: config)
+            hnsw_ef: Dense HNSW ef (default: config)
+            dense_weight: Dense share for weighted fusion (default: config)
             
         Returns:
             Generated LLM response
         """
-        logger.info(f"Retrieving candidates (limit: {limit})...")
+        reranking = self.rerank_pipeline is not None
+        plan = self.planner.plan(
+            limit,
+            rerank_budget=self.planner.config.rerank_candidates if reranking else None,
+            prefetch_limit=prefetch_limit,
+            fusion=fusion,
+            hnsw_ef=hnsw_ef,
+            dense_weight=dense_weight
+        )
+        
+        logger.info(
+            f"Retrieving candidates (limit: {limit}, fused: {plan.limit}, "
+            f"prefetch: {plan.prefetch_limit}, fusion: {plan.fusion})..."
+        )
         query_response = await self.qdrant_client.query_points(
             collection_name=collection_name,
             query_dense_embedding=query_dense_embedding,
             query_sparse_embedding=query_sparse_embedding,
-            limit=limit
+            query_filter=query_filter,
+            plan=plan
         )
         
         points = query_response.points
@@ -69,8 +114,11 @@ class Retriever:
         
         logger.info(f"Retrieved {len(points)} candidates")
         
-        logger.info("Reranking results...")
-        reranked_results = self._rerank_results(query_text, points)
+        if reranking:
+            logger.info("Reranking results...")
+            reranked_results = (await self._rerank_results(query_text, points))[:limit]
+        else:
+            reranked_results = [self._to_result(point, point.score) for point in points[:limit]]
         
         # Non compressed context    
         context = "\n\n---\n\n".join([
@@ -85,7 +133,7 @@ class Retriever:
         
         return context
     
-    def _rerank_results(self, query_text: str, points: List[Any]) -> List[Dict[str, Any]]:
+    async def _rerank_results(self, query_text: str, points: List[Any]) -> List[Dict[str, Any]]:
         """
         Rerank search results using cross-encoder
         
@@ -94,22 +142,16 @@ class Retriever:
             points: Search results from Qdrant
             
         Returns:
-            Reranked results sorted by score
+            Results in reranked order; candidates beyond the reranker's
+            budget follow in fusion order
         """
-        doc_texts = [p.payload.get("content", "") for p in points]
-        query_doc_pairs = [[query_text, doc] for doc in doc_texts]
-        
-        rerank_scores = self.reranker.predict(query_doc_pairs)
-        
-        results = []
-        for i, score in enumerate(rerank_scores):
-            results.append({
-                "score": float(score),
-                "content": points[i].payload.get("content"),
-                "metadata": {k: v for k, v in points[i].payload.items() if k != "content"}
-            })
-        
-        results.sort(key=lambda x: x["score"], reverse=True)
-        
-        logger.info(f"Reranked {len(results)} results")
-        return results
\ No newline at end of file
+        ranked = await self.rerank_pipeline.rerank(query_text, points)
+        return [self._to_result(point, score) for point, score in ranked]
+    
+    @staticmethod
+    def _to_result(point: Any, score: float) -> Dict[str, Any]:
+        return {
+            "score": float(score),
+            "content": point.payload.get("content"),
+            "metadata": {k: v for k, v in point.payload.items() if k != "content"}
+        }
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -7,12 +8,19 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from internal.embedding.dense_embedder import DenseEmbedder
 from internal.embedding.sparse_embedder import SparseEmbedder
+from internal.embedding.embedding_executor import EmbeddingExecutor
+from internal.embedding.micro_batcher import MicroBatcher
+from internal.embedding.query_encoder import QueryEncoder
+from internal.embedding.query_cache import QueryEmbeddingCache
 from internal.processing.reranker import Reranker
 from internal.storage.qdrant_client import QdrantClient
 from internal.chunkers import ChunkerFactory, BaseDocumentChunker
 from internal.retriever.retriever import Retriever
 from internal.processing.document_processor import DocumentProcessor
+from internal.processing.pdf_jobs import PdfJobManager
+from internal.processing.converter_pool import ConverterPool
 from internal.searxng.client import SearXNGClient
+from internal.fetcher import URLFetcher, load_fetcher_config
 
 from internal.config import (
     load_config,
@@ -53,12 +61,18 @@ class ServerState:
         
         self.dense_embedder: Optional[DenseEmbedder] = None
         self.sparse_embedder: Optional[SparseEmbedder] = None
+        self.embedding_executor: Optional[EmbeddingExecutor] = None
+        self.query_encoder: Optional[QueryEncoder] = None
+        self.rerank_batcher: Optional[MicroBatcher] = None
         self.reranker: Optional[Reranker] = None
+        self.cascade_reranker: Optional[Reranker] = None
+        self.pdf_jobs: Optional[PdfJobManager] = None
         self.qdrant_client: Optional[QdrantClient] = None
         self.chunker: Optional[BaseDocumentChunker] = None
         self.retriever: Optional[Retriever] = None
         self.document_processor: Optional[DocumentProcessor] = None
         self.searxng_client: Optional[SearXNGClient] = None
+        self.url_fetcher: Optional[URLFetcher] = None
 
 
 @asynccontextmanager
@@ -91,11 +105,41 @@ async def lifespan(app: FastAPI):
     #     logger.error(f"Failed to load sparse embedder: {e}")
     #     raise
     
+    try:
+        if state.dense_embedder and state.sparse_embedder:
+            logger.info("Initializing embedding executor...")
+            state.embedding_executor = EmbeddingExecutor(
+                state.dense_embedder,
+                state.sparse_embedder,
+                state.config.embedding.executor
+            )
+            logger.info("✓ Embedding executor ready")
+            
+            query_cache = None
+            if state.config.query_cache.enabled:
+                query_cache = QueryEmbeddingCache(state.config.query_cache)
+            
+            state.query_encoder = QueryEncoder(
+                state.embedding_executor,
+                state.config.query_batching,
+                cache=query_cache
+            )
+            logger.info("✓ Query encoder ready")
+    except Exception as e:
+        logger.error(f"Failed to initialize embedding executor: {e}")
+        raise
+    
     # try:
     #     logger.info("Initializing reranker...")
     #     if state.config.reranker:
     #         state.reranker = Reranker(state.config.reranker)
     #         logger.info("✓ Reranker loaded")
+    #         if state.config.reranker.cascade_model_name:
+    #             state.cascade_reranker = Reranker(
+    #                 state.config.reranker,
+    #                 model_name=state.config.reranker.cascade_model_name
+    #             )
+    #             logger.info("✓ Cascade reranker loaded")
     # except Exception as e:
     #     logger.error(f"Failed to load reranker: {e}")
     #     raise
@@ -112,6 +156,15 @@ async def lifespan(app: FastAPI):
     #     logger.error(f"Failed to initialize Qdrant client: {e}")
     #     raise
     
+    if state.reranker and state.config.query_batching.enabled:
+        state.rerank_batcher = MicroBatcher(
+            "rerank",
+            state.reranker.predict,
+            max_batch_size=state.config.query_batching.rerank_max_batch_size,
+            max_wait_ms=state.config.query_batching.max_wait_ms
+        )
+        logger.info("✓ Rerank batcher ready")
+    
     # try:
     #     logger.info("Initializing retriever...")
     #     if state.qdrant_client and state.reranker:
@@ -119,7 +172,10 @@ async def lifespan(app: FastAPI):
     #             qdrant_client=state.qdrant_client,
     #             reranker=state.reranker,
     #             llm_config=state.llm_config,
-    #             processor=None
+    #             processor=None,
+    #             rerank_batcher=state.rerank_batcher,
+    #             search_config=state.config.hybrid_search,
+    #             cascade_reranker=state.cascade_reranker
     #         )
     #         logger.info("✓ Retriever initialized")
     # except Exception as e:
@@ -141,13 +197,38 @@ async def lifespan(app: FastAPI):
     #         chunker=state.chunker,
     #         dense_embedder=state.dense_embedder,
     #         sparse_embedder=state.sparse_embedder,
-    #         qdrant_client=state.qdrant_client
+    #         qdrant_client=state.qdrant_client,
+    #         ingestion_config=state.config.ingestion,
+    #         embedding_executor=state.embedding_executor
     #     )
     #     logger.info("✓ Document processor loaded")
     # except Exception as e:
     #     logger.error(f"Failed to load document processor: {e}")
     #     raise
     
+    try:
+        if state.config.pdf_jobs and state.config.pdf_jobs.enabled:
+            logger.info("Starting PDF job workers...")
+            state.pdf_jobs = PdfJobManager(state.config.pdf_jobs, state.config.docling)
+            await state.pdf_jobs.start()
+            logger.info("✓ PDF job workers ready")
+    except Exception as e:
+        logger.error(f"Failed to start PDF job workers: {e}")
+        raise
+    
+    try:
+        if state.config.docling:
+            ConverterPool.configure(state.config.docling.converters_per_options)
+            if state.config.docling.warm_up:
+                # PDFs are converted in the job workers, which warm their own converters
+                formats = ("html",) if state.pdf_jobs else ("pdf", "html")
+                logger.info(f"Warming up Docling converters ({', '.join(formats)})...")
+                await asyncio.to_thread(ConverterPool.warm_up, formats)
+                logger.info("✓ Docling converters ready")
+    except Exception as e:
+        logger.error(f"Failed to warm up Docling converters: {e}")
+        raise
+    
     try:
         logger.info("Initializing SearXNG client...")
         if state.searxng_config:
@@ -159,6 +240,19 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to load SearXNG client: {e}")
         raise
     
+    try:
+        logger.info("Initializing URL fetcher...")
+        state.url_fetcher = URLFetcher(load_fetcher_config())
+        try:
+            await state.url_fetcher.start()
+        except Exception as e:
+            # Plain HTTP fetching still works; the browser is retried on first fallback
+            logger.warning(f"Playwright browser pool not warmed: {e}")
+        logger.info("✓ URL fetcher ready")
+    except Exception as e:
+        logger.error(f"Failed to load URL fetcher: {e}")
+        raise
+    
     app.state.server_state = state
     
     logger.info("="*60)
@@ -168,6 +262,17 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down server...")
+    
+    if state.pdf_jobs:
+        await state.pdf_jobs.shutdown()
+    if state.url_fetcher:
+        await state.url_fetcher.close()
+    if state.query_encoder:
+        await state.query_encoder.close()
+    if state.rerank_batcher:
+        await state.rerank_batcher.close()
+    if state.embedding_executor:
+        state.embedding_executor.shutdown(wait=False)
 
 
 app = FastAPI(
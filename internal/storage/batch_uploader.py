@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+import grpc
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PointStruct
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+
+from ..config import QdrantConfig
+
+logger = logging.getLogger(__name__)
+
+# gRPC status codes worth retrying; anything else is a real error
+_TRANSIENT_GRPC_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.ABORTED,
+}
+_TRANSIENT_HTTP_STATUSES = {429, 502, 503, 504}
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether an upsert failure is likely to succeed on retry"""
+    if isinstance(error, grpc.aio.AioRpcError):
+        return error.code() in _TRANSIENT_GRPC_CODES
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code in _TRANSIENT_HTTP_STATUSES
+    return isinstance(error, (ResponseHandlingException, ConnectionError, asyncio.TimeoutError))
+
+
+@dataclass
+class UploadStats:
+    """Throughput counters for point uploads"""
+    points: int = 0
+    batches: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+    
+    @property
+    def points_per_sec(self) -> float:
+        return self.points / self.seconds if self.seconds > 0 else 0.0
+    
+    def to_dict(self):
+        return {
+            "points": self.points,
+            "batches": self.batches,
+            "retries": self.retries,
+            "seconds": round(self.seconds, 3),
+            "points_per_sec": round(self.points_per_sec, 1),
+        }
+
+
+class BatchUploader:
+    """
+    Pipelined upserts of point batches into one collection.
+    
+    add() starts the upsert of a batch in the background and returns as
+    soon as fewer than upload_parallelism upserts are in flight, so the
+    caller builds the next batch while earlier ones are on the wire.
+    Transient failures are retried with exponential backoff.
+    
+    With upload_wait disabled, batches are sent with wait=False and the
+    most recent batch is held back: flush() sends it with wait=True only
+    after every other upsert was acknowledged. Qdrant applies updates in
+    order, so once that final upsert returns all points are searchable.
+    
+    Usage:
+        uploader = BatchUploader(client, collection_name, config)
+        for batch in batches:
+            await uploader.add(batch)
+        stats = await uploader.flush()
+    
+    Attributes:
+        collection_name: Target collection
+        config: QdrantConfig with upload settings
+        stats: UploadStats for this uploader
+    """
+    def __init__(self, client: AsyncQdrantClient, collection_name: str, config: QdrantConfig):
+        self.client = client
+        self.collection_name = collection_name
+        self.config = config
+        self.stats = UploadStats()
+        
+        self._slots = asyncio.Semaphore(config.upload_parallelism)
+        self._tasks: Set[asyncio.Task] = set()
+        self._held_back: Optional[List[PointStruct]] = None
+        self._error: Optional[BaseException] = None
+        # Set on the first add, so time spent producing the first batch is not counted
+        self._started_at: Optional[float] = None
+    
+    async def add(self, points: List[PointStruct]):
+        """
+        Queue a batch for upload, waiting only while all slots are busy
+        
+        Raises:
+            Exception: The first upload error, once any upload has failed
+        """
+        self._raise_if_failed()
+        if not points:
+            return
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+        
+        if not self.config.upload_wait:
+            points, self._held_back = self._held_back, points
+            if points is None:
+                return
+        
+        await self._slots.acquire()
+        self._raise_if_failed()
+        task = asyncio.create_task(self._upload(points, wait=self.config.upload_wait))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+    
+    async def flush(self) -> UploadStats:
+        """
+        Wait for all uploads and send the consistency barrier
+        
+        Returns:
+            UploadStats for everything uploaded by this uploader
+        
+        Raises:
+            Exception: The first upload error
+        """
+        try:
+            if self._tasks:
+                await asyncio.gather(*self._tasks)
+            self._raise_if_failed()
+            
+            if self._held_back is not None:
+                points, self._held_back = self._held_back, None
+                await self._upload(points, wait=True)
+        except BaseException:
+            self.abort()
+            raise
+        
+        if self._started_at is not None:
+            self.stats.seconds = time.perf_counter() - self._started_at
+        logger.info(
+            f"Uploaded {self.stats.points} points to {self.collection_name} in "
+            f"{self.stats.batches} batches, {self.stats.seconds:.2f}s "
+            f"({self.stats.points_per_sec:.0f} points/sec, {self.stats.retries} retries)"
+        )
+        return self.stats
+    
+    def abort(self):
+        """Cancel in-flight uploads and drop the held-back batch"""
+        for task in list(self._tasks):
+            task.cancel()
+        self._held_back = None
+    
+    def _on_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        self._slots.release()
+        if not task.cancelled() and task.exception() is not None and self._error is None:
+            self._error = task.exception()
+    
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise self._error
+    
+    async def _upload(self, points: List[PointStruct], wait: bool):
+        """Upsert one batch, retrying transient failures"""
+        attempt = 0
+        while True:
+            try:
+                await self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=points,
+                    wait=wait
+                )
+                break
+            except Exception as e:
+                if attempt >= self.config.upload_max_retries or not is_transient_error(e):
+                    logger.error(f"Failed to upload batch of {len(points)} points: {e}")
+                    raise
+                delay = self.config.upload_retry_backoff * (2 ** attempt)
+                attempt += 1
+                self.stats.retries += 1
+                logger.warning(
+                    f"Transient upload error ({e}), retry {attempt}/"
+                    f"{self.config.upload_max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+        
+        self.stats.points += len(points)
+        self.stats.batches += 1
+        logger.debug(f"Uploaded batch of {len(points)} points")
@@ -1,21 +1,33 @@
 from typing import List, Dict, Any
 import logging
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional
-import uuid
+from typing import Dict, Any, Optional, Set
 import hashlib
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     Distance, VectorParams, PointStruct, SparseVectorParams, SparseIndexParams,
-    Prefetch, Fusion, SparseVector, FusionQuery
+    Prefetch, SparseVector, FusionQuery, Filter, FieldCondition, MatchValue,
+    MatchAny, PointIdsList, PayloadSchemaType, SearchParams, QueryRequest,
+    HnswConfigDiff, VectorParamsDiff, ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    BinaryQuantization, BinaryQuantizationConfig, QuantizationSearchParams, Disabled
 )
 from qdrant_client.http.models import QueryResponse
 import numpy as np
 
-from ..config import QdrantConfig
+from ..config import QdrantConfig, CollectionProfileConfig, COLLECTION_PROFILES
+from ..embedding.vectors import SparseBatch, SparseRow
+from ..embedding.matryoshka import truncate_and_normalize
+from .batch_uploader import BatchUploader, UploadStats
+from .query_planner import HybridQueryPlan, HybridQueryPlanner, weighted_fusion
 
 logger = logging.getLogger(__name__)
 
+# Named vector holding the truncated dense vector in matryoshka collections
+DENSE_SMALL_VECTOR = "dense_small"
+
+# Payload fields indexed for filtering in multi-document collections
+INDEXED_PAYLOAD_FIELDS = ("document_id", "chunk_type", "section_path")
+
 
 @dataclass
 class ChunkMetadata:
@@ -28,6 +40,7 @@ class ChunkMetadata:
     next_chunk_id: Optional[str] = None
     prev_chunk_id: Optional[str] = None
     split_sequence: Optional[str] = None
+    content_hash: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         data = asdict(self)        
@@ -53,7 +66,57 @@ class ChunkMetadata:
             next_chunk_id=chunk.next_chunk_id,
             prev_chunk_id=chunk.prev_chunk_id,
             split_sequence=chunk.split_sequence,
+            content_hash=content_hash(chunk.content),
+        )
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of chunk content"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def point_id(document_id: str, chunk_content_hash: str, occurrence: int) -> int:
+    """
+    Deterministic Qdrant point ID for a chunk
+    
+    Derived from the document, the chunk's content hash and the chunk's
+    occurrence number among identical chunks of that document (0 for unique
+    content). Unlike a global chunk index, the occurrence number does not
+    shift when text is inserted earlier in the document, so unchanged chunks
+    keep their IDs across edits.
+    
+    Returns:
+        Unsigned 63-bit integer ID
+    """
+    key = f"{document_id}\x00{chunk_content_hash}\x00{occurrence}".encode("utf-8")
+    hash_bytes = hashlib.sha256(key).digest()
+    return int.from_bytes(hash_bytes[:8], byteorder='big') % (2**63)
+
+
+def build_payload_filter(
+    document_ids: Optional[List[str]] = None,
+    chunk_types: Optional[List[str]] = None,
+    section_paths: Optional[List[str]] = None
+) -> Optional[Filter]:
+    """
+    Build a Qdrant filter restricting search to the given payload values
+    
+    Each non-empty argument adds a match-any condition; conditions are
+    combined with AND.
+    
+    Returns:
+        Filter, or None if no argument restricts anything
+    """
+    conditions = [
+        FieldCondition(key=key, match=MatchAny(any=values))
+        for key, values in (
+            ("document_id", document_ids),
+            ("chunk_type", chunk_types),
+            ("section_path", section_paths),
         )
+        if values
+    ]
+    return Filter(must=conditions) if conditions else None
 
 class QdrantClient:
     """Low-level Qdrant operations for vector storage and retrieval"""
@@ -76,144 +139,538 @@ class QdrantClient:
         )
         logger.info(f"Connecting to Qdrant via gRPC at {host}:{config.grpc_port}")
         logger.info(f"Storage batch size: {config.storage_batch_size}")
+        logger.info(f"Upload parallelism: {config.upload_parallelism}")
+        logger.info(f"Collection profile: {config.collection_profile}")
+        self.profile = config.profile()
+        self.upload_stats = UploadStats()
+        # Truncated dense size per collection (None: no dense_small vector)
+        self._matryoshka_collections: Dict[str, Optional[int]] = {}
+        # Profile supplying rescore/oversampling per quantized collection (None: not quantized)
+        self._search_profiles: Dict[str, Optional[CollectionProfileConfig]] = {}
+        if config.matryoshka_dim:
+            logger.info(f"Matryoshka dense dimension: {config.matryoshka_dim}")
         
         
     async def initialize(self, collection_name: str):
-        """Initialize Qdrant collection if it doesn't exist"""
-        logger.info(f"Creating collection: {collection_name}")
+        """Create a Qdrant collection with the payload indexes used for filtering"""
+        profile = self.profile
+        logger.info(f"Creating collection: {collection_name} (profile: {self.config.collection_profile})")
         vectors_config = {
             "dense": VectorParams(
                 size=self.dense_embedding_dim,
-                distance=Distance.COSINE
+                distance=Distance.COSINE,
+                on_disk=profile.vectors_on_disk,
+                hnsw_config=self._hnsw_config(profile)
             )
         }
+        if self.config.matryoshka_dim:
+            # HNSW on the truncated vector; the full one is only read to
+            # rescore candidates, so it needs no graph and can live on disk
+            vectors_config[DENSE_SMALL_VECTOR] = VectorParams(
+                size=self.config.matryoshka_dim,
+                distance=Distance.COSINE,
+                on_disk=profile.vectors_on_disk,
+                hnsw_config=self._hnsw_config(profile)
+            )
+            vectors_config["dense"] = VectorParams(
+                size=self.dense_embedding_dim,
+                distance=Distance.COSINE,
+                on_disk=True,
+                hnsw_config=HnswConfigDiff(m=0)
+            )
         sparse_vectors_config = {
             "sparse": SparseVectorParams(
-                index=SparseIndexParams(on_disk=False)
+                index=SparseIndexParams(on_disk=profile.sparse_on_disk)
             )
         }
         await self.client.create_collection(
             collection_name=collection_name,
             vectors_config=vectors_config,
-            sparse_vectors_config=sparse_vectors_config
+            sparse_vectors_config=sparse_vectors_config,
+            quantization_config=self._quantization_config(profile)
         )
+        self._matryoshka_collections[collection_name] = self.config.matryoshka_dim or None
+        self._search_profiles[collection_name] = profile if profile.quantization else None
         logger.info(f"Collection created with dimension {self.dense_embedding_dim}")
+        await self.ensure_payload_indexes(collection_name)
+    
+    
+    async def migrate_collection(self, collection_name: str, profile_name: Optional[str] = None):
+        """
+        Apply a collection profile to an existing collection
+        
+        Qdrant rebuilds quantized vectors, the HNSW graph and on-disk
+        storage in the background; the collection stays searchable.
+        
+        Args:
+            collection_name: Collection to update
+            profile_name: Profile to apply; defaults to the configured one
+        """
+        profile = self.config.profile(profile_name)
+        quantization = self._quantization_config(profile) or Disabled.DISABLED
+        # In matryoshka collections the profile applies to the indexed small vector
+        indexed_vector = (
+            DENSE_SMALL_VECTOR if await self._matryoshka_dim(collection_name) else "dense"
+        )
+        await self.client.update_collection(
+            collection_name=collection_name,
+            vectors_config={
+                indexed_vector: VectorParamsDiff(
+                    on_disk=profile.vectors_on_disk,
+                    hnsw_config=self._hnsw_config(profile)
+                )
+            },
+            sparse_vectors_config={
+                "sparse": SparseVectorParams(
+                    index=SparseIndexParams(on_disk=profile.sparse_on_disk)
+                )
+            },
+            quantization_config=quantization
+        )
+        self._search_profiles[collection_name] = profile if profile.quantization else None
+        logger.info(
+            f"Migrating {collection_name} to profile {profile_name or self.config.collection_profile}"
+        )
+    
+    
+    async def _matryoshka_dim(self, collection_name: str) -> Optional[int]:
+        """
+        Size of a collection's truncated dense vector, or None (cached)
+        
+        Read from the collection itself, so collections created with a
+        different (or no) matryoshka_dim keep working after the config changes.
+        """
+        if collection_name not in self._matryoshka_collections:
+            info = await self.client.get_collection(collection_name)
+            vectors = info.config.params.vectors
+            small = vectors.get(DENSE_SMALL_VECTOR) if isinstance(vectors, dict) else None
+            self._matryoshka_collections[collection_name] = small.size if small is not None else None
+        return self._matryoshka_collections[collection_name]
+    
+    
+    async def _search_profile(self, collection_name: str) -> Optional[CollectionProfileConfig]:
+        """
+        Profile whose rescore/oversampling apply to a collection, or None (cached)
+        
+        Read from the collection's actual quantization, so collections
+        migrated to another profile are searched accordingly. The
+        configured profile is used if its quantization type matches,
+        otherwise the built-in profile with that type.
+        """
+        if collection_name not in self._search_profiles:
+            info = await self.client.get_collection(collection_name)
+            quantization = info.config.quantization_config
+            vectors = info.config.params.vectors
+            if quantization is None and isinstance(vectors, dict):
+                indexed = vectors.get(DENSE_SMALL_VECTOR) or vectors.get("dense")
+                quantization = getattr(indexed, "quantization_config", None)
+            
+            kind = None
+            if getattr(quantization, "scalar", None) is not None:
+                kind = "scalar"
+            elif getattr(quantization, "binary", None) is not None:
+                kind = "binary"
+            elif quantization is not None:
+                kind = "product"
+            
+            profile = None
+            if kind is not None:
+                if self.profile.quantization == kind:
+                    profile = self.profile
+                else:
+                    profile = next(
+                        (p for p in COLLECTION_PROFILES.values() if p.quantization == kind),
+                        CollectionProfileConfig()
+                    )
+            self._search_profiles[collection_name] = profile
+        return self._search_profiles[collection_name]
+    
+    
+    @staticmethod
+    def _hnsw_config(profile: CollectionProfileConfig) -> HnswConfigDiff:
+        return HnswConfigDiff(
+            m=profile.hnsw_m,
+            ef_construct=profile.hnsw_ef_construct,
+            on_disk=profile.hnsw_on_disk
+        )
+    
+    
+    @staticmethod
+    def _quantization_config(profile: CollectionProfileConfig):
+        """Scalar int8 or binary quantization config, or None"""
+        if profile.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=profile.quantization_always_ram
+                )
+            )
+        if profile.quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=profile.quantization_always_ram)
+            )
+        return None
+    
+    
+    async def _dense_search_params(
+        self,
+        collection_name: str,
+        hnsw_ef: Optional[int]
+    ) -> Optional[SearchParams]:
+        """Search params for the dense branch: ef and quantization rescoring"""
+        quantization = None
+        profile = await self._search_profile(collection_name)
+        if profile is not None:
+            quantization = QuantizationSearchParams(
+                rescore=profile.rescore,
+                oversampling=profile.oversampling
+            )
+        if hnsw_ef is None and quantization is None:
+            return None
+        return SearchParams(hnsw_ef=hnsw_ef, quantization=quantization)
+    
+    
+    async def ensure_collection(self, collection_name: str) -> bool:
+        """
+        Create the collection if needed and make sure its payload indexes exist
+        
+        Returns:
+            True if the collection already existed
+        """
+        if not await self.client.collection_exists(collection_name):
+            await self.initialize(collection_name)
+            return False
+        await self.ensure_payload_indexes(collection_name)
+        return True
+    
+    
+    async def ensure_payload_indexes(self, collection_name: str):
+        """Create keyword indexes on INDEXED_PAYLOAD_FIELDS that are missing"""
+        info = await self.client.get_collection(collection_name)
+        existing = set((info.payload_schema or {}).keys())
+        for field_name in INDEXED_PAYLOAD_FIELDS:
+            if field_name in existing:
+                continue
+            await self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD
+            )
+            logger.info(f"Created payload index on '{field_name}' in {collection_name}")
 
 
     async def store_chunks(
         self, 
         collection_name: str,
         chunks: List[Any],
-        dense_vectors: List[np.ndarray],
-        sparse_vectors: List[Dict[str, Any]], 
-        document_id: str
-    ):
+        dense_vectors: np.ndarray,
+        sparse_vectors: SparseBatch, 
+        document_id: str,
+        occurrences: Optional[Dict[str, int]] = None,
+        uploader: Optional[BatchUploader] = None
+    ) -> List[int]:
         """
         Store chunks with their embeddings in Qdrant
         
+        Point IDs are deterministic (see point_id), so storing the same
+        chunk again overwrites its point instead of adding a duplicate.
+        
         Args:
             chunks: List of document chunks
-            dense_vectors: List of dense embedding vectors
-            sparse_vectors: List of sparse embedding vectors
+            dense_vectors: float32 matrix, one row per chunk
+            sparse_vectors: SparseBatch, one row per chunk
             document_id: ID of the source document
+            occurrences: Running count of each content hash for this
+                document. Pass the same dict for every batch of a document
+                stored in several calls; updated in place.
+            uploader: Uploader shared across calls (see create_uploader).
+                The caller flushes it. If None, a new one is flushed before
+                returning.
+        
+        Returns:
+            IDs of the stored points
         """
         if len(chunks) != len(dense_vectors) or len(chunks) != len(sparse_vectors):
             raise ValueError("Mismatch between chunks, dense embeddings, or sparse vectors count")
         
         logger.info(f"Storing {len(chunks)} chunks to Qdrant")
         
-        points = []
-        for i, (chunk, dense, sparse) in enumerate(zip(chunks, dense_vectors, sparse_vectors)):
-            metadata = ChunkMetadata.from_chunk(chunk, document_id)
-            
-            random_uuid = uuid.uuid4()
-            hash_bytes = hashlib.sha256(random_uuid.bytes).digest()
-            numeric_id = int.from_bytes(hash_bytes[:8], byteorder='big') % (2**63)
+        if occurrences is None:
+            occurrences = {}
+        
+        owns_uploader = uploader is None
+        if owns_uploader:
+            uploader = self.create_uploader(collection_name)
+        
+        try:
+            point_ids = await self._upload_chunks(
+                uploader, chunks, dense_vectors, sparse_vectors, document_id, occurrences
+            )
+            if owns_uploader:
+                await self.flush_uploader(uploader)
+        except BaseException:
+            if owns_uploader:
+                uploader.abort()
+            raise
+        
+        return point_ids
+    
+    
+    async def _upload_chunks(
+        self,
+        uploader: BatchUploader,
+        chunks: List[Any],
+        dense_vectors: np.ndarray,
+        sparse_vectors: SparseBatch,
+        document_id: str,
+        occurrences: Dict[str, int]
+    ) -> List[int]:
+        """
+        Build points for chunks and hand them to the uploader in batches
+        
+        Vectors are converted to Python lists once per batch (a single C
+        loop per array) rather than once per point, and PointStructs are
+        built with model_construct: the values come straight from the
+        embedders, so per-float pydantic validation is skipped.
+        """
+        batch_size = self.config.storage_batch_size
+        point_ids = []
+        small_dim = await self._matryoshka_dim(uploader.collection_name)
+        
+        for start in range(0, len(chunks), batch_size):
+            end = start + batch_size
+            dense_rows = np.asarray(dense_vectors[start:end], dtype=np.float32).tolist()
+            small_rows = (
+                truncate_and_normalize(dense_vectors[start:end], small_dim).tolist()
+                if small_dim else None
+            )
+            sparse_batch = sparse_vectors[start:end]
+            indptr = sparse_batch.indptr.tolist()
+            indices = sparse_batch.indices.tolist()
+            values = sparse_batch.values.tolist()
             
-            point = PointStruct(
-                id=numeric_id,
-                vector={
-                    "dense": dense.tolist(),
-                    "sparse": SparseVector(
-                        indices=sparse["indices"],
-                        values=sparse["values"]
+            points = []
+            for j, chunk in enumerate(chunks[start:end]):
+                metadata = ChunkMetadata.from_chunk(chunk, document_id)
+                
+                occurrence = occurrences.get(metadata.content_hash, 0)
+                occurrences[metadata.content_hash] = occurrence + 1
+                numeric_id = point_id(document_id, metadata.content_hash, occurrence)
+                point_ids.append(numeric_id)
+                
+                lo, hi = indptr[j], indptr[j + 1]
+                vector = {
+                    "dense": dense_rows[j],
+                    "sparse": SparseVector.model_construct(
+                        indices=indices[lo:hi],
+                        values=values[lo:hi]
                     )
-                },
-                payload={
-                    **metadata.to_dict(),
-                    "content": chunk.content
                 }
-            )
-            points.append(point)
+                if small_rows is not None:
+                    vector[DENSE_SMALL_VECTOR] = small_rows[j]
+                points.append(PointStruct.model_construct(
+                    id=numeric_id,
+                    vector=vector,
+                    payload={
+                        **metadata.to_dict(),
+                        "content": chunk.content
+                    }
+                ))
             
-            if len(points) >= self.config.storage_batch_size:
-                await self._upload_batch(collection_name, points)
-                points = []
+            await uploader.add(points)
         
-        if points:
-            await self._upload_batch(collection_name, points)
+        return point_ids
     
     
-    async def _upload_batch(self, collection_name: str, points: List[PointStruct]):
-        """Upload a batch of points to Qdrant"""
-        try:
-            await self.client.upsert(
+    def create_uploader(self, collection_name: str) -> BatchUploader:
+        """Create a BatchUploader for a collection using this client's config"""
+        return BatchUploader(self.client, collection_name, self.config)
+    
+    
+    async def flush_uploader(self, uploader: BatchUploader) -> UploadStats:
+        """Flush an uploader and add its counters to upload_stats"""
+        stats = await uploader.flush()
+        self.upload_stats.points += stats.points
+        self.upload_stats.batches += stats.batches
+        self.upload_stats.retries += stats.retries
+        self.upload_stats.seconds += stats.seconds
+        return stats
+    
+    
+    async def delete_stale_points(
+        self,
+        collection_name: str,
+        document_id: str,
+        keep_ids: Set[int]
+    ) -> int:
+        """
+        Delete a document's points that are not in keep_ids
+        
+        Used after re-ingesting a document: points of chunks that no longer
+        exist are removed, everything else is left in place.
+        
+        Args:
+            collection_name: Collection holding the document
+            document_id: ID of the document
+            keep_ids: Point IDs written by the latest ingest
+        
+        Returns:
+            Number of points deleted
+        """
+        document_filter = Filter(
+            must=[FieldCondition(key="document_id", match=MatchValue(value=document_id))]
+        )
+        
+        stale_ids = []
+        offset = None
+        while True:
+            records, offset = await self.client.scroll(
                 collection_name=collection_name,
-                points=points
+                scroll_filter=document_filter,
+                limit=self.config.storage_batch_size,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False
             )
-            logger.debug(f"Uploaded batch of {len(points)} points")
-        except Exception as e:
-            logger.error(f"Failed to upload batch: {e}")
-            raise
+            stale_ids.extend(record.id for record in records if record.id not in keep_ids)
+            if offset is None:
+                break
+        
+        for start in range(0, len(stale_ids), self.config.storage_batch_size):
+            await self.client.delete(
+                collection_name=collection_name,
+                points_selector=PointIdsList(
+                    points=stale_ids[start:start + self.config.storage_batch_size]
+                )
+            )
+        
+        logger.info(f"Deleted {len(stale_ids)} stale points for document {document_id}")
+        return len(stale_ids)
     
     
     async def query_points(
         self,
         collection_name: str,
         query_dense_embedding: np.ndarray, 
-        query_sparse_embedding: Dict[str, Any],
+        query_sparse_embedding: SparseRow,
         limit: int = 10,
+        query_filter: Optional[Filter] = None,
+        plan: Optional[HybridQueryPlan] = None,
     ) -> QueryResponse:
         """
-        Perform hybrid search using dense and sparse vectors with RRF fusion
+        Perform hybrid search using dense and sparse vectors
+        
+        RRF and DBSF are fused server-side from two prefetches. Weighted
+        fusion runs both branches as one batch request and combines
+        normalized scores client-side.
         
         Args:
             query_dense_embedding: Dense embedding vector for the query
             query_sparse_embedding: Sparse embedding for the query
-            limit: Maximum number of results to return
+            limit: Maximum number of results to return (ignored if plan is given)
+            query_filter: Optional payload filter (see build_payload_filter),
+                applied to both prefetches so fusion only sees matching points
+            plan: Prefetch depth, fusion and ef (see HybridQueryPlanner).
+                If None, the default plan for limit is used.
             
         Returns:
             QueryResponse from Qdrant containing search results
         """
+        if plan is None:
+            plan = HybridQueryPlanner().plan(limit)
+        
         try:
-            sparse_indices = query_sparse_embedding.get("indices", [])
-            sparse_values = query_sparse_embedding.get("values", [])
-            candidate_pool_limit = 10
+            dense_query = query_dense_embedding.tolist()
+            sparse_query = SparseVector(
+                indices=query_sparse_embedding.indices.tolist(),
+                values=query_sparse_embedding.values.tolist()
+            )
+            dense_params = await self._dense_search_params(collection_name, plan.hnsw_ef)
+            
+            # Matryoshka collections search the truncated vector first and
+            # rescore its candidates on the full one
+            dense_first_pass = None
+            small_dim = await self._matryoshka_dim(collection_name)
+            if small_dim:
+                dense_first_pass = Prefetch(
+                    query=truncate_and_normalize(query_dense_embedding, small_dim).tolist(),
+                    using=DENSE_SMALL_VECTOR,
+                    filter=query_filter,
+                    params=dense_params,
+                    limit=plan.first_pass_limit
+                )
+                dense_params = None
+            
+            if plan.server_fusion is None:
+                return await self._weighted_query(
+                    collection_name, dense_query, sparse_query, dense_params,
+                    dense_first_pass, query_filter, plan
+                )
             
-            # Perform hybrid search with RRF
             results = await self.client.query_points(
                 collection_name=collection_name,
                 prefetch=[
                     Prefetch(
-                        query=query_dense_embedding.tolist(),
+                        prefetch=dense_first_pass,
+                        query=dense_query,
                         using="dense",
-                        limit=candidate_pool_limit
+                        filter=query_filter,
+                        params=dense_params,
+                        limit=plan.prefetch_limit
                     ),
                     Prefetch(
-                        query=SparseVector(
-                            indices=sparse_indices,
-                            values=sparse_values
-                        ),
+                        query=sparse_query,
                         using="sparse",
-                        limit=candidate_pool_limit
+                        filter=query_filter,
+                        limit=plan.prefetch_limit
                     ),
                 ],
-                query=FusionQuery(fusion=Fusion.RRF),
-                limit=limit
+                query=FusionQuery(fusion=plan.server_fusion),
+                query_filter=query_filter,
+                limit=plan.limit
             )
             
             return results
-    
+        
         except Exception as e:
             logger.error(f"Hybrid search failed: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    
+    async def _weighted_query(
+        self,
+        collection_name: str,
+        dense_query: List[float],
+        sparse_query: SparseVector,
+        dense_params: Optional[SearchParams],
+        dense_first_pass: Optional[Prefetch],
+        query_filter: Optional[Filter],
+        plan: HybridQueryPlan
+    ) -> QueryResponse:
+        """Run both branches in one batch request and fuse by weighted score"""
+        dense_response, sparse_response = await self.client.query_batch_points(
+            collection_name=collection_name,
+            requests=[
+                QueryRequest(
+                    prefetch=dense_first_pass,
+                    query=dense_query,
+                    using="dense",
+                    filter=query_filter,
+                    params=dense_params,
+                    limit=plan.prefetch_limit,
+                    with_payload=True
+                ),
+                QueryRequest(
+                    query=sparse_query,
+                    using="sparse",
+                    filter=query_filter,
+                    limit=plan.prefetch_limit,
+                    with_payload=True
+                ),
+            ]
+        )
+        points = weighted_fusion(
+            dense_response.points, sparse_response.points, plan.dense_weight, plan.limit
+        )
+        return QueryResponse(points=points)
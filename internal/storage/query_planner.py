@@ -0,0 +1,149 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from qdrant_client.models import Fusion, ScoredPoint
+
+from ..config import HybridSearchConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HybridQueryPlan:
+    """
+    Parameters of one hybrid query
+    
+    Attributes:
+        limit: Fused results returned by Qdrant
+        prefetch_limit: Candidates fetched per branch (dense and sparse)
+        fusion: rrf | dbsf | weighted
+        hnsw_ef: ef for the dense HNSW search, None for the collection
+            default. The sparse branch uses an inverted index and has no ef.
+        dense_weight: Dense share of the score in weighted fusion
+        first_pass_limit: Candidates fetched on the truncated vector before
+            full-vector rescoring, for collections with a matryoshka layout
+    """
+    limit: int
+    prefetch_limit: int
+    fusion: str = "rrf"
+    hnsw_ef: Optional[int] = None
+    dense_weight: float = 0.5
+    first_pass_limit: Optional[int] = None
+    
+    @property
+    def server_fusion(self) -> Optional[Fusion]:
+        """Qdrant fusion for rrf/dbsf; None when fusion happens client-side"""
+        return {"rrf": Fusion.RRF, "dbsf": Fusion.DBSF}.get(self.fusion)
+
+
+class HybridQueryPlanner:
+    """
+    Choose prefetch depth, fusion and HNSW ef for hybrid queries
+    
+    Each branch is prefetched deeper than the number of fused results so
+    fusion has overlapping candidates to work with. The fused limit is the
+    requested limit, or the reranker's candidate budget if that is larger,
+    since the reranker needs those candidates before cutting to limit:
+        
+        prefetch_limit = clamp(fused_limit * prefetch_multiplier,
+                               min_prefetch, max_prefetch)
+    
+    A configured hnsw_ef is raised to at least prefetch_limit, because HNSW
+    cannot return more good neighbours than its candidate list holds. With
+    a matryoshka layout the dense branch first fetches prefetch_limit x
+    matryoshka_oversampling candidates on the truncated vector.
+    Any value can be overridden per request.
+    
+    Attributes:
+        config: HybridSearchConfig with the defaults
+    """
+    def __init__(self, config: Optional[HybridSearchConfig] = None):
+        self.config = config or HybridSearchConfig()
+    
+    def plan(
+        self,
+        limit: int,
+        rerank_budget: Optional[int] = None,
+        prefetch_limit: Optional[int] = None,
+        fusion: Optional[str] = None,
+        hnsw_ef: Optional[int] = None,
+        dense_weight: Optional[float] = None
+    ) -> HybridQueryPlan:
+        """
+        Build a plan for a query
+        
+        Args:
+            limit: Results the caller wants
+            rerank_budget: Candidates the reranker will score, if reranking
+            prefetch_limit: Override for the per-branch depth, capped at
+                max_prefetch
+            fusion: Override for the fusion method
+            hnsw_ef: Override for the dense ef
+            dense_weight: Override for the weighted-fusion dense weight
+        
+        Returns:
+            HybridQueryPlan
+        """
+        config = self.config
+        fused_limit = max(limit, rerank_budget or 0)
+        
+        if prefetch_limit is None:
+            prefetch_limit = math.ceil(fused_limit * config.prefetch_multiplier)
+            prefetch_limit = min(max(prefetch_limit, config.min_prefetch), config.max_prefetch)
+        else:
+            # Per-request overrides must not exceed the configured ceiling either
+            prefetch_limit = min(prefetch_limit, config.max_prefetch)
+        prefetch_limit = max(prefetch_limit, fused_limit)
+        
+        if hnsw_ef is None and config.hnsw_ef is not None:
+            hnsw_ef = max(config.hnsw_ef, prefetch_limit)
+        
+        fusion = fusion or config.fusion
+        if fusion not in ("rrf", "dbsf", "weighted"):
+            raise ValueError(f"Unknown fusion method: {fusion}")
+        
+        plan = HybridQueryPlan(
+            limit=fused_limit,
+            prefetch_limit=prefetch_limit,
+            fusion=fusion,
+            hnsw_ef=hnsw_ef,
+            dense_weight=config.dense_weight if dense_weight is None else dense_weight,
+            first_pass_limit=math.ceil(prefetch_limit * config.matryoshka_oversampling)
+        )
+        logger.debug(f"Hybrid query plan: {plan}")
+        return plan
+
+
+def weighted_fusion(
+    dense_points: List[ScoredPoint],
+    sparse_points: List[ScoredPoint],
+    dense_weight: float,
+    limit: int
+) -> List[ScoredPoint]:
+    """
+    Fuse two ranked lists by weighted min-max normalized scores
+    
+    Scores are normalized per branch to [0, 1] so cosine similarities and
+    SPLADE dot products are comparable; a point missing from one branch
+    contributes 0 for it.
+    
+    Returns:
+        Top limit points, with score set to the fused score
+    """
+    fused: Dict = {}
+    points: Dict = {}
+    for branch, weight in ((dense_points, dense_weight), (sparse_points, 1.0 - dense_weight)):
+        if not branch:
+            continue
+        scores = [point.score for point in branch]
+        low, high = min(scores), max(scores)
+        span = high - low
+        for point in branch:
+            normalized = (point.score - low) / span if span > 0 else 1.0
+            fused[point.id] = fused.get(point.id, 0.0) + weight * normalized
+            points.setdefault(point.id, point)
+    
+    ranked = sorted(fused, key=fused.get, reverse=True)[:limit]
+    return [points[point_id].model_copy(update={"score": fused[point_id]}) for point_id in ranked]
@@ -1,8 +1,11 @@
 """
 Token counting utilities for various embedding and language models
 """
-from typing import Optional, List, Union
+from collections import OrderedDict
+from typing import Optional, List, Union, Tuple, Dict, Any
+import hashlib
 import logging
+import threading
 from transformers import AutoTokenizer
 
 logger = logging.getLogger(__name__)
@@ -13,10 +16,24 @@ class TokenCounter:
     
     Supports class method for counting tokens:
     - Class method: TokenCounter.count_tokens(text, model_name, tokenizer)
+    
+    Token counts are memoized in a bounded LRU cache keyed by
+    (model_name, text hash), shared by the chunkers, the overlap handler
+    and the embedders, so each distinct string is tokenized once.
     """
     
     _tokenizer_cache = {}
     
+    # Content-addressed token count cache: (model_name, blake2b digest) -> count
+    _count_cache: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+    _count_cache_max_size = 50000
+    _count_cache_lock = threading.Lock()
+    _cache_hits = 0
+    _cache_misses = 0
+    
+    # Per (model_name, separator) token correction for concatenated counts
+    _separator_corrections: Dict[Tuple[str, str], int] = {}
+    
     def __init__(self, model_name: str):
         """
         Initialize token counter for a specific model (for chunker usage).
@@ -81,16 +98,27 @@ class TokenCounter:
             else:
                 return [len(t) // 4 for t in text]
         
-        # Count tokens
+        # Count tokens (cache first, one batched call for the misses)
         try:
             if isinstance(text, str):
-                tokens = tokenizer.encode(text, add_special_tokens=True)
-                return len(tokens)
+                key = cls._cache_key(model_name, text)
+                count = cls._cache_get(key)
+                if count is None:
+                    count = len(tokenizer.encode(text, add_special_tokens=True, verbose=False))
+                    cls._cache_put(key, count)
+                return count
             else:
-                counts = []
-                for t in text:
-                    tokens = tokenizer.encode(t, add_special_tokens=True)
-                    counts.append(len(tokens))
+                if not text:
+                    return []
+                keys = [cls._cache_key(model_name, t) for t in text]
+                counts = [cls._cache_get(key) for key in keys]
+                missing = [i for i, count in enumerate(counts) if count is None]
+                if missing:
+                    encoding = cls._batch_encode([text[i] for i in missing], tokenizer)
+                    num_special = tokenizer.num_special_tokens_to_add(pair=False)
+                    for i, ids in zip(missing, encoding["input_ids"]):
+                        counts[i] = len(ids) + num_special
+                        cls._cache_put(keys[i], counts[i])
                 return counts
         except Exception as e:
             logger.warning(f"Token counting failed: {e}, using rough estimate")
@@ -99,6 +127,206 @@ class TokenCounter:
             else:
                 return [len(t) // 4 for t in text]
     
+    @classmethod
+    def count_concatenated(
+        cls,
+        parts: List[str],
+        separator: str,
+        model_name: str,
+        tokenizer: Optional[AutoTokenizer] = None
+    ) -> int:
+        """
+        Count tokens of separator.join(parts) from the cached part counts
+        
+        The joined count is derived as the sum of the parts' content tokens,
+        plus the model's special tokens, plus a per-separator correction
+        measured once on a probe string. The derived count is an estimate
+        (tokens can merge across a boundary), so it is not cached: the count
+        cache only holds counts of real encodes, which truncation trusts.
+        
+        Args:
+            parts: Texts that will be joined
+            separator: Separator placed between parts
+            model_name: HuggingFace model name
+            tokenizer: Optional pre-loaded tokenizer
+            
+        Returns:
+            Token count of the joined text
+        """
+        if tokenizer is None:
+            tokenizer = cls.get_tokenizer(model_name)
+        
+        joined = separator.join(parts)
+        if tokenizer is None or len(parts) <= 1:
+            return cls.count_tokens(joined, model_name, tokenizer)
+        
+        # An exact count exists if the joined text itself was encoded before
+        cached = cls._cache_get(cls._cache_key(model_name, joined), count_miss=False)
+        if cached is not None:
+            return cached
+        
+        try:
+            num_special = tokenizer.num_special_tokens_to_add(pair=False)
+            part_counts = cls.count_tokens(parts, model_name, tokenizer)
+            correction = cls._separator_correction(separator, model_name, tokenizer)
+            count = (
+                sum(c - num_special for c in part_counts)
+                + (len(parts) - 1) * correction
+                + num_special
+            )
+        except Exception as e:
+            logger.warning(f"Derived token count failed: {e}, counting joined text")
+            return cls.count_tokens(joined, model_name, tokenizer)
+        
+        return count
+    
+    @classmethod
+    def _separator_correction(
+        cls,
+        separator: str,
+        model_name: str,
+        tokenizer: AutoTokenizer
+    ) -> int:
+        """
+        Tokens added by joining two texts with separator
+        
+        Measured on "x{separator}x" against two standalone "x"s, which covers
+        both separators that tokenize to nothing (whitespace in WordPiece)
+        and ones that merge with their neighbour (byte-level BPE).
+        """
+        key = (model_name, separator)
+        if key not in cls._separator_corrections:
+            probe = tokenizer.encode(f"x{separator}x", add_special_tokens=False)
+            single = tokenizer.encode("x", add_special_tokens=False)
+            cls._separator_corrections[key] = len(probe) - 2 * len(single)
+        return cls._separator_corrections[key]
+    
+    @staticmethod
+    def _cache_key(model_name: str, text: str) -> Tuple[str, bytes]:
+        """Content-addressed cache key for a text under a model's tokenizer"""
+        return (model_name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+    
+    @classmethod
+    def _cache_get(cls, key: Tuple[str, bytes], count_miss: bool = True) -> Optional[int]:
+        """
+        Look up a cached token count and refresh its LRU position
+        
+        count_miss=False is for opportunistic probes whose miss is not
+        followed by an encode, so it would skew the hit rate.
+        """
+        with cls._count_cache_lock:
+            count = cls._count_cache.get(key)
+            if count is None:
+                if count_miss:
+                    cls._cache_misses += 1
+                return None
+            cls._count_cache.move_to_end(key)
+            cls._cache_hits += 1
+            return count
+    
+    @classmethod
+    def _cache_put(cls, key: Tuple[str, bytes], count: int):
+        """Store a token count, evicting the least recently used entries"""
+        with cls._count_cache_lock:
+            cls._count_cache[key] = count
+            cls._count_cache.move_to_end(key)
+            while len(cls._count_cache) > cls._count_cache_max_size:
+                cls._count_cache.popitem(last=False)
+    
+    @classmethod
+    def configure_cache(cls, max_size: int):
+        """
+        Set the maximum number of cached token counts
+        
+        Args:
+            max_size: Maximum cache entries (must be positive)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        with cls._count_cache_lock:
+            cls._count_cache_max_size = max_size
+            while len(cls._count_cache) > max_size:
+                cls._count_cache.popitem(last=False)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached token counts and reset statistics"""
+        with cls._count_cache_lock:
+            cls._count_cache.clear()
+            cls._cache_hits = 0
+            cls._cache_misses = 0
+    
+    @classmethod
+    def cache_stats(cls) -> Dict[str, Any]:
+        """
+        Get token count cache statistics
+        
+        Returns:
+            Dict with size, max_size, hits, misses and hit_rate
+        """
+        with cls._count_cache_lock:
+            lookups = cls._cache_hits + cls._cache_misses
+            return {
+                "size": len(cls._count_cache),
+                "max_size": cls._count_cache_max_size,
+                "hits": cls._cache_hits,
+                "misses": cls._cache_misses,
+                "hit_rate": cls._cache_hits / lookups if lookups else 0.0,
+            }
+    
+    @staticmethod
+    def _batch_encode(
+        texts: List[str],
+        tokenizer: AutoTokenizer,
+        return_offsets: bool = False
+    ):
+        """
+        Encode a list of texts in a single tokenizer call
+        
+        Special tokens are not added so offsets map 1:1 onto the original
+        strings; callers add num_special_tokens_to_add() to get model counts.
+        
+        Args:
+            texts: Texts to encode
+            tokenizer: Pre-loaded tokenizer
+            return_offsets: Whether to return character offset mappings
+                (fast tokenizers only)
+            
+        Returns:
+            BatchEncoding with input_ids (and offset_mapping if requested)
+        """
+        return tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            return_offsets_mapping=return_offsets,
+            verbose=False
+        )
+    
+    @staticmethod
+    def _cut_at_token_boundary(
+        text: str,
+        offsets: List[Tuple[int, int]],
+        max_content_tokens: int
+    ) -> str:
+        """
+        Cut text after the last token that fits, using tokenizer offsets
+        
+        Args:
+            text: Original text
+            offsets: (start, end) character offsets per token, no special tokens
+            max_content_tokens: Number of non-special tokens to keep
+            
+        Returns:
+            Prefix of the original text ending on a token boundary
+        """
+        if len(offsets) <= max_content_tokens:
+            return text
+        if max_content_tokens <= 0:
+            return ""
+        return text[:offsets[max_content_tokens - 1][1]]
+    
     @classmethod
     def truncate_text(
         cls,
@@ -130,18 +358,25 @@ class TokenCounter:
             return text[:max_chars] if len(text) > max_chars else text
         
         try:
-            # Encode and truncate
-            tokens = tokenizer.encode(
-                text,
-                add_special_tokens=True,
-                truncation=True,
-                max_length=max_tokens
-            )
-            
-            # Decode back to text
-            truncated = tokenizer.decode(tokens, skip_special_tokens=True)
+            if getattr(tokenizer, "is_fast", False):
+                # Cut the original string at a token boundary (no decode round-trip)
+                encoding = cls._batch_encode([text], tokenizer, return_offsets=True)
+                num_special = tokenizer.num_special_tokens_to_add(pair=False)
+                truncated = cls._cut_at_token_boundary(
+                    text,
+                    encoding["offset_mapping"][0],
+                    max_tokens - num_special
+                )
+            else:
+                tokens = tokenizer.encode(
+                    text,
+                    add_special_tokens=True,
+                    truncation=True,
+                    max_length=max_tokens
+                )
+                truncated = tokenizer.decode(tokens, skip_special_tokens=True)
             
-            if len(tokens) < len(tokenizer.encode(text, add_special_tokens=True)):
+            if len(truncated) < len(text):
                 logger.debug(f"Text truncated from {len(text)} to {len(truncated)} characters")
             
             return truncated
@@ -151,6 +386,79 @@ class TokenCounter:
             max_chars = max_tokens * 4
             return text[:max_chars] if len(text) > max_chars else text
     
+    @classmethod
+    def truncate_batch_with_counts(
+        cls,
+        texts: List[str],
+        max_tokens: int,
+        model_name: str,
+        tokenizer: Optional[AutoTokenizer] = None
+    ) -> Tuple[List[str], List[int], int]:
+        """
+        Count and truncate a batch of texts with a single tokenizer pass
+        
+        With a fast tokenizer, the whole batch is encoded once with offset
+        mappings; over-limit texts are cut on the original string at the last
+        token boundary that fits. Texts whose cached count is already within
+        the limit are not re-encoded. Slow tokenizers fall back to per-text
+        truncation.
+        
+        Args:
+            texts: List of texts to validate
+            max_tokens: Maximum tokens per text (including special tokens)
+            model_name: HuggingFace model name
+            tokenizer: Optional pre-loaded tokenizer
+            
+        Returns:
+            Tuple of (texts, token_counts, truncated_count) where token_counts
+            are the counts of the returned (possibly truncated) texts
+        """
+        if not texts:
+            return [], [], 0
+        
+        if tokenizer is None:
+            tokenizer = cls.get_tokenizer(model_name)
+        
+        if tokenizer is not None and getattr(tokenizer, "is_fast", False):
+            try:
+                num_special = tokenizer.num_special_tokens_to_add(pair=False)
+                max_content_tokens = max_tokens - num_special
+                
+                # Texts with a cached count within the limit need no encoding
+                keys = [cls._cache_key(model_name, text) for text in texts]
+                counts = [cls._cache_get(key) for key in keys]
+                pending = [i for i, count in enumerate(counts) if count is None or count > max_tokens]
+                
+                result = list(texts)
+                truncated_count = 0
+                if pending:
+                    encoding = cls._batch_encode(
+                        [texts[i] for i in pending], tokenizer, return_offsets=True
+                    )
+                    for i, offsets in zip(pending, encoding["offset_mapping"]):
+                        cls._cache_put(keys[i], len(offsets) + num_special)
+                        if len(offsets) > max_content_tokens:
+                            result[i] = cls._cut_at_token_boundary(texts[i], offsets, max_content_tokens)
+                            counts[i] = max_tokens
+                            truncated_count += 1
+                        else:
+                            counts[i] = len(offsets) + num_special
+                return result, counts, truncated_count
+            except Exception as e:
+                logger.warning(f"Batched truncation failed: {e}, truncating per text")
+        
+        token_counts = cls.count_tokens(texts, model_name, tokenizer)
+        result, counts, truncated_count = [], [], 0
+        for text, count in zip(texts, token_counts):
+            if count > max_tokens:
+                result.append(cls.truncate_text(text, max_tokens, model_name, tokenizer))
+                counts.append(max_tokens)
+                truncated_count += 1
+            else:
+                result.append(text)
+                counts.append(count)
+        return result, counts, truncated_count
+    
     @classmethod
     def validate_and_truncate_batch(
         cls,
@@ -176,31 +484,15 @@ class TokenCounter:
         if not texts:
             return texts
         
-        # Get tokenizer
-        if tokenizer is None:
-            tokenizer = cls.get_tokenizer(model_name)
+        result, _, truncated_count = cls.truncate_batch_with_counts(
+            texts, max_tokens, model_name, tokenizer
+        )
         
-        # Count tokens for all texts
-        token_counts = cls.count_tokens(texts, model_name, tokenizer)
-        
-        # Check which texts need truncation
-        needs_truncation = [count > max_tokens for count in token_counts]
-        
-        if any(needs_truncation) and warn_on_truncation:
-            truncated_count = sum(needs_truncation)
+        if truncated_count and warn_on_truncation:
             logger.warning(
-                f"{truncated_count}/{len(texts)} texts exceed {max_tokens} tokens and will be truncated"
+                f"{truncated_count}/{len(texts)} texts exceed {max_tokens} tokens and were truncated"
             )
         
-        # Truncate texts that exceed limit
-        result = []
-        for i, text in enumerate(texts):
-            if needs_truncation[i]:
-                truncated = cls.truncate_text(text, max_tokens, model_name, tokenizer)
-                result.append(truncated)
-            else:
-                result.append(text)
-        
         return result
     
     @classmethod
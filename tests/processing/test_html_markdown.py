@@ -0,0 +1,46 @@
+from internal.processing.html_markdown import simple_html_to_markdown
+
+BODY = "<p>" + "Retrieval augmented generation grounds answers in documents. " * 5 + "</p>"
+
+
+def convert(html):
+    return simple_html_to_markdown(html, min_chars=0)
+
+
+def test_keeps_article_header_title():
+    html = f"<header><nav>Home</nav></header><article><header><h1>Title</h1></header>{BODY}</article>"
+    markdown = convert(html)
+    assert markdown.startswith("# Title\n\n")
+    assert "Home" not in markdown
+
+
+def test_skips_page_header_and_footer():
+    html = f"<header><p>Site banner</p></header>{BODY}<footer><p>Copyright</p></footer>"
+    markdown = convert(html)
+    assert "Site banner" not in markdown
+    assert "Copyright" not in markdown
+
+
+def test_list_items_wrapped_in_paragraphs():
+    html = f"{BODY}<ul><li><p>first</p></li><li><p>second</p></li></ul><ol><li><p>one</p></li></ol>"
+    markdown = convert(html)
+    assert "- first\n- second" in markdown
+    assert "1. one" in markdown
+
+
+def test_empty_list_item_does_not_prefix_next_paragraph():
+    html = f"<ul><li></li></ul>{BODY}"
+    assert convert(html).startswith("Retrieval")
+
+
+def test_emphasis_and_links():
+    html = f'{BODY}<p>See <a href="https://example.com">the <b>docs</b></a> and <code>x = 1</code>.</p>'
+    assert "See [the **docs**](https://example.com) and `x = 1`." in convert(html)
+
+
+def test_unsupported_content_falls_back():
+    assert convert(f"{BODY}<table><tr><td>1</td></tr></table>") is None
+
+
+def test_short_page_falls_back():
+    assert simple_html_to_markdown("<p>Too short</p>") is None